@@ -1,18 +1,52 @@
 """
 Utilities for agriculture and gardening weather forecasts and tools
 """
-import os
-import json
-import random
 import logging
-import datetime
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, date
+from typing import Dict, List, Any, Tuple, TypedDict
+from bisect import bisect_right
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from collections import Counter, defaultdict
+from types import MappingProxyType
+
+import numpy as np
 
 from backend import weather_utils
+from backend.cache_utils import ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only defaults for .get() lookups, so a missing key doesn't allocate
+_EMPTY = MappingProxyType({})
+_EMPTY_WEATHER = (_EMPTY,)
+
+# How long upstream weather responses are reused (seconds)
+WEATHER_CACHE_TTL = 600
+
+def _is_live(data: Dict[str, Any]) -> bool:
+    """Whether weather data came from the API, so it may be cached"""
+    return not weather_utils.is_simulated(data)
+
+@ttl_cache(WEATHER_CACHE_TTL, cache_if=_is_live)
+def _cached_forecast(city: str) -> Dict[str, Any]:
+    """Get the weather forecast for a city, reusing recent responses; simulated fallbacks are not reused"""
+    return weather_utils.get_weather_forecast(city)
+
+@ttl_cache(WEATHER_CACHE_TTL, cache_if=_is_live)
+def _cached_weather(city: str) -> Dict[str, Any]:
+    """Get the current weather for a city, reusing recent responses; simulated fallbacks are not reused"""
+    return weather_utils.get_city_weather(city)
+
+@ttl_cache(WEATHER_CACHE_TTL, cache_if=_is_live)
+def _cached_history(city: str) -> Dict[str, Any]:
+    """Get the historical weather for a city, reusing recent responses; simulated fallbacks are not reused"""
+    return weather_utils.get_weather_history(city)
+
+# Ordinal of 1970-01-01, used to turn day indexes back into dates
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 # Evapotranspiration thresholds
 ET_THRESHOLDS = {
     "very_low": 2.0,      # mm/day - Very low evapotranspiration
@@ -22,34 +56,100 @@ ET_THRESHOLDS = {
     "very_high": 9.0      # mm/day - Very high evapotranspiration
 }
 
-# Soil type moisture characteristics
-SOIL_TYPES = {
+# Per-soil adjustments used by the ET, moisture and watering helpers; unknown soils use loamy
+_SOIL_PROFILE = {
     "sandy": {
-        "water_holding_capacity": 0.5,  # inches per foot
-        "infiltration_rate": 2.0,       # inches per hour
-        "drainage_rate": "fast",
-        "description": "Sandy soils drain quickly and have low water retention"
-    },
-    "loamy": {
-        "water_holding_capacity": 1.5,  # inches per foot
-        "infiltration_rate": 0.5,       # inches per hour
-        "drainage_rate": "moderate",
-        "description": "Loamy soils have balanced water retention and drainage"
+        "et_factor": 1.2,        # Sandy soils dry faster
+        "moisture_factor": 0.8,  # Sandy soil holds less water
+        "watering_time_tip": "Sandy soil benefits from evening watering to retain moisture longer",
+        "watering_frequency": "More frequent, lighter waterings are better for sandy soil"
     },
     "clay": {
-        "water_holding_capacity": 2.5,  # inches per foot
-        "infiltration_rate": 0.1,       # inches per hour
-        "drainage_rate": "slow",
-        "description": "Clay soils retain water longer but have poor drainage"
+        "et_factor": 0.8,
+        "moisture_factor": 1.2,  # Clay soil holds more water
+        "watering_time_tip": "Clay soil benefits from morning watering to prevent waterlogging overnight",
+        "watering_frequency": "Less frequent, deeper waterings are better for clay soil"
     },
-    "silty": {
-        "water_holding_capacity": 2.0,  # inches per foot
-        "infiltration_rate": 0.3,       # inches per hour
-        "drainage_rate": "moderate-slow",
-        "description": "Silty soils hold more water than sandy soils but drain faster than clay"
+    "loamy": {
+        "et_factor": 1.0,
+        "moisture_factor": 1.0,
+        "watering_time_tip": None,
+        "watering_frequency": "Balanced watering approach works well for loamy soil"
     }
 }
 
+# Rating boundaries for get_et_rating; values at or above the last edge are very_high
+_ET_LABELS = tuple(ET_THRESHOLDS)
+_ET_EDGES = tuple(ET_THRESHOLDS.values())[:-1]
+
+@dataclass(frozen=True, slots=True)
+class SoilProperties:
+    """Moisture characteristics of a soil type"""
+    water_holding_capacity: float  # inches per foot
+    infiltration_rate: float       # inches per hour
+    drainage_rate: str
+    description: str
+
+# Soil type moisture characteristics
+SOIL_TYPES = {
+    "sandy": SoilProperties(
+        water_holding_capacity=0.5,
+        infiltration_rate=2.0,
+        drainage_rate="fast",
+        description="Sandy soils drain quickly and have low water retention"
+    ),
+    "loamy": SoilProperties(
+        water_holding_capacity=1.5,
+        infiltration_rate=0.5,
+        drainage_rate="moderate",
+        description="Loamy soils have balanced water retention and drainage"
+    ),
+    "clay": SoilProperties(
+        water_holding_capacity=2.5,
+        infiltration_rate=0.1,
+        drainage_rate="slow",
+        description="Clay soils retain water longer but have poor drainage"
+    ),
+    "silty": SoilProperties(
+        water_holding_capacity=2.0,
+        infiltration_rate=0.3,
+        drainage_rate="moderate-slow",
+        description="Silty soils hold more water than sandy soils but drain faster than clay"
+    )
+}
+
+@dataclass(slots=True)
+class DayBlock:
+    """Forecast periods of one day, with the fields used by the panels pulled into arrays"""
+    periods: List[Dict[str, Any]]
+    dt: np.ndarray
+    temps: np.ndarray
+    pops: np.ndarray
+    winds: np.ndarray
+    conditions: List[str]
+    
+    @classmethod
+    def from_periods(cls, periods: List[Dict[str, Any]]) -> "DayBlock":
+        """Normalize raw forecast periods; periods missing a field are left out of that array"""
+        return cls(
+            periods=periods,
+            dt=np.fromiter((p['dt'] for p in periods if 'dt' in p), dtype=np.int64),
+            temps=np.fromiter((p['main']['temp'] for p in periods if 'temp' in p.get('main', ())), dtype=np.float64),
+            pops=np.fromiter((p['pop'] for p in periods if 'pop' in p), dtype=np.float64),
+            winds=np.fromiter((p['wind']['speed'] for p in periods if 'speed' in p.get('wind', ())), dtype=np.float64),
+            conditions=[p['weather'][0].get('main', '') for p in periods if p.get('weather')]
+        )
+    
+    def temp_range(self) -> tuple:
+        """Min, max and mean temperature of the day, all zero when there is no data"""
+        if not self.temps.size:
+            return 0.0, 0.0, 0.0
+        return float(self.temps.min()), float(self.temps.max()), float(self.temps.mean())
+    
+    def dominant_condition(self) -> str:
+        """Most common weather condition of the day"""
+        return Counter(self.conditions).most_common(1)[0][0] if self.conditions else "Unknown"
+
 # Common garden plants with their ideal conditions
 COMMON_PLANTS = {
     "tomato": {
@@ -121,30 +221,29 @@ def get_watering_recommendations(city: str, soil_type: str = "loamy") -> Dict[st
     Returns:
         dict: Watering recommendations for the next 24 hours
     """
+    # Current time, computed once per request
+    now = datetime.now()
+    now_iso = now.isoformat()
+    
     try:
+        # Normalize soil type once and look up its properties
+        soil_type = soil_type.lower()
+        soil_properties = SOIL_TYPES.get(soil_type)
+        if soil_properties is None:
+            soil_properties = SOIL_TYPES["loamy"]
+        
         # Get weather forecast
-        weather_data = weather_utils.get_weather_forecast(city)
-        current_weather = weather_utils.get_city_weather(city)
+        weather_data = _cached_forecast(city)
+        current_weather = _cached_weather(city)
         
-        # Current time and date
-        now = datetime.now()
-        today = now.date()
-        tomorrow = today + timedelta(days=1)
+        # Current date in the city's local time
+        tz_offset = _tz_offset(weather_data)
+        today_idx = (int(now.timestamp()) + tz_offset) // 86400
         
         # Extract today's and tomorrow's forecasts
-        today_forecast = []
-        tomorrow_forecast = []
-        
-        if weather_data and 'list' in weather_data:
-            for period in weather_data['list']:
-                # Convert timestamp to datetime
-                period_time = datetime.fromtimestamp(period['dt'])
-                period_date = period_time.date()
-                
-                if period_date == today:
-                    today_forecast.append(period)
-                elif period_date == tomorrow:
-                    tomorrow_forecast.append(period)
+        forecast_by_day = _group_by_day(weather_data, tz_offset)
+        today_forecast = forecast_by_day.get(today_idx, [])
+        tomorrow_forecast = forecast_by_day.get(today_idx + 1, [])
         
         # Use current weather if no forecast is available
         if not today_forecast and current_weather:
@@ -166,10 +265,10 @@ def get_watering_recommendations(city: str, soil_type: str = "loamy") -> Dict[st
         soil_moisture = calculate_soil_moisture(soil_type, recent_precipitation, today_et)
         
         # Find upcoming precipitation
-        upcoming_rain = find_upcoming_precipitation(today_forecast, tomorrow_forecast)
+        upcoming_rain = find_upcoming_precipitation(today_forecast, tomorrow_forecast, tz_offset)
         
         # Determine best watering time
-        best_time = determine_best_watering_time(today_forecast, tomorrow_forecast, soil_type, soil_moisture)
+        best_time = determine_best_watering_time(today_forecast, tomorrow_forecast, soil_type, soil_moisture, tz_offset)
         
         # Generate watering plan
         watering_plan = generate_watering_plan(
@@ -182,17 +281,16 @@ def get_watering_recommendations(city: str, soil_type: str = "loamy") -> Dict[st
         )
         
         # Add weather data for the recommendation period
-        today_high = max([x.get('main', {}).get('temp', 0) for x in today_forecast]) if today_forecast else 0
-        today_low = min([x.get('main', {}).get('temp', 0) for x in today_forecast]) if today_forecast else 0
+        today_block = DayBlock.from_periods(today_forecast)
+        today_low, today_high, _ = today_block.temp_range()
         
         # Get the dominant weather condition for today
-        weather_conditions = [x.get('weather', [{}])[0].get('main', '') for x in today_forecast if 'weather' in x and len(x['weather']) > 0]
-        dominant_condition = max(set(weather_conditions), key=weather_conditions.count) if weather_conditions else "Unknown"
+        dominant_condition = today_block.dominant_condition()
         
         return {
             "city": city,
             "soil_type": soil_type,
-            "soil_properties": SOIL_TYPES.get(soil_type, SOIL_TYPES["loamy"]),
+            "soil_properties": asdict(soil_properties),
             "soil_moisture": soil_moisture,
             "evapotranspiration": {
                 "today": today_et,
@@ -208,7 +306,7 @@ def get_watering_recommendations(city: str, soil_type: str = "loamy") -> Dict[st
                 "low_temp": round(today_low, 1),
                 "condition": dominant_condition
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
     except Exception as e:
@@ -223,7 +321,7 @@ def get_watering_recommendations(city: str, soil_type: str = "loamy") -> Dict[st
                 "water_amount": "Moderate watering recommended",
                 "follow_up": "Water at sunset or early morning for best water conservation."
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
 
 def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]:
@@ -237,30 +335,23 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
     Returns:
         dict: Plant care recommendations
     """
+    # Current time, computed once per request
+    now = datetime.now()
+    now_iso = now.isoformat()
+    
     try:
         # Get weather forecast
-        weather_data = weather_utils.get_weather_forecast(city)
-        current_weather = weather_utils.get_city_weather(city)
+        weather_data = _cached_forecast(city)
+        current_weather = _cached_weather(city)
         
-        # Current time and date
-        now = datetime.now()
-        today = now.date()
-        tomorrow = today + timedelta(days=1)
+        # Current date in the city's local time
+        tz_offset = _tz_offset(weather_data)
+        today_idx = (int(now.timestamp()) + tz_offset) // 86400
         
         # Extract today's and tomorrow's forecasts
-        today_forecast = []
-        tomorrow_forecast = []
-        
-        if weather_data and 'list' in weather_data:
-            for period in weather_data['list']:
-                # Convert timestamp to datetime
-                period_time = datetime.fromtimestamp(period['dt'])
-                period_date = period_time.date()
-                
-                if period_date == today:
-                    today_forecast.append(period)
-                elif period_date == tomorrow:
-                    tomorrow_forecast.append(period)
+        forecast_by_day = _group_by_day(weather_data, tz_offset)
+        today_forecast = forecast_by_day.get(today_idx, [])
+        tomorrow_forecast = forecast_by_day.get(today_idx + 1, [])
         
         # Use current weather if no forecast is available
         if not today_forecast and current_weather:
@@ -274,7 +365,8 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
             }]
             
         # Get plant information
-        plant_info = COMMON_PLANTS.get(plant_type.lower(), {})
+        plant_info = COMMON_PLANTS.get(plant_type.lower(), _EMPTY)
+        plant_display = plant_type.capitalize() if isinstance(plant_type, str) else "This plant"
         if not plant_info:
             # If plant not found in our database, provide generic recommendations
             return {
@@ -287,21 +379,18 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
                     "Ensure proper drainage",
                     "Provide adequate sunlight"
                 ],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso
             }
             
         # Extract temperature information from forecast
-        forecast_temps = [period.get('main', {}).get('temp', 20) for period in today_forecast if 'main' in period]
-        min_temp = min(forecast_temps) if forecast_temps else 0
-        max_temp = max(forecast_temps) if forecast_temps else 0
-        avg_temp = sum(forecast_temps) / len(forecast_temps) if forecast_temps else 0
+        min_temp, max_temp, avg_temp = DayBlock.from_periods(today_forecast).temp_range()
         
         # Check for extreme conditions
         frost_risk = min_temp < 2  # Temperature below 2°C indicates frost risk
         heat_risk = max_temp > 32  # Temperature above 32°C indicates heat risk
         
         # Check for upcoming precipitation
-        upcoming_rain = find_upcoming_precipitation(today_forecast, tomorrow_forecast)
+        upcoming_rain = find_upcoming_precipitation(today_forecast, tomorrow_forecast, tz_offset)
         
         # Generate recommendations based on plant needs and weather conditions
         recommendations = []
@@ -312,7 +401,6 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
         
         if avg_temp < ideal_min:
             if plant_info.get('frost_sensitive', False) and frost_risk:
-                plant_display = plant_type.capitalize() if isinstance(plant_type, str) else "This plant"
                 alerts.append({
                     "type": "frost",
                     "severity": "high",
@@ -324,7 +412,6 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
                 
         elif avg_temp > ideal_max:
             if plant_info.get('heat_sensitive', False) and heat_risk:
-                plant_display = plant_type.capitalize() if isinstance(plant_type, str) else "This plant"
                 alerts.append({
                     "type": "heat",
                     "severity": "high",
@@ -355,13 +442,13 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
                 recommendations.append("Allow soil to dry between waterings. Check moisture levels by inserting finger 2 inches into soil.")
         
         # Calculate ideal watering time
-        best_time = determine_best_watering_time(today_forecast, tomorrow_forecast, "loamy", 0.5)
+        best_time = determine_best_watering_time(today_forecast, tomorrow_forecast, "loamy", 0.5, tz_offset)
         
         # Drone or aerial monitoring suggestions (for larger farms)
         drone_monitoring = False
         if len(today_forecast) > 0:
-            weather_condition = today_forecast[0].get('weather', [{}])[0].get('main', '').lower()
-            wind_speed = today_forecast[0].get('wind', {}).get('speed', 0)
+            weather_condition = (today_forecast[0].get('weather') or _EMPTY_WEATHER)[0].get('main', '').lower()
+            wind_speed = today_forecast[0].get('wind', _EMPTY).get('speed', 0)
             
             if ('clear' in weather_condition or 'clouds' in weather_condition) and wind_speed < 5:
                 drone_monitoring = True
@@ -382,7 +469,7 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
             "best_watering_time": best_time,
             "upcoming_precipitation": upcoming_rain,
             "suitable_for_drone_monitoring": drone_monitoring,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
     except Exception as e:
@@ -396,9 +483,58 @@ def get_plant_care_recommendations(city: str, plant_type: str) -> Dict[str, Any]
                 "Check soil moisture before watering",
                 "Protect from extreme weather conditions"
             ],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
 
+# Months of each season by hemisphere
+_SEASONS_N = {
+    "spring": (3, 4, 5),  # Mar, Apr, May
+    "summer": (6, 7, 8),  # Jun, Jul, Aug
+    "fall": (9, 10, 11),  # Sep, Oct, Nov
+    "winter": (12, 1, 2)  # Dec, Jan, Feb
+}
+_SEASONS_S = {
+    "spring": (9, 10, 11),  # Sep, Oct, Nov
+    "summer": (12, 1, 2),   # Dec, Jan, Feb
+    "fall": (3, 4, 5),      # Mar, Apr, May
+    "winter": (6, 7, 8)     # Jun, Jul, Aug
+}
+
+# 0-based month indexes of each season, one row per season in _SEASONS_N order
+_SEASON_MONTH_IDX_N = np.array([[m - 1 for m in _SEASONS_N[season]] for season in _SEASONS_N])
+_SEASON_MONTH_IDX_S = np.array([[m - 1 for m in _SEASONS_S[season]] for season in _SEASONS_N])
+
+@lru_cache(maxsize=4096)
+def _hemisphere_for_city(city: str) -> bool:
+    """
+    Determine whether a city is in the northern hemisphere from its temperature pattern
+    
+    A city's hemisphere never changes, so the answer is memoized. Cities without
+    usable history, including simulated fallback history, raise ValueError, which
+    lru_cache does not cache.
+    
+    Args:
+        city (str): City name
+        
+    Returns:
+        bool: True for the northern hemisphere, False for the southern
+    """
+    historical_data = _cached_history(city)
+    if not historical_data or 'temperature' not in historical_data:
+        raise ValueError(f"No temperature history for {city}")
+    if weather_utils.is_simulated(historical_data):
+        raise ValueError(f"Temperature history for {city} is unavailable")
+    
+    temp_pattern = historical_data['temperature']['values']
+    if len(temp_pattern) < 12:
+        raise ValueError(f"Incomplete temperature history for {city}")
+    
+    # Northern hemisphere: warmer in Jun-Aug (indices 5-7)
+    # Southern hemisphere: warmer in Dec-Feb (indices 11, 0, 1)
+    summer_north = sum(temp_pattern[5:8]) / 3
+    summer_south = (temp_pattern[11] + temp_pattern[0] + temp_pattern[1]) / 3
+    return summer_north > summer_south
+
 def get_growing_season_forecast(city: str) -> Dict[str, Any]:
     """
     Get growing season forecast for a specific city
@@ -409,42 +545,26 @@ def get_growing_season_forecast(city: str) -> Dict[str, Any]:
     Returns:
         dict: Growing season forecast and recommendations
     """
+    # Current time, computed once per request
+    now = datetime.now()
+    now_iso = now.isoformat()
+    
     try:
         # Get historical weather data and forecast
-        historical_data = weather_utils.get_weather_history(city)
-        forecast_data = weather_utils.get_weather_forecast(city)
+        historical_data = _cached_history(city)
+        forecast_data = _cached_forecast(city)
         
-        # Current time and date
-        now = datetime.now()
+        # Current month
         current_month = now.month
         
         # Determine current season based on hemisphere
-        northern_hemisphere = True  # Default to northern hemisphere
-        if historical_data and 'temperature' in historical_data:
-            # Use temperature pattern to determine hemisphere
-            temp_pattern = historical_data['temperature']['values']
-            if len(temp_pattern) >= 12:
-                # Northern hemisphere: warmer in Jun-Aug (indices 5-7)
-                # Southern hemisphere: warmer in Dec-Feb (indices 11, 0, 1)
-                summer_north = sum(temp_pattern[5:8]) / 3
-                summer_south = (temp_pattern[11] + temp_pattern[0] + temp_pattern[1]) / 3
-                northern_hemisphere = summer_north > summer_south
+        try:
+            northern_hemisphere = _hemisphere_for_city(city)
+        except ValueError:
+            northern_hemisphere = True  # Default to northern hemisphere
         
         # Determine seasons based on hemisphere
-        if northern_hemisphere:
-            seasons = {
-                "spring": [3, 4, 5],  # Mar, Apr, May
-                "summer": [6, 7, 8],  # Jun, Jul, Aug
-                "fall": [9, 10, 11],  # Sep, Oct, Nov
-                "winter": [12, 1, 2]  # Dec, Jan, Feb
-            }
-        else:
-            seasons = {
-                "spring": [9, 10, 11],  # Sep, Oct, Nov
-                "summer": [12, 1, 2],   # Dec, Jan, Feb
-                "fall": [3, 4, 5],      # Mar, Apr, May
-                "winter": [6, 7, 8]     # Jun, Jul, Aug
-            }
+        seasons = _SEASONS_N if northern_hemisphere else _SEASONS_S
             
         # Determine current season
         current_season = next((season for season, months in seasons.items() if current_month in months), "unknown")
@@ -461,31 +581,24 @@ def get_growing_season_forecast(city: str) -> Dict[str, Any]:
         five_day_forecast = []
         if forecast_data and 'list' in forecast_data:
             # Group forecast by day
-            forecast_by_day = {}
-            for period in forecast_data['list']:
-                day = datetime.fromtimestamp(period['dt']).date()
-                if day not in forecast_by_day:
-                    forecast_by_day[day] = []
-                forecast_by_day[day].append(period)
+            forecast_by_day = _day_blocks(forecast_data, _tz_offset(forecast_data))
             
             # Process the first 5 days
             days_processed = 0
-            for day, periods in sorted(forecast_by_day.items()):
+            for day_idx, block in sorted(forecast_by_day.items()):
                 if days_processed >= 5:
                     break
+                
+                day = date.fromordinal(_EPOCH_ORDINAL + day_idx)
                     
                 # Calculate min/max temperature and precipitation probability
-                temps = [p.get('main', {}).get('temp', 0) for p in periods if 'main' in p]
-                min_temp = min(temps) if temps else 0
-                max_temp = max(temps) if temps else 0
+                min_temp, max_temp, _ = block.temp_range()
                 
                 # Get average precipitation probability
-                precip_probs = [p.get('pop', 0) * 100 for p in periods if 'pop' in p]  # Convert to percentage
-                avg_precip_prob = sum(precip_probs) / len(precip_probs) if precip_probs else 0
+                avg_precip_prob = float(block.pops.mean()) * 100 if block.pops.size else 0  # Convert to percentage
                 
                 # Get weather condition
-                weather_conditions = [p.get('weather', [{}])[0].get('main', '') for p in periods if 'weather' in p and len(p['weather']) > 0]
-                dominant_condition = max(set(weather_conditions), key=weather_conditions.count) if weather_conditions else "Unknown"
+                dominant_condition = block.dominant_condition()
                 
                 five_day_forecast.append({
                     "date": day.strftime("%Y-%m-%d"),
@@ -503,12 +616,11 @@ def get_growing_season_forecast(city: str) -> Dict[str, Any]:
             temperature_data = historical_data['temperature']
             monthly_temps = temperature_data.get('values', [20] * 12)  # Default to 20°C if no data
             
-            # Calculate seasonal averages
-            seasonal_temps = {}
-            for season, months in seasons.items():
-                # Convert 1-based months to 0-based indices
-                indices = [(m - 1) % 12 for m in months]
-                seasonal_temps[season] = sum(monthly_temps[i] for i in indices if i < len(monthly_temps)) / len(indices)
+            # Calculate seasonal averages for all seasons at once (missing months count as 0)
+            month_temps = np.zeros(12, dtype=np.float64)
+            month_temps[:min(12, len(monthly_temps))] = monthly_temps[:12]
+            season_idx = _SEASON_MONTH_IDX_N if northern_hemisphere else _SEASON_MONTH_IDX_S
+            seasonal_temps = dict(zip(_SEASONS_N, month_temps[season_idx].mean(axis=1).tolist()))
         else:
             seasonal_temps = {
                 "spring": 15,
@@ -525,7 +637,7 @@ def get_growing_season_forecast(city: str) -> Dict[str, Any]:
             "seasonal_temperatures": {s: round(t, 1) for s, t in seasonal_temps.items()},
             "five_day_forecast": five_day_forecast,
             "planting_recommendations": planting_recommendations,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
     except Exception as e:
@@ -538,7 +650,7 @@ def get_growing_season_forecast(city: str) -> Dict[str, Any]:
                 "Consider starting seeds indoors for transplanting later",
                 "Monitor soil temperature before planting heat-loving crops"
             ],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
 
 def get_soil_moisture_forecast(city: str, soil_type: str = "loamy") -> Dict[str, Any]:
@@ -552,66 +664,55 @@ def get_soil_moisture_forecast(city: str, soil_type: str = "loamy") -> Dict[str,
     Returns:
         dict: Soil moisture forecast for the next 5 days
     """
+    # Current time, computed once per request
+    now_iso = datetime.now().isoformat()
+    
     try:
-        # Get weather forecast
-        weather_data = weather_utils.get_weather_forecast(city)
+        # Normalize soil type once
+        soil_type = soil_type.lower()
         
-        # Current time and date
-        now = datetime.now()
+        # Get weather forecast
+        weather_data = _cached_forecast(city)
         
         # Extract forecasts and group by day
-        daily_forecasts = {}
+        tz_offset = _tz_offset(weather_data)
+        daily_forecasts = _day_blocks(weather_data, tz_offset)
+        daily_averages = _daily_averages(weather_data.get('list', []) if weather_data else [], tz_offset)
         
-        if weather_data and 'list' in weather_data:
-            for period in weather_data['list']:
-                # Convert timestamp to datetime
-                period_time = datetime.fromtimestamp(period['dt'])
-                period_date = period_time.date()
-                
-                if period_date not in daily_forecasts:
-                    daily_forecasts[period_date] = []
-                    
-                daily_forecasts[period_date].append(period)
+        # Get soil properties
+        soil_properties = SOIL_TYPES.get(soil_type)
+        if soil_properties is None:
+            soil_properties = SOIL_TYPES["loamy"]
+        water_holding_capacity = soil_properties.water_holding_capacity
+        infiltration_rate = soil_properties.infiltration_rate
+        
+        # Limit to 5 days
+        days = daily_averages["days"][:5]
+        
+        # Calculate daily ET
+        daily_et_values = calculate_evapotranspiration_batch(daily_averages, soil_type)[:len(days)].tolist()
+        
+        # Estimate precipitation amount based on probability
+        estimated_precip_values = _estimate_precip(np.asarray(daily_averages["pop"][:len(days)], dtype=np.float64)).tolist()
+        
+        # Run the daily water balance, starting at 70% soil moisture
+        moisture_levels = _moisture_trajectory(
+            daily_et_values,
+            estimated_precip_values,
+            infiltration_rate,
+            water_holding_capacity,
+            0.7
+        )
         
         # Process each day's forecast
         moisture_forecast = []
-        current_moisture = 0.7  # Starting soil moisture level (0-1 scale, 0.7 = 70%)
-        
-        # Get soil properties
-        soil_properties = SOIL_TYPES.get(soil_type, SOIL_TYPES["loamy"])
-        water_holding_capacity = soil_properties["water_holding_capacity"]
-        infiltration_rate = soil_properties["infiltration_rate"]
         
-        for day, forecast in sorted(daily_forecasts.items()):
-            # Calculate daily ET
-            daily_et = calculate_evapotranspiration(forecast, soil_type)
-            
-            # Calculate precipitation
-            precip_probs = [p.get('pop', 0) for p in forecast if 'pop' in p]
-            avg_precip_prob = sum(precip_probs) / len(precip_probs) if precip_probs else 0
-            
-            # Estimate precipitation amount based on probability
-            # This is a simplified model; real precipitation would come from the API
-            estimated_precip = 0
-            if avg_precip_prob > 0.7:
-                estimated_precip = random.uniform(10, 25)  # Heavy rain
-            elif avg_precip_prob > 0.4:
-                estimated_precip = random.uniform(2, 10)   # Moderate rain
-            elif avg_precip_prob > 0.2:
-                estimated_precip = random.uniform(0.1, 2)  # Light rain
-                
-            # Convert mm to inches for calculation
-            estimated_precip_inches = estimated_precip / 25.4
-            daily_et_inches = daily_et / 25.4
-            
-            # Calculate moisture gain from precipitation (limited by infiltration rate)
-            moisture_gain = min(estimated_precip_inches, infiltration_rate) / water_holding_capacity
-            
-            # Calculate moisture loss from ET
-            moisture_loss = daily_et_inches / water_holding_capacity
-            
-            # Update current moisture level
-            current_moisture = min(1.0, max(0.0, current_moisture + moisture_gain - moisture_loss))
+        for i, day_idx in enumerate(days):
+            day = date.fromordinal(_EPOCH_ORDINAL + day_idx)
+            daily_et = daily_et_values[i]
+            avg_precip_prob = daily_averages["pop"][i]
+            estimated_precip = estimated_precip_values[i]
+            current_moisture = moisture_levels[i]
             
             # Determine moisture status
             if current_moisture < 0.3:
@@ -632,8 +733,7 @@ def get_soil_moisture_forecast(city: str, soil_type: str = "loamy") -> Dict[str,
                 watering_needed = "No watering needed"
             
             # Get weather condition
-            weather_conditions = [p.get('weather', [{}])[0].get('main', '') for p in forecast if 'weather' in p and len(p['weather']) > 0]
-            dominant_condition = max(set(weather_conditions), key=weather_conditions.count) if weather_conditions else "Unknown"
+            dominant_condition = daily_forecasts[day_idx].dominant_condition()
             
             # Format date
             formatted_date = day.strftime("%Y-%m-%d")
@@ -651,17 +751,13 @@ def get_soil_moisture_forecast(city: str, soil_type: str = "loamy") -> Dict[str,
                 "watering_recommendation": watering_needed,
                 "weather_condition": dominant_condition
             })
-            
-            # Limit to 5 days
-            if len(moisture_forecast) >= 5:
-                break
         
         return {
             "city": city,
             "soil_type": soil_type,
-            "soil_properties": soil_properties,
+            "soil_properties": asdict(soil_properties),
             "moisture_forecast": moisture_forecast,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
     except Exception as e:
@@ -670,9 +766,111 @@ def get_soil_moisture_forecast(city: str, soil_type: str = "loamy") -> Dict[str,
             "city": city,
             "soil_type": soil_type,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
 
+# Common garden pests and their favorable conditions
+PESTS = MappingProxyType({
+    "aphids": MappingProxyType({
+        "favorable_temp": (20, 30),  # Celsius
+        "favorable_humidity": (60, 90),  # Percentage
+        "description": "Small sap-sucking insects that can quickly multiply in warm conditions",
+        "control_methods": ("Introduce beneficial insects", "Neem oil spray", "Insecticidal soap")
+    }),
+    "slugs_snails": MappingProxyType({
+        "favorable_temp": (5, 25),
+        "favorable_humidity": (70, 100),
+        "description": "Mollusks that feed on plant leaves and are most active in moist conditions",
+        "control_methods": ("Diatomaceous earth barriers", "Beer traps", "Copper tape barriers")
+    }),
+    "spider_mites": MappingProxyType({
+        "favorable_temp": (27, 38),
+        "favorable_humidity": (20, 40),
+        "description": "Tiny pests that thrive in hot, dry conditions and cause stippling on leaves",
+        "control_methods": ("Increase humidity", "Neem oil", "Predatory mites")
+    }),
+    "powdery_mildew": MappingProxyType({
+        "favorable_temp": (15, 28),
+        "favorable_humidity": (50, 90),
+        "description": "Fungal disease causing white powdery spots on leaves in warm, humid conditions",
+        "control_methods": ("Improve air circulation", "Baking soda spray", "Fungicides")
+    }),
+    "late_blight": MappingProxyType({
+        "favorable_temp": (10, 24),
+        "favorable_humidity": (75, 100),
+        "description": "Fungal disease affecting tomatoes and potatoes, thrives in cool, wet conditions",
+        "control_methods": ("Copper fungicides", "Proper spacing", "Avoid overhead watering")
+    })
+})
+
+# Pest favorable ranges as arrays, in PESTS order, so each day is checked in one step
+_PEST_NAMES = list(PESTS)
+_PEST_TEMP_LOW = np.array([p["favorable_temp"][0] for p in PESTS.values()], dtype=np.float64)
+_PEST_TEMP_HIGH = np.array([p["favorable_temp"][1] for p in PESTS.values()], dtype=np.float64)
+_PEST_HUMIDITY_LOW = np.array([p["favorable_humidity"][0] for p in PESTS.values()], dtype=np.float64)
+_PEST_HUMIDITY_HIGH = np.array([p["favorable_humidity"][1] for p in PESTS.values()], dtype=np.float64)
+
+# Slugs and late blight carry a higher risk with precipitation
+_PEST_RAIN_SENSITIVE = np.array([name in ("slugs_snails", "late_blight") for name in PESTS])
+
+# Risk factor thresholds for moderate and high risk, and the labels of each level
+_RISK_LEVEL_EDGES = (4, 7)
+_RISK_LEVELS = ("low", "moderate", "high")
+_RISK_CLASSES = ("success", "warning", "danger")
+
+class PestRisk(TypedDict):
+    """Risk of one pest on one day"""
+    risk_factor: float
+    risk_level: str
+    risk_class: str
+    description: str
+    control_methods: Tuple[str, ...]
+
+class PestWeatherSummary(TypedDict):
+    """Weather values the pest risks of a day were computed from"""
+    temperature: float
+    humidity: float
+    precipitation_probability: float
+    condition: str
+
+class DayRisk(TypedDict):
+    """Pest risk forecast for one day"""
+    date: str
+    day_name: str
+    weather_summary: PestWeatherSummary
+    pest_risks: Dict[str, PestRisk]
+    risk_summary: str
+
+def _pest_day_averages(daily_periods: List[List[Dict[str, Any]]]) -> tuple:
+    """
+    Average temperature, humidity and precipitation probability for each day
+    
+    Periods without a value are skipped; days with no values fall back to
+    20°C, 50% humidity and 0 precipitation probability.
+    
+    Args:
+        daily_periods (list): Forecast periods for each day, in day order
+        
+    Returns:
+        tuple: (temperature, humidity, precipitation probability) arrays, one entry per day
+    """
+    n_days = len(daily_periods)
+    periods = [p for day_periods in daily_periods for p in day_periods]
+    day_pos = np.repeat(np.arange(n_days), [len(day_periods) for day_periods in daily_periods])
+    
+    def day_means(values, present, default):
+        sums = np.bincount(day_pos, weights=np.where(present, values, 0.0), minlength=n_days)
+        counts = np.bincount(day_pos, weights=present, minlength=n_days)
+        return np.divide(sums, counts, out=np.full(n_days, float(default)), where=counts > 0)
+    
+    has_main = np.fromiter(('main' in p for p in periods), dtype=bool, count=len(periods))
+    temps = np.fromiter((p['main'].get('temp', 20) if 'main' in p else 0 for p in periods), dtype=np.float64, count=len(periods))
+    humidities = np.fromiter((p['main'].get('humidity', 50) if 'main' in p else 0 for p in periods), dtype=np.float64, count=len(periods))
+    has_pop = np.fromiter(('pop' in p for p in periods), dtype=bool, count=len(periods))
+    pops = np.fromiter((p.get('pop', 0) for p in periods), dtype=np.float64, count=len(periods))
+    
+    return day_means(temps, has_main, 20), day_means(humidities, has_main, 50), day_means(pops, has_pop, 0)
+
 def get_pest_risk_forecast(city: str) -> Dict[str, Any]:
     """
     Get pest and disease risk forecast based on weather conditions
@@ -683,122 +881,70 @@ def get_pest_risk_forecast(city: str) -> Dict[str, Any]:
     Returns:
         dict: Pest and disease risk assessments for the coming days
     """
+    # Current time, computed once per request
+    now_iso = datetime.now().isoformat()
+    
     try:
         # Get weather forecast
-        weather_data = weather_utils.get_weather_forecast(city)
-        
-        # Common garden pests and their favorable conditions
-        pests = {
-            "aphids": {
-                "favorable_temp": (20, 30),  # Celsius
-                "favorable_humidity": (60, 90),  # Percentage
-                "description": "Small sap-sucking insects that can quickly multiply in warm conditions",
-                "control_methods": ["Introduce beneficial insects", "Neem oil spray", "Insecticidal soap"]
-            },
-            "slugs_snails": {
-                "favorable_temp": (5, 25),
-                "favorable_humidity": (70, 100),
-                "description": "Mollusks that feed on plant leaves and are most active in moist conditions",
-                "control_methods": ["Diatomaceous earth barriers", "Beer traps", "Copper tape barriers"]
-            },
-            "spider_mites": {
-                "favorable_temp": (27, 38),
-                "favorable_humidity": (20, 40),
-                "description": "Tiny pests that thrive in hot, dry conditions and cause stippling on leaves",
-                "control_methods": ["Increase humidity", "Neem oil", "Predatory mites"]
-            },
-            "powdery_mildew": {
-                "favorable_temp": (15, 28),
-                "favorable_humidity": (50, 90),
-                "description": "Fungal disease causing white powdery spots on leaves in warm, humid conditions",
-                "control_methods": ["Improve air circulation", "Baking soda spray", "Fungicides"]
-            },
-            "late_blight": {
-                "favorable_temp": (10, 24),
-                "favorable_humidity": (75, 100),
-                "description": "Fungal disease affecting tomatoes and potatoes, thrives in cool, wet conditions",
-                "control_methods": ["Copper fungicides", "Proper spacing", "Avoid overhead watering"]
-            }
-        }
+        weather_data = _cached_forecast(city)
         
-        # Extract 5-day forecast
-        daily_forecasts = {}
+        # Extract 5-day forecast, grouped by day in the city's local time
+        daily_forecasts = _group_by_day(weather_data, _tz_offset(weather_data))
         
-        if weather_data and 'list' in weather_data:
-            for period in weather_data['list']:
-                # Convert timestamp to datetime
-                period_time = datetime.fromtimestamp(period['dt'])
-                period_date = period_time.date()
-                
-                if period_date not in daily_forecasts:
-                    daily_forecasts[period_date] = []
-                    
-                daily_forecasts[period_date].append(period)
+        # Limit to 5 days before doing any per-day work
+        days = sorted(daily_forecasts)[:5]
         
-        # Process pest risks for each day
-        risk_forecast = []
+        # Per-day average temperature, humidity and precipitation probability
+        day_temp, day_humidity, day_precip_prob = _pest_day_averages([daily_forecasts[day] for day in days])
         
-        for day, forecast in sorted(daily_forecasts.items()):
-            # Calculate average temperature and humidity
-            temps = [p.get('main', {}).get('temp', 20) for p in forecast if 'main' in p]
-            humidities = [p.get('main', {}).get('humidity', 50) for p in forecast if 'main' in p]
-            
-            avg_temp = sum(temps) / len(temps) if temps else 20
-            avg_humidity = sum(humidities) / len(humidities) if humidities else 50
-            
-            # Get precipitation probability
-            precip_probs = [p.get('pop', 0) for p in forecast if 'pop' in p]
-            avg_precip_prob = sum(precip_probs) / len(precip_probs) if precip_probs else 0
+        # Check which pests find each day's conditions favorable (days x pests)
+        temp_favorable = (_PEST_TEMP_LOW <= day_temp[:, None]) & (day_temp[:, None] <= _PEST_TEMP_HIGH)
+        humidity_favorable = (_PEST_HUMIDITY_LOW <= day_humidity[:, None]) & (day_humidity[:, None] <= _PEST_HUMIDITY_HIGH)
+        
+        # Higher risk with precipitation for rain-sensitive pests
+        precipitation_factor = np.where(day_precip_prob > 0.3, day_precip_prob * 2, 0)
+        precipitation_factors = np.where(_PEST_RAIN_SENSITIVE, precipitation_factor[:, None], 0)
+        
+        # Calculate risk factor (0-10 scale), capped at 10
+        risk_matrix = np.where(
+            temp_favorable & humidity_favorable, 7 + precipitation_factors,
+            np.where(temp_favorable | humidity_favorable, 3 + precipitation_factors, 0)
+        )
+        risk_matrix = np.minimum(10, risk_matrix)
+        
+        # Risk level index per pest and day: 0 low (< 4), 1 moderate (< 7), 2 high
+        level_matrix = np.digitize(risk_matrix, _RISK_LEVEL_EDGES)
+        
+        # Process pest risks for each day
+        risk_forecast: List[DayRisk] = []
+        
+        for i, day_idx in enumerate(days):
+            forecast = daily_forecasts[day_idx]
+            avg_temp = float(day_temp[i])
+            avg_humidity = float(day_humidity[i])
+            avg_precip_prob = float(day_precip_prob[i])
+            risk_factors = risk_matrix[i]
+            levels = level_matrix[i]
             
             # Determine risk level for each pest
-            pest_risks = {}
-            for pest, conditions in pests.items():
-                # Check if conditions are favorable
-                temp_range = conditions["favorable_temp"]
-                humidity_range = conditions["favorable_humidity"]
-                
-                temp_favorable = temp_range[0] <= avg_temp <= temp_range[1]
-                humidity_favorable = humidity_range[0] <= avg_humidity <= humidity_range[1]
-                
-                # Special case for slugs and late blight - higher risk with precipitation
-                precipitation_factor = 0
-                if pest in ["slugs_snails", "late_blight"] and avg_precip_prob > 0.3:
-                    precipitation_factor = avg_precip_prob * 2
-                
-                # Calculate risk factor (0-10 scale)
-                risk_factor = 0
-                if temp_favorable and humidity_favorable:
-                    risk_factor = 7 + precipitation_factor
-                elif temp_favorable or humidity_favorable:
-                    risk_factor = 3 + precipitation_factor
-                
-                # Cap at 10
-                risk_factor = min(10, risk_factor)
-                
-                # Determine risk level
-                if risk_factor >= 7:
-                    risk_level = "high"
-                    risk_class = "danger"
-                elif risk_factor >= 4:
-                    risk_level = "moderate"
-                    risk_class = "warning"
-                else:
-                    risk_level = "low"
-                    risk_class = "success"
+            pest_risks: Dict[str, PestRisk] = {}
+            for pest, risk_factor, level in zip(_PEST_NAMES, risk_factors.tolist(), levels.tolist()):
+                conditions = PESTS[pest]
                 
                 pest_risks[pest] = {
                     "risk_factor": round(risk_factor, 1),
-                    "risk_level": risk_level,
-                    "risk_class": risk_class,
+                    "risk_level": _RISK_LEVELS[level],
+                    "risk_class": _RISK_CLASSES[level],
                     "description": conditions["description"],
                     "control_methods": conditions["control_methods"]
                 }
             
             # Get weather condition
-            weather_conditions = [p.get('weather', [{}])[0].get('main', '') for p in forecast if 'weather' in p and len(p['weather']) > 0]
-            dominant_condition = max(set(weather_conditions), key=weather_conditions.count) if weather_conditions else "Unknown"
+            condition_counts = Counter(p['weather'][0].get('main', '') for p in forecast if p.get('weather'))
+            dominant_condition = condition_counts.most_common(1)[0][0] if condition_counts else "Unknown"
             
             # Format date
+            day = date.fromordinal(_EPOCH_ORDINAL + day_idx)
             formatted_date = day.strftime("%Y-%m-%d")
             day_name = day.strftime("%A")
             
@@ -826,20 +972,75 @@ def get_pest_risk_forecast(city: str) -> Dict[str, Any]:
                 "pest_risks": pest_risks,
                 "risk_summary": summary
             })
-            
-            # Limit to 5 days
-            if len(risk_forecast) >= 5:
-                break
         
         return {
             "city": city,
             "risk_forecast": risk_forecast,
-            "pests_info": pests,
-            "timestamp": datetime.now().isoformat()
+            "pests_info": PESTS,
+            "timestamp": now_iso
         }
         
     except Exception as e:
         logger.error(f"Error getting pest risk forecast for {city}: {e}")
+        return {
+            "city": city,
+            "error": str(e),
+            "timestamp": now_iso
+        }
+
+def get_pest_risk_forecast_batch(cities: List[str]) -> Dict[str, Any]:
+    """
+    Get pest and disease risk forecasts for several cities at once
+    
+    Args:
+        cities (list): City names
+        
+    Returns:
+        dict: Pest risk forecast for each city, keyed by city name
+    """
+    if not cities:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(cities))) as executor:
+        return dict(zip(cities, executor.map(get_pest_risk_forecast, cities)))
+
+def get_all_agriculture_info(city: str, soil_type: str = "loamy", plant_type: str = "tomato") -> Dict[str, Any]:
+    """
+    Get every agriculture panel for a city in one call
+    
+    The upstream weather requests are issued concurrently and shared through the
+    response cache, then the panels are built in parallel.
+    
+    Args:
+        city (str): City name
+        soil_type (str): Type of soil (sandy, loamy, clay, silty)
+        plant_type (str): Type of plant
+        
+    Returns:
+        dict: Watering, plant care, growing season, soil moisture and pest risk data
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            # Warm the shared caches so the panels don't each hit the API
+            fetches = [executor.submit(fetch, city) for fetch in (_cached_forecast, _cached_weather, _cached_history)]
+            for future in fetches:
+                future.result()
+            
+            panels = {
+                "watering": executor.submit(get_watering_recommendations, city, soil_type),
+                "plant_care": executor.submit(get_plant_care_recommendations, city, plant_type),
+                "growing_season": executor.submit(get_growing_season_forecast, city),
+                "soil_moisture": executor.submit(get_soil_moisture_forecast, city, soil_type),
+                "pest_risk": executor.submit(get_pest_risk_forecast, city)
+            }
+            result = {name: future.result() for name, future in panels.items()}
+        
+        result["city"] = city
+        result["timestamp"] = datetime.now().isoformat()
+        return result
+        
+    except Exception as e:
+        logger.error(f"Error getting agriculture info for {city}: {e}")
         return {
             "city": city,
             "error": str(e),
@@ -848,6 +1049,141 @@ def get_pest_risk_forecast(city: str) -> Dict[str, Any]:
 
 # Helper functions
 
+def _daily_averages(periods: List[Dict[str, Any]], tz_offset: int = 0) -> Dict[str, List[Any]]:
+    """
+    Average forecast values per calendar day using NumPy
+    
+    Missing values are skipped; days without any value for a field fall back
+    to the same defaults calculate_evapotranspiration uses.
+    
+    Args:
+        periods (list): Forecast periods from weather API
+        tz_offset (int): UTC offset in seconds used to find day boundaries
+        
+    Returns:
+        dict: Sorted day indexes under "days" and per-day averages for
+              temp, humidity, wind, clouds and pop
+    """
+    count = len(periods)
+    day_idx = np.fromiter(((p['dt'] + tz_offset) // 86400 for p in periods), dtype=np.int64, count=count)
+    days, inverse = np.unique(day_idx, return_inverse=True)
+    
+    fields = {
+        "temp": (lambda p: p.get('main', _EMPTY).get('temp', np.nan), 20),
+        "humidity": (lambda p: p.get('main', _EMPTY).get('humidity', np.nan), 50),
+        "wind": (lambda p: p.get('wind', _EMPTY).get('speed', np.nan), 2),
+        "clouds": (lambda p: p.get('clouds', _EMPTY).get('all', np.nan), 50),
+        "pop": (lambda p: p.get('pop', np.nan), 0)
+    }
+    
+    averages = {"days": days.tolist()}
+    for name, (extract, default) in fields.items():
+        values = np.fromiter((extract(p) for p in periods), dtype=np.float64, count=count)
+        present = ~np.isnan(values)
+        sums = np.bincount(inverse, weights=np.where(present, values, 0.0), minlength=len(days))
+        counts = np.bincount(inverse, weights=present, minlength=len(days))
+        means = np.divide(sums, counts, out=np.full(len(days), float(default)), where=counts > 0)
+        averages[name] = means.tolist()
+        
+    return averages
+
+def _estimate_precip(probs: np.ndarray) -> np.ndarray:
+    """
+    Estimate daily precipitation from average precipitation probability
+    
+    This is a simplified model; real precipitation would come from the API.
+    Each probability band maps to the middle of its rainfall range, so the
+    estimate is the same for the same forecast.
+    
+    Args:
+        probs (ndarray): Average precipitation probability for each day (0-1)
+        
+    Returns:
+        ndarray: Estimated precipitation for each day in mm
+    """
+    return np.select(
+        [probs > 0.7, probs > 0.4, probs > 0.2],
+        [17.5, 6.0, 1.05],  # Heavy (10-25 mm), moderate (2-10 mm), light (0.1-2 mm) rain
+        default=0.0
+    )
+
+def _moisture_trajectory(daily_et: List[float], daily_precip: List[float], infiltration_rate: float,
+                         water_holding_capacity: float, start_moisture: float) -> List[float]:
+    """
+    Run a daily soil water balance over a forecast
+    
+    Args:
+        daily_et (list): Evapotranspiration for each day in mm
+        daily_precip (list): Precipitation for each day in mm
+        infiltration_rate (float): Soil infiltration rate in inches per hour
+        water_holding_capacity (float): Soil water holding capacity in inches per foot
+        start_moisture (float): Soil moisture before the first day (0-1 scale)
+        
+    Returns:
+        list: Soil moisture at the end of each day (0-1 scale)
+    """
+    moisture = start_moisture
+    levels = []
+    
+    for et, precip in zip(daily_et, daily_precip):
+        # Moisture gain from precipitation is limited by infiltration rate (mm converted to inches)
+        moisture_gain = min(precip / 25.4, infiltration_rate) / water_holding_capacity
+        
+        # Moisture loss from ET
+        moisture_loss = (et / 25.4) / water_holding_capacity
+        
+        moisture = min(1.0, max(0.0, moisture + moisture_gain - moisture_loss))
+        levels.append(moisture)
+        
+    return levels
+
+def _tz_offset(weather_data: Dict[str, Any]) -> int:
+    """
+    Get the city's UTC offset from forecast data
+    
+    Args:
+        weather_data (dict): Forecast data from weather API
+        
+    Returns:
+        int: UTC offset in seconds, 0 if unknown
+    """
+    if not weather_data:
+        return 0
+    return int(weather_data.get('city', _EMPTY).get('timezone', 0) or 0)
+
+def _group_by_day(weather_data: Dict[str, Any], tz_offset: int = 0) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Group forecast periods by calendar day
+    
+    Args:
+        weather_data (dict): Forecast data from weather API
+        tz_offset (int): UTC offset in seconds used to find day boundaries
+        
+    Returns:
+        dict: Forecast periods keyed by day index (days since the epoch)
+    """
+    forecast_by_day = defaultdict(list)
+    
+    if weather_data and 'list' in weather_data:
+        for period in weather_data['list']:
+            forecast_by_day[(period['dt'] + tz_offset) // 86400].append(period)
+            
+    return forecast_by_day
+
+def _day_blocks(weather_data: Dict[str, Any], tz_offset: int = 0) -> Dict[int, "DayBlock"]:
+    """
+    Group forecast periods by calendar day and normalize each day into arrays
+    
+    Args:
+        weather_data (dict): Forecast data from weather API
+        tz_offset (int): UTC offset in seconds used to find day boundaries
+        
+    Returns:
+        dict: DayBlock for each day, keyed by day index (days since the epoch)
+    """
+    return {day_idx: DayBlock.from_periods(periods)
+            for day_idx, periods in _group_by_day(weather_data, tz_offset).items()}
+
 def calculate_evapotranspiration(forecast_periods: List[Dict[str, Any]], soil_type: str) -> float:
     """
     Calculate estimated evapotranspiration based on forecast data
@@ -863,28 +1199,94 @@ def calculate_evapotranspiration(forecast_periods: List[Dict[str, Any]], soil_ty
     if not forecast_periods:
         return 3.0  # Default moderate value if no data
     
-    # Extract relevant data from forecast
-    temps = []
-    humidities = []
-    wind_speeds = []
-    cloud_covers = []
+    # Accumulate running sums of the relevant data in one pass
+    temp_sum = humidity_sum = wind_sum = cloud_sum = 0.0
+    temp_count = humidity_count = wind_count = cloud_count = 0
     
     for period in forecast_periods:
-        if 'main' in period and 'temp' in period['main']:
-            temps.append(period['main']['temp'])
-        if 'main' in period and 'humidity' in period['main']:
-            humidities.append(period['main']['humidity'])
-        if 'wind' in period and 'speed' in period['wind']:
-            wind_speeds.append(period['wind']['speed'])
-        if 'clouds' in period and 'all' in period['clouds']:
-            cloud_covers.append(period['clouds']['all'])
+        main = period.get('main')
+        if main:
+            if 'temp' in main:
+                temp_sum += main['temp']
+                temp_count += 1
+            if 'humidity' in main:
+                humidity_sum += main['humidity']
+                humidity_count += 1
+        wind = period.get('wind')
+        if wind and 'speed' in wind:
+            wind_sum += wind['speed']
+            wind_count += 1
+        clouds = period.get('clouds')
+        if clouds and 'all' in clouds:
+            cloud_sum += clouds['all']
+            cloud_count += 1
     
     # Calculate averages
-    avg_temp = sum(temps) / len(temps) if temps else 20
-    avg_humidity = sum(humidities) / len(humidities) if humidities else 50
-    avg_wind = sum(wind_speeds) / len(wind_speeds) if wind_speeds else 2
-    avg_cloud = sum(cloud_covers) / len(cloud_covers) if cloud_covers else 50
+    avg_temp = temp_sum / temp_count if temp_count else 20
+    avg_humidity = humidity_sum / humidity_count if humidity_count else 50
+    avg_wind = wind_sum / wind_count if wind_count else 2
+    avg_cloud = cloud_sum / cloud_count if cloud_count else 50
+    
+    return _et_from_averages(avg_temp, avg_humidity, avg_wind, avg_cloud, soil_type)
+
+def calculate_evapotranspiration_batch(daily_averages: Dict[str, List[Any]], soil_type: str) -> np.ndarray:
+    """
+    Calculate estimated evapotranspiration for several days at once
     
+    Args:
+        daily_averages (dict): Per-day averages as returned by _daily_averages
+        soil_type (str): Soil type for adjustment
+        
+    Returns:
+        ndarray: Estimated evapotranspiration in mm/day for each day
+    """
+    et = _et_core(
+        np.asarray(daily_averages["temp"], dtype=np.float64),
+        np.asarray(daily_averages["humidity"], dtype=np.float64),
+        np.asarray(daily_averages["wind"], dtype=np.float64),
+        np.asarray(daily_averages["clouds"], dtype=np.float64),
+        _SOIL_PROFILE.get(soil_type, _SOIL_PROFILE["loamy"])["et_factor"]
+    )
+    
+    # Ensure reasonable range
+    return np.clip(et, 1.0, 15.0)
+
+def _et_from_averages(avg_temp: float, avg_humidity: float, avg_wind: float, avg_cloud: float, soil_type: str) -> float:
+    """
+    Calculate evapotranspiration from a day's average weather values
+    
+    Args:
+        avg_temp (float): Average temperature in Celsius
+        avg_humidity (float): Average relative humidity in percent
+        avg_wind (float): Average wind speed in m/s
+        avg_cloud (float): Average cloud cover in percent
+        soil_type (str): Soil type for adjustment
+        
+    Returns:
+        float: Estimated evapotranspiration in mm/day
+    """
+    # Calculate ET (mm/day)
+    et = _et_core(avg_temp, avg_humidity, avg_wind, avg_cloud, _SOIL_PROFILE.get(soil_type, _SOIL_PROFILE["loamy"])["et_factor"])
+    
+    # Ensure reasonable range
+    return max(1.0, min(et, 15.0))
+
+def _et_core(avg_temp, avg_humidity, avg_wind, avg_cloud, soil_factor):
+    """
+    Unclamped evapotranspiration formula
+    
+    Pure arithmetic, so it works on floats and element-wise on NumPy arrays.
+    
+    Args:
+        avg_temp (float or ndarray): Average temperature in Celsius
+        avg_humidity (float or ndarray): Average relative humidity in percent
+        avg_wind (float or ndarray): Average wind speed in m/s
+        avg_cloud (float or ndarray): Average cloud cover in percent
+        soil_factor (float): Soil adjustment multiplier
+        
+    Returns:
+        float or ndarray: Estimated evapotranspiration in mm/day
+    """
     # Adjust temperature factor (higher temp = higher ET)
     temp_factor = 0.05 * avg_temp
     
@@ -897,33 +1299,11 @@ def calculate_evapotranspiration(forecast_periods: List[Dict[str, Any]], soil_ty
     # Adjust cloud factor (lower cloud cover = higher ET)
     cloud_factor = 2 - (0.02 * avg_cloud)
     
-    # Soil adjustment (sandy soils dry faster)
-    soil_factor = 1.0
-    if soil_type == "sandy":
-        soil_factor = 1.2
-    elif soil_type == "clay":
-        soil_factor = 0.8
-    
-    # Calculate ET (mm/day)
-    et = (temp_factor + humidity_factor + wind_factor + cloud_factor) * soil_factor
-    
-    # Ensure reasonable range
-    et = max(1.0, min(et, 15.0))
-    
-    return et
+    return (temp_factor + humidity_factor + wind_factor + cloud_factor) * soil_factor
 
 def get_et_rating(et_value: float) -> str:
     """Get evapotranspiration rating based on value"""
-    if et_value < ET_THRESHOLDS["very_low"]:
-        return "very_low"
-    elif et_value < ET_THRESHOLDS["low"]:
-        return "low"
-    elif et_value < ET_THRESHOLDS["moderate"]:
-        return "moderate"
-    elif et_value < ET_THRESHOLDS["high"]:
-        return "high"
-    else:
-        return "very_high"
+    return _ET_LABELS[bisect_right(_ET_EDGES, et_value)]
 
 def get_recent_precipitation(forecast_periods: List[Dict[str, Any]]) -> float:
     """
@@ -935,17 +1315,42 @@ def get_recent_precipitation(forecast_periods: List[Dict[str, Any]]) -> float:
     Returns:
         float: Recent precipitation in mm
     """
-    precipitation = 0
+    # The 'rain' field contains precipitation data
+    return sum(period['rain']['3h'] for period in forecast_periods if 'rain' in period and '3h' in period['rain'])
+
+# Best watering times in priority order - early morning or evening
+_WATERING_SLOTS = (
+    (19, "evening"),  # 7 PM
+    (20, "evening"),  # 8 PM
+    (6, "morning"),   # 6 AM
+    (7, "morning")    # 7 AM
+)
+
+def _unsuitable_watering_hours(forecast_periods: List[Dict[str, Any]], tz_offset: int = 0) -> np.ndarray:
+    """
+    Mark the hours of a day that are bad for watering
+    
+    An hour is unsuitable when a forecast period within one hour of it has rain
+    or wind above 5 m/s.
+    
+    Args:
+        forecast_periods (list): Forecast periods for one day
+        tz_offset (int): UTC offset in seconds of the city
+        
+    Returns:
+        ndarray: Boolean array of 24 hours, True where watering should be avoided
+    """
+    unsuitable = np.zeros(24, dtype=bool)
     
     for period in forecast_periods:
-        # Check for 'rain' field which contains precipitation data
-        if 'rain' in period and '3h' in period['rain']:
-            precipitation += period['rain']['3h']
+        if 'rain' in period or period.get('wind', _EMPTY).get('speed', 0) > 5:
+            period_hour = (int(period['dt']) + tz_offset) // 3600 % 24
+            unsuitable[max(0, period_hour - 1):period_hour + 2] = True
             
-    return precipitation
+    return unsuitable
 
 def determine_best_watering_time(today_forecast: List[Dict[str, Any]], tomorrow_forecast: List[Dict[str, Any]], 
-                                soil_type: str, soil_moisture: float) -> Dict[str, Any]:
+                                soil_type: str, soil_moisture: float, tz_offset: int = 0) -> Dict[str, Any]:
     """
     Determine the best time for watering based on forecast and conditions
     
@@ -954,6 +1359,7 @@ def determine_best_watering_time(today_forecast: List[Dict[str, Any]], tomorrow_
         tomorrow_forecast (list): Tomorrow's forecast periods
         soil_type (str): Soil type
         soil_moisture (float): Current soil moisture level (0-1)
+        tz_offset (int): UTC offset in seconds of the city
         
     Returns:
         dict: Best watering time recommendation
@@ -968,7 +1374,7 @@ def determine_best_watering_time(today_forecast: List[Dict[str, Any]], tomorrow_
         }
     
     # Check for upcoming rain in the next 24 hours
-    upcoming_rain = find_upcoming_precipitation(today_forecast, tomorrow_forecast)
+    upcoming_rain = find_upcoming_precipitation(today_forecast, tomorrow_forecast, tz_offset)
     if upcoming_rain and upcoming_rain.get('expected', False) and upcoming_rain.get('amount', 0) > 5:
         return {
             "should_water": False,
@@ -978,45 +1384,22 @@ def determine_best_watering_time(today_forecast: List[Dict[str, Any]], tomorrow_
                        "Natural rainfall is better for plants than irrigation"]
         }
     
-    # Get current time
-    now = datetime.now()
-    current_hour = now.hour
+    # Get current hour in the city's local time
+    current_hour = (int(datetime.now().timestamp()) + tz_offset) // 3600 % 24
     
-    # Best watering times in priority order - early morning or evening
-    preferred_times = [
-        {"hour": 19, "period": "evening"},  # 7 PM
-        {"hour": 20, "period": "evening"},  # 8 PM
-        {"hour": 6, "period": "morning"},   # 6 AM
-        {"hour": 7, "period": "morning"}    # 7 AM
-    ]
+    # Hours with rain or strong wind, looked up once per slot below
+    unsuitable_today = _unsuitable_watering_hours(today_forecast, tz_offset)
+    unsuitable_tomorrow = _unsuitable_watering_hours(tomorrow_forecast, tz_offset)
     
     # Find the next available preferred time
-    for time_slot in preferred_times:
-        hour = time_slot["hour"]
-        period = time_slot["period"]
-        
+    for hour, period in _WATERING_SLOTS:
         # If we've passed this time today, check tomorrow unless it's evening
         if hour <= current_hour and period != "evening":
             continue
             
         # Check if this time has good conditions (no rain, not too windy)
-        good_conditions = True
-        
-        # Find the forecast period closest to this hour
-        target_forecast = today_forecast if hour > current_hour else tomorrow_forecast
-        
-        for period in target_forecast:
-            period_time = datetime.fromtimestamp(period['dt'])
-            if abs(period_time.hour - hour) <= 1:  # Within 1 hour of target
-                # Check for rain
-                if 'rain' in period:
-                    good_conditions = False
-                    break
-                    
-                # Check for wind (avoid watering when it's too windy)
-                if 'wind' in period and 'speed' in period['wind'] and period['wind']['speed'] > 5:
-                    good_conditions = False
-                    break
+        unsuitable = unsuitable_today if hour > current_hour else unsuitable_tomorrow
+        good_conditions = not unsuitable[hour]
         
         if good_conditions:
             # Convert 24h to 12h format
@@ -1026,16 +1409,15 @@ def determine_best_watering_time(today_forecast: List[Dict[str, Any]], tomorrow_
             
             day = "today" if hour > current_hour else "tomorrow"
             
-            period_display = period.capitalize() if isinstance(period, str) else "Evening"
+            period_display = period.capitalize()
             reasons = [
                 f"{period_display} watering reduces evaporation",
                 "Plants have time to dry before nightfall, reducing disease risk"
             ]
             
-            if soil_type == "sandy":
-                reasons.append("Sandy soil benefits from evening watering to retain moisture longer")
-            elif soil_type == "clay":
-                reasons.append("Clay soil benefits from morning watering to prevent waterlogging overnight")
+            soil_tip = _SOIL_PROFILE.get(soil_type, _SOIL_PROFILE["loamy"])["watering_time_tip"]
+            if soil_tip:
+                reasons.append(soil_tip)
             
             return {
                 "should_water": True,
@@ -1054,62 +1436,41 @@ def determine_best_watering_time(today_forecast: List[Dict[str, Any]], tomorrow_
         "reasons": ["Evening watering reduces evaporation", "Allows soil to absorb moisture overnight"]
     }
 
-def find_upcoming_precipitation(today_forecast: List[Dict[str, Any]], tomorrow_forecast: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _format_local_time(timestamp: float, tz_offset: int) -> str:
+    """Format a UTC timestamp as HH:MM in the city's local time"""
+    minutes = (int(timestamp) + tz_offset) // 60
+    return f"{minutes // 60 % 24:02d}:{minutes % 60:02d}"
+
+def find_upcoming_precipitation(today_forecast: List[Dict[str, Any]], tomorrow_forecast: List[Dict[str, Any]],
+                                tz_offset: int = 0) -> Dict[str, Any]:
     """
     Find upcoming precipitation events in the forecast
     
     Args:
         today_forecast (list): Today's forecast periods
         tomorrow_forecast (list): Tomorrow's forecast periods
+        tz_offset (int): UTC offset in seconds of the city
         
     Returns:
         dict: Upcoming precipitation details
     """
-    # Check today's forecast first
-    for period in today_forecast:
-        period_time = datetime.fromtimestamp(period['dt'])
-        
-        # Check for rain probability
-        pop = period.get('pop', 0)  # Probability of precipitation
-        
-        # Check for rain amount
-        rain_amount = 0
-        if 'rain' in period and '3h' in period['rain']:
-            rain_amount = period['rain']['3h']
-        
-        # If significant rain expected
-        if pop > 0.4 or rain_amount > 0:
-            return {
-                "expected": True,
-                "probability": pop * 100,  # Convert to percentage
-                "amount": rain_amount,
-                "time": period_time.strftime('%H:%M'),
-                "timeframe": "later today",
-                "timestamp": period['dt']
-            }
-    
-    # Check tomorrow's forecast
-    for period in tomorrow_forecast:
-        period_time = datetime.fromtimestamp(period['dt'])
-        
-        # Check for rain probability
-        pop = period.get('pop', 0)
-        
-        # Check for rain amount
-        rain_amount = 0
-        if 'rain' in period and '3h' in period['rain']:
-            rain_amount = period['rain']['3h']
-        
-        # If significant rain expected
-        if pop > 0.4 or rain_amount > 0:
-            return {
-                "expected": True,
-                "probability": pop * 100,
-                "amount": rain_amount,
-                "time": period_time.strftime('%H:%M'),
-                "timeframe": "tomorrow",
-                "timestamp": period['dt']
-            }
+    # Check today's forecast first, then tomorrow's
+    for timeframe, periods in (("later today", today_forecast), ("tomorrow", tomorrow_forecast)):
+        for period in periods:
+            # Check for rain probability and amount
+            pop = period.get('pop', 0)  # Probability of precipitation
+            rain_amount = period.get('rain', _EMPTY).get('3h', 0)
+            
+            # If significant rain expected
+            if pop > 0.4 or rain_amount > 0:
+                return {
+                    "expected": True,
+                    "probability": pop * 100,  # Convert to percentage
+                    "amount": rain_amount,
+                    "time": _format_local_time(period['dt'], tz_offset),
+                    "timeframe": timeframe,
+                    "timestamp": period['dt']
+                }
     
     # No significant precipitation expected
     return {
@@ -1129,9 +1490,6 @@ def calculate_soil_moisture(soil_type: str, recent_precipitation: float, evapotr
     Returns:
         float: Estimated soil moisture level (0-1 scale)
     """
-    # Get soil properties
-    soil_properties = SOIL_TYPES.get(soil_type, SOIL_TYPES["loamy"])
-    
     # Base moisture level (0-1 scale)
     base_moisture = 0.5  # Start with medium moisture
     
@@ -1145,11 +1503,7 @@ def calculate_soil_moisture(soil_type: str, recent_precipitation: float, evapotr
     moisture_loss = min(0.5, evapotranspiration * et_factor)  # Cap at 50%
     
     # Adjust for soil type
-    soil_factor = 1.0
-    if soil_type == "sandy":
-        soil_factor = 0.8  # Sandy soil holds less water
-    elif soil_type == "clay":
-        soil_factor = 1.2  # Clay soil holds more water
+    soil_factor = _SOIL_PROFILE.get(soil_type, _SOIL_PROFILE["loamy"])["moisture_factor"]
     
     # Calculate soil moisture
     soil_moisture = (base_moisture + moisture_from_precip - moisture_loss) * soil_factor
@@ -1207,16 +1561,10 @@ def generate_watering_plan(city: str, soil_type: str, soil_moisture: float, toda
             water_amount_details = "Apply about 1/4 to 1/2 inch of water"
             
         # Adjust for soil type
-        if soil_type == "sandy":
-            water_frequency = "More frequent, lighter waterings are better for sandy soil"
-        elif soil_type == "clay":
-            water_frequency = "Less frequent, deeper waterings are better for clay soil"
-        else:
-            water_frequency = "Balanced watering approach works well for loamy soil"
+        water_frequency = _SOIL_PROFILE.get(soil_type, _SOIL_PROFILE["loamy"])["watering_frequency"]
         
         # Adjust for evapotranspiration
-        et_rating = get_et_rating(today_et)
-        if et_rating in ["high", "very_high"]:
+        if today_et >= ET_THRESHOLDS["moderate"]:  # Rated high or very high
             et_note = f"High evapotranspiration ({today_et:.1f} mm/day) means plants lose moisture quickly"
         else:
             et_note = f"Moderate evapotranspiration ({today_et:.1f} mm/day) means moisture loss is typical"
@@ -1236,118 +1584,139 @@ def generate_watering_plan(city: str, soil_type: str, soil_moisture: float, toda
         "water_amount": water_amount if should_water else "No watering needed"
     }
 
-def generate_planting_recommendations(current_season: str, next_season: str, northern_hemisphere: bool) -> Dict[str, Any]:
-    """
-    Generate planting recommendations based on season and hemisphere
-    
-    Args:
-        current_season (str): Current season
-        next_season (str): Next season
-        northern_hemisphere (bool): Whether in northern hemisphere
-        
-    Returns:
-        dict: Planting recommendations
-    """
-    # Season-specific recommendations
-    spring_plants = ["Tomatoes", "Peppers", "Cucumbers", "Squash", "Beans", "Corn"]
-    summer_plants = ["Basil", "Okra", "Sweet Potatoes", "Eggplant", "Melons", "Heat-resistant Lettuce"]
-    fall_plants = ["Spinach", "Lettuce", "Kale", "Radishes", "Carrots", "Broccoli"]
-    winter_plants = ["Garlic", "Winter Onions", "Cover Crops", "Broad Beans", "Winter Lettuce"]
-    
-    recommendations = {
-        "current_season": {
-            "season": current_season,
-            "plants_to_maintain": [],
-            "harvest_soon": [],
-            "care_tips": []
-        },
-        "next_season": {
-            "season": next_season,
-            "plants_to_start": [],
-            "preparation_tips": []
-        }
-    }
-    
-    # Current season recommendations
-    if current_season == "spring":
-        recommendations["current_season"]["plants_to_maintain"] = spring_plants
-        recommendations["current_season"]["harvest_soon"] = ["Early Lettuce", "Radishes", "Spring Onions"]
-        recommendations["current_season"]["care_tips"] = [
+# Season-specific plants
+_SPRING_PLANTS = ("Tomatoes", "Peppers", "Cucumbers", "Squash", "Beans", "Corn")
+_SUMMER_PLANTS = ("Basil", "Okra", "Sweet Potatoes", "Eggplant", "Melons", "Heat-resistant Lettuce")
+_FALL_PLANTS = ("Spinach", "Lettuce", "Kale", "Radishes", "Carrots", "Broccoli")
+_WINTER_PLANTS = ("Garlic", "Winter Onions", "Cover Crops", "Broad Beans", "Winter Lettuce")
+
+# Extra spring plants suited to the southern hemisphere
+_SOUTHERN_SPRING_PLANTS = ("Artichokes", "Passion Fruit", "Subtropical Berries")
+
+# Recommendations for the season in progress
+_CURRENT_SEASON_TIPS = {
+    "spring": {
+        "plants_to_maintain": _SPRING_PLANTS,
+        "harvest_soon": ("Early Lettuce", "Radishes", "Spring Onions"),
+        "care_tips": (
             "Monitor for late frosts and protect tender seedlings",
             "Begin regular fertilization schedule",
             "Set up supports for climbing plants",
             "Thin seedlings to proper spacing"
-        ]
-    elif current_season == "summer":
-        recommendations["current_season"]["plants_to_maintain"] = summer_plants
-        recommendations["current_season"]["harvest_soon"] = ["Tomatoes", "Cucumbers", "Zucchini", "Summer Squash"]
-        recommendations["current_season"]["care_tips"] = [
+        )
+    },
+    "summer": {
+        "plants_to_maintain": _SUMMER_PLANTS,
+        "harvest_soon": ("Tomatoes", "Cucumbers", "Zucchini", "Summer Squash"),
+        "care_tips": (
             "Water deeply and consistently in morning or evening",
             "Mulch to conserve moisture",
             "Provide shade for heat-sensitive crops",
             "Monitor for pests that thrive in warm weather"
-        ]
-    elif current_season == "fall":
-        recommendations["current_season"]["plants_to_maintain"] = fall_plants
-        recommendations["current_season"]["harvest_soon"] = ["Late Tomatoes", "Peppers", "Root Vegetables"]
-        recommendations["current_season"]["care_tips"] = [
+        )
+    },
+    "fall": {
+        "plants_to_maintain": _FALL_PLANTS,
+        "harvest_soon": ("Late Tomatoes", "Peppers", "Root Vegetables"),
+        "care_tips": (
             "Protect cold-sensitive crops from early frosts",
             "Add compost to harvested areas",
             "Clean up garden debris to prevent disease carryover",
             "Reduce watering as temperatures cool"
-        ]
-    elif current_season == "winter":
-        recommendations["current_season"]["plants_to_maintain"] = winter_plants
-        recommendations["current_season"]["harvest_soon"] = ["Winter Greens", "Brussels Sprouts", "Stored Root Vegetables"]
-        recommendations["current_season"]["care_tips"] = [
+        )
+    },
+    "winter": {
+        "plants_to_maintain": _WINTER_PLANTS,
+        "harvest_soon": ("Winter Greens", "Brussels Sprouts", "Stored Root Vegetables"),
+        "care_tips": (
             "Protect overwintering crops with row covers or cold frames",
             "Monitor soil moisture in protected areas",
             "Plan next season's garden",
             "Order seeds for next growing season"
-        ]
-    
-    # Next season recommendations
-    if next_season == "spring":
-        recommendations["next_season"]["plants_to_start"] = spring_plants
-        recommendations["next_season"]["preparation_tips"] = [
+        )
+    }
+}
+
+# Recommendations for preparing the coming season
+_NEXT_SEASON_TIPS = {
+    "spring": {
+        "plants_to_start": _SPRING_PLANTS,
+        "preparation_tips": (
             "Start seeds indoors for warm-season crops",
             "Prepare soil with compost and amendments",
             "Clean and sharpen gardening tools",
             "Set up irrigation systems before planting"
-        ]
-    elif next_season == "summer":
-        recommendations["next_season"]["plants_to_start"] = summer_plants
-        recommendations["next_season"]["preparation_tips"] = [
+        )
+    },
+    "summer": {
+        "plants_to_start": _SUMMER_PLANTS,
+        "preparation_tips": (
             "Install shade cloth for heat-sensitive plants",
             "Set up consistent watering system",
             "Mulch extensively to conserve moisture",
             "Plan succession plantings for continual harvest"
-        ]
-    elif next_season == "fall":
-        recommendations["next_season"]["plants_to_start"] = fall_plants
-        recommendations["next_season"]["preparation_tips"] = [
+        )
+    },
+    "fall": {
+        "plants_to_start": _FALL_PLANTS,
+        "preparation_tips": (
             "Start seeds for fall crops in a cool, shaded area",
             "Prepare areas where summer crops will be removed",
             "Add compost to replenish soil nutrients",
             "Have frost protection ready for late season"
-        ]
-    elif next_season == "winter":
-        recommendations["next_season"]["plants_to_start"] = winter_plants
-        recommendations["next_season"]["preparation_tips"] = [
+        )
+    },
+    "winter": {
+        "plants_to_start": _WINTER_PLANTS,
+        "preparation_tips": (
             "Install cold frames or hoop houses",
             "Add heavy mulch to protect perennial crops",
             "Plant cover crops in empty beds",
             "Set up protection for winter harvests"
-        ]
+        )
+    }
+}
+
+@lru_cache(maxsize=64)
+def generate_planting_recommendations(current_season: str, next_season: str, northern_hemisphere: bool) -> Dict[str, Any]:
+    """
+    Generate planting recommendations based on season and hemisphere
+    
+    Results are cached and shared between callers, so they are returned read-only.
+    
+    Args:
+        current_season (str): Current season
+        next_season (str): Next season
+        northern_hemisphere (bool): Whether in northern hemisphere
+        
+    Returns:
+        dict: Planting recommendations (read-only mapping)
+    """
+    current = _CURRENT_SEASON_TIPS.get(current_season, _EMPTY)
+    upcoming = _NEXT_SEASON_TIPS.get(next_season, _EMPTY)
+    
+    plants_to_maintain = current.get("plants_to_maintain", ())
+    plants_to_start = upcoming.get("plants_to_start", ())
     
     # Adjust for hemisphere differences
     if not northern_hemisphere:
         # Swap some plants for southern hemisphere appropriate ones
         # This is a simplified adjustment; real recommendations would be more nuanced
-        spring_specific = ["Artichokes", "Passion Fruit", "Subtropical Berries"]
         if current_season == "spring":
-            recommendations["current_season"]["plants_to_maintain"].extend(spring_specific)
+            plants_to_maintain += _SOUTHERN_SPRING_PLANTS
         if next_season == "spring":
-            recommendations["next_season"]["plants_to_start"].extend(spring_specific)
+            plants_to_start += _SOUTHERN_SPRING_PLANTS
     
-    return recommendations
\ No newline at end of file
+    return MappingProxyType({
+        "current_season": MappingProxyType({
+            "season": current_season,
+            "plants_to_maintain": plants_to_maintain,
+            "harvest_soon": current.get("harvest_soon", ()),
+            "care_tips": current.get("care_tips", ())
+        }),
+        "next_season": MappingProxyType({
+            "season": next_season,
+            "plants_to_start": plants_to_start,
+            "preparation_tips": upcoming.get("preparation_tips", ())
+        })
+    })
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Utilities for in-process caching of upstream API responses
+"""
+import time
+import threading
+import functools
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+def ttl_cache(seconds: float, maxsize: int = 1024, key: Optional[Callable[..., Hashable]] = None,
+              cache_if: Optional[Callable[[Any], bool]] = None):
+    """
+    Memoize a function's results for a limited time
+
+    Cached values are shared between callers, so they must be treated as read-only.
+    A result of None is treated as a failed lookup and is not cached. Concurrent
+    calls with the same key wait for the first one instead of repeating the work.
+
+    Args:
+        seconds (float): How long a cached result stays valid
+        maxsize (int): Maximum number of cached entries
+        key (callable, optional): Builds the cache key from the call arguments,
+            for arguments that are not hashable. Defaults to the arguments themselves.
+        cache_if (callable, optional): Decides whether a result is stored, for results
+            that should not be reused, such as fallback data. Defaults to storing all.
+
+    Returns:
+        function: Decorator that wraps a function with a TTL cache
+    """
+    def decorator(func):
+        cache = {}
+        in_flight = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            else:
+                cache_key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(cache_key)
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+
+                # Join a call for the same key that is already running
+                pending = in_flight.get(cache_key)
+                owner = pending is None
+                if owner:
+                    pending = in_flight[cache_key] = Future()
+
+            if not owner:
+                return pending.result()
+
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    del in_flight[cache_key]
+                pending.set_exception(e)
+                raise
+
+            with lock:
+                del in_flight[cache_key]
+                if value is not None and (cache_if is None or cache_if(value)):
+                    if len(cache) >= maxsize:
+                        # Drop expired entries first, then the oldest ones
+                        for stale_key in [k for k, (expires, _) in cache.items() if expires <= now]:
+                            del cache[stale_key]
+                        while len(cache) >= maxsize:
+                            del cache[next(iter(cache))]
+                    cache[cache_key] = (now + seconds, value)
+
+            pending.set_result(value)
+            return value
+
+        def cache_clear():
+            """Remove all cached entries"""
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -3,209 +3,778 @@ Utilities for health alerts related to weather and air quality
 """
 import os
 import json
-import random
 import logging
 import datetime
-from typing import Dict, List, Optional, Union, Any
+from functools import lru_cache
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Optional, Union, Any, Tuple, Iterable, Iterator, Set
+
+import numpy as np
 
 from backend import api_utils, health_utils, weather_utils
+from backend.cache_utils import ttl_cache
 
 logger = logging.getLogger(__name__)
 
-def get_pollen_count(city: str, date: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+# Shared pool for concurrent upstream requests, reused across calls
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-alerts")
+
+# Shared random generator for the simulated forecast variations
+_rng = np.random.default_rng()
+
+# How long upstream weather and air quality responses are reused (seconds)
+UPSTREAM_CACHE_TTL = 600
+
+# How long built reports are reused (seconds), following how quickly each changes
+AQI_RISK_CACHE_TTL = 600
+UV_CACHE_TTL = 900
+POLLEN_CACHE_TTL = 1800
+COLD_FLU_CACHE_TTL = 3600
+COMPREHENSIVE_CACHE_TTL = 600
+
+# Default for the report builders' upstream data argument: fetch it through the upstream cache
+_FETCH = object()
+
+def _is_live(data: Dict[str, Any]) -> bool:
+    """Whether weather data came from the API, so it may be cached"""
+    return not weather_utils.is_simulated(data)
+
+@ttl_cache(UPSTREAM_CACHE_TTL, cache_if=_is_live)
+def _cached_weather(city: str) -> Optional[Dict[str, Any]]:
+    """Get the current weather for a city, reusing recent responses; None if unavailable, simulated fallbacks are not reused"""
+    try:
+        return weather_utils.get_city_weather(city)
+    except Exception as e:
+        logger.error(f"Error fetching weather for {city}: {e}")
+        return None
+
+@ttl_cache(UPSTREAM_CACHE_TTL)
+def _cached_aqi(city: str) -> Optional[Dict[str, Any]]:
+    """Get the air quality for a city, reusing recent responses; None if unavailable"""
+    try:
+        return api_utils.get_city_air_quality(city)
+    except Exception as e:
+        logger.error(f"Error fetching air quality for {city}: {e}")
+        return None
+
+# Pollen level adjustment by main weather condition
+_POLLEN_CONDITION_ADJUSTMENT = {
+    'rain': -2,  # Rain washes pollen away
+    'drizzle': -2,
+    'snow': -3,  # Snow suppresses pollen
+    'clear': 1  # Clear days can have higher pollen
+}
+
+# UV multiplier by main weather condition
+_UV_CONDITION_FACTOR = {
+    'rain': 0.7,  # Rain reduces UV
+    'drizzle': 0.7,
+    'snow': 0.6,  # Snow reduces UV
+    'thunderstorm': 0.5,  # Heavy clouds and rain in thunderstorms
+    'clear': 1.2  # Clear skies increase UV
+}
+
+# UV seasonal factor by month, for northern and southern hemisphere
+_UV_SEASONAL_FACTOR_N = (0.5, 0.5, 0.8, 1.2, 1.5, 1.5, 1.5, 1.5, 1.2, 0.8, 0.5, 0.5)
+_UV_SEASONAL_FACTOR_S = (1.5, 1.5, 1.2, 0.8, 0.5, 0.5, 0.5, 0.5, 0.8, 1.2, 1.5, 1.5)
+
+# Season index (0 winter, 1 spring, 2 summer, 3 fall) by month, northern hemisphere
+_SEASON_BY_MONTH = (0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0)
+
+# Active pollen types per season, dominant first, with the range of random offsets
+# from the overall level as (types, lowest offsets, highest offsets + 1)
+_POLLEN_SEASONS = (
+    # Winter (December-February): Generally low pollen, mold can be present year-round
+    (("mold", "indoor"), (-1, -2), (0, -1)),
+    # Spring (March-May): Tree pollen dominant
+    (("tree", "grass", "weed"), (0, -3, -4), (3, 0, -1)),
+    # Summer (June-August): Grass pollen dominant
+    (("grass", "weed", "tree"), (0, 0, -4), (3, 1, -1)),
+    # Fall (September-November): Weed pollen dominant
+    (("weed", "mold", "grass"), (0, 0, -3), (3, 1, 0))
+)
+
+# Cold/flu seasonal factor by month (peak Oct-Mar, minimal Jun-Jul)
+_FLU_SEASONAL_FACTOR = (3, 3, 3, 2, 1, 0, 0, 1, 2, 3, 3, 3)
+
+# (category, description, alert type) for pollen levels 1-10
+_POLLEN_LOW = ("Low", "Most people won't be affected.", "success")
+_POLLEN_MODERATE = ("Moderate", "Some individuals may experience symptoms.", "info")
+_POLLEN_HIGH = ("High", "Many people will experience symptoms.", "warning")
+_POLLEN_VERY_HIGH = ("Very High", "Most people with allergies will experience symptoms.", "danger")
+_POLLEN_CATEGORIES = (_POLLEN_LOW,) * 3 + (_POLLEN_MODERATE,) * 3 + (_POLLEN_HIGH,) * 2 + (_POLLEN_VERY_HIGH,) * 2
+
+# (category, description, color, protection needed, alert type) for UV index 0-12
+_UV_LOW = ("Low", "Low danger from the sun's UV rays.",
+           "#299501", "No protection needed.", "success")  # Green
+_UV_MODERATE = ("Moderate", "Moderate risk of harm from unprotected sun exposure.",
+                "#F7E401", "Wear sunscreen and protective clothing.", "info")  # Yellow
+_UV_HIGH = ("High", "High risk of harm from unprotected sun exposure.",
+            "#F85900", "Wear SPF 30+ sunscreen, a hat, and sunglasses.", "warning")  # Orange
+_UV_VERY_HIGH = ("Very High", "Very high risk of harm from unprotected sun exposure.",
+                 "#D8001D", "Seek shade during midday hours, wear protective clothing.", "danger")  # Red
+_UV_EXTREME = ("Extreme", "Extreme risk of harm from unprotected sun exposure.",
+               "#6B49C8", "Avoid being outside during midday hours.", "danger")  # Purple
+_UV_CATEGORIES = (_UV_LOW,) * 3 + (_UV_MODERATE,) * 3 + (_UV_HIGH,) * 2 + (_UV_VERY_HIGH,) * 3 + (_UV_EXTREME,) * 2
+
+# (category, description, alert type) for cold/flu risk values 1-10
+_FLU_LOW = ("Low", "Low risk of cold and flu in your area.", "success")
+_FLU_MODERATE = ("Moderate", "Moderate risk of cold and flu in your area.", "info")
+_FLU_HIGH = ("High", "High risk of cold and flu in your area.", "warning")
+_FLU_VERY_HIGH = ("Very High", "Very high risk of cold and flu in your area.", "danger")
+_FLU_CATEGORIES = (_FLU_LOW,) * 3 + (_FLU_MODERATE,) * 3 + (_FLU_HIGH,) * 2 + (_FLU_VERY_HIGH,) * 2
+
+# Air quality recommendations as (AQI above, AQI at most, profile predicate, text),
+# in the order they are shown; a predicate of None applies to everyone
+_NO_LIMIT = float('inf')
+_AQI_RECOMMENDATION_RULES = (
+    # Basic recommendations based on AQI
+    (150, _NO_LIMIT, None, "Avoid outdoor activities and exercise."),
+    (150, _NO_LIMIT, None, "Keep windows and doors closed."),
+    (150, _NO_LIMIT, None, "Use air purifiers indoors if available."),
+    (200, _NO_LIMIT, None, "Wear N95 masks if you must go outside."),
+    (200, _NO_LIMIT, None, "Reconsider travel plans in the area."),
+    (100, 150, None, "Reduce prolonged or heavy outdoor exertion."),
+    (100, 150, None, "Take more breaks during outdoor activities."),
+    (100, 150, None, "Watch for symptoms like coughing or shortness of breath."),
+    (50, 100, None, "Unusually sensitive individuals should consider reducing prolonged outdoor exertion."),
+    (-_NO_LIMIT, 50, None, "Air quality is good. It's a great day for outdoor activities."),
+    
+    # Personalized recommendations based on health concerns
+    (50, _NO_LIMIT, lambda concerns, activity, age: 'asthma' in concerns,
+     "Asthma sufferers: Keep rescue inhaler nearby."),
+    (100, _NO_LIMIT, lambda concerns, activity, age: 'asthma' in concerns,
+     "Asthma sufferers: Consider staying indoors with air filtration."),
+    (50, _NO_LIMIT, lambda concerns, activity, age: 'copd' in concerns,
+     "COPD sufferers: Monitor breathing closely and limit outdoor exposure."),
+    (100, _NO_LIMIT, lambda concerns, activity, age: 'copd' in concerns,
+     "COPD sufferers: Stay indoors and ensure medications are available."),
+    (100, _NO_LIMIT, lambda concerns, activity, age: 'heart_disease' in concerns,
+     "Heart disease patients: Avoid strenuous activities outdoors."),
+    (50, _NO_LIMIT, lambda concerns, activity, age: 'allergies' in concerns,
+     "Allergy sufferers: Consider taking antihistamines before going outside."),
+    
+    # Activity-specific recommendations
+    (50, _NO_LIMIT, lambda concerns, activity, age: activity == 'high',
+     "Consider moving intensive exercise indoors or reducing intensity."),
+    (100, _NO_LIMIT, lambda concerns, activity, age: activity == 'high',
+     "Reschedule outdoor workouts or competitions to a day with better air quality."),
+    
+    # Age-specific recommendations
+    (100, _NO_LIMIT, lambda concerns, activity, age: age == 'child',
+     "Children should limit outdoor play time."),
+    (100, _NO_LIMIT, lambda concerns, activity, age: age == 'senior',
+     "Seniors should stay indoors and keep windows closed.")
+)
+
+# Air quality risk adjustment per health concern, activity level and age group
+_CONCERN_RISK_WEIGHTS = {'asthma': 1, 'copd': 2, 'heart_disease': 1, 'allergies': 1}
+_ACTIVITY_RISK_ADJUSTMENT = {'high': 1, 'low': -1}
+_AGE_RISK_ADJUSTMENT = {'child': 1, 'senior': 1}
+
+# Personalized AQI category by standard category, as (minimum risk adjustment,
+# category, alert type) rows checked in order
+_AQI_ESCALATION = {
+    'Good': ((3, 'Moderate', 'info'),
+             (-_NO_LIMIT, 'Good', 'success')),
+    'Moderate': ((2, 'Unhealthy for Sensitive Groups', 'warning'),
+                 (-_NO_LIMIT, 'Moderate', 'info')),
+    'Unhealthy for Sensitive Groups': ((1, 'Unhealthy', 'danger'),
+                                       (-_NO_LIMIT, 'Unhealthy for Sensitive Groups', 'warning')),
+    'Unhealthy': ((-_NO_LIMIT, 'Unhealthy', 'danger'),),
+    'Very Unhealthy': ((-_NO_LIMIT, 'Hazardous', 'danger'),),
+    'Hazardous': ((-_NO_LIMIT, 'Hazardous', 'danger'),)
+}
+
+def _extract_weather(weather_data: Dict[str, Any]) -> Tuple[float, float, float, float, str, float, float]:
     """
-    Get pollen count for a specific city and date
+    Pull the fields used by the health reports out of a current weather response
     
     Args:
-        city (str): City name
-        date (datetime, optional): Date for pollen count. Defaults to current date.
+        weather_data (dict): Current weather data for the city
+        
+    Returns:
+        tuple: temperature, humidity, wind speed, cloud coverage (%),
+               lower-cased main condition, latitude and longitude
+    """
+    main = weather_data.get('main') or {}
+    coord = weather_data.get('coord') or {}
+    condition = (weather_data.get('weather') or [{}])[0].get('main', '').lower()
+    return (
+        main.get('temp', 20),
+        main.get('humidity', 50),
+        (weather_data.get('wind') or {}).get('speed', 5),
+        (weather_data.get('clouds') or {}).get('all', 50),
+        condition,
+        coord.get('lat', 0),
+        coord.get('lon', 0)
+    )
+
+def _as_date(value: Union[datetime.datetime, datetime.date]) -> datetime.date:
+    """Get the calendar date of a date or datetime"""
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+@lru_cache(maxsize=16)
+def _forecast_dates(start: datetime.date) -> Tuple[str, ...]:
+    """
+    Get the ISO dates of the 7 days following a date
+    
+    Pollen, UV and cold/flu forecasts for the same day share the result.
+    
+    Args:
+        start (date): Day the forecast is made on
+        
+    Returns:
+        tuple: "YYYY-MM-DD" strings for the next 7 days
+    """
+    return tuple((start + datetime.timedelta(days=i)).isoformat() for i in range(1, 8))
+
+def _smooth_levels(base: float, variations: List[float], low: int, high: int) -> List[int]:
+    """
+    Turn daily variations of a base level into trend-smoothed forecast levels
+    
+    Each day is blended 70/30 with the previous day's level so the forecast
+    forms trends rather than random jumps, then clamped and rounded.
+    
+    Args:
+        base (float): Today's level
+        variations (list): Relative variation for each forecast day
+        low (int): Lowest allowed level
+        high (int): Highest allowed level
+        
+    Returns:
+        list: Forecast level for each day
+    """
+    previous = round(max(low, min(high, base * variations[0])))
+    levels = [previous]
+    for variation in variations[1:]:
+        previous = round(max(low, min(high, base * variation * 0.7 + previous * 0.3)))
+        levels.append(previous)
+        
+    return levels
+
+def _smoothed_forecast(base: float, near_spread: float, far_spread: float, low: int, high: int) -> List[int]:
+    """
+    Project a level over the next 7 days with realistic, trend-smoothed variation
+    
+    Args:
+        base (float): Today's level
+        near_spread (float): Relative variation for the first 3 days (0.1 = ±10%)
+        far_spread (float): Relative variation for the remaining 4 days
+        low (int): Lowest allowed level
+        high (int): Highest allowed level
+        
+    Returns:
+        list: Forecast level for each of the next 7 days
+    """
+    # Short term varies less than longer term
+    spread = np.array((near_spread,) * 3 + (far_spread,) * 4)
+    variations = _rng.uniform(1 - spread, 1 + spread).tolist()
+    
+    return _smooth_levels(base, variations, low, high)
+
+# Report builders working on already fetched weather and air quality data
+
+def _pollen_from(weather_data: Dict[str, Any], date: datetime.datetime) -> Dict[str, Any]:
+    """
+    Derive pollen count data from the current weather
+    
+    Args:
+        weather_data (dict): Current weather data for the city
+        date (datetime): Date for pollen count
         
     Returns:
         dict: Pollen count data
     """
-    try:
-        if date is None:
-            date = datetime.datetime.now()
-            
-        # Get weather and air quality data to derive pollen conditions
-        weather_data = weather_utils.get_city_weather(city)
-        aqi_data = api_utils.get_city_air_quality(city)
-        
-        # Base pollen factors on weather conditions
-        temperature = weather_data.get('main', {}).get('temp', 20)
-        humidity = weather_data.get('main', {}).get('humidity', 50)
-        wind_speed = weather_data.get('wind', {}).get('speed', 5)
-        weather_condition = weather_data.get('weather', [{}])[0].get('main', '').lower()
-        
-        # Calculate base pollen level based on weather
-        base_pollen_level = 3  # Default moderate level
-
-        # Adjust for temperature (higher temps generally increase pollen)
-        if temperature > 30:
-            base_pollen_level += 2
-        elif temperature > 25:
-            base_pollen_level += 1
-        elif temperature < 10:
-            base_pollen_level -= 1
-            
-        # Adjust for humidity (higher humidity can reduce some pollen)
-        if humidity > 80:
-            base_pollen_level -= 1
-        elif humidity < 30:
-            base_pollen_level += 1
-            
-        # Adjust for wind (higher wind spreads pollen)
-        if wind_speed > 20:
-            base_pollen_level += 2
-        elif wind_speed > 10:
-            base_pollen_level += 1
-            
-        # Adjust for weather conditions
-        if 'rain' in weather_condition or 'drizzle' in weather_condition:
-            base_pollen_level -= 2  # Rain washes pollen away
-        elif 'snow' in weather_condition:
-            base_pollen_level -= 3  # Snow suppresses pollen
-        elif 'clear' in weather_condition:
-            base_pollen_level += 1  # Clear days can have higher pollen
+    # Base pollen factors on weather conditions
+    temperature, humidity, wind_speed, _, weather_condition, _, _ = _extract_weather(weather_data)
+    
+    # Calculate base pollen level based on weather
+    base_pollen_level = 3  # Default moderate level
+
+    # Adjust for temperature (higher temps generally increase pollen)
+    if temperature > 30:
+        base_pollen_level += 2
+    elif temperature > 25:
+        base_pollen_level += 1
+    elif temperature < 10:
+        base_pollen_level -= 1
+        
+    # Adjust for humidity (higher humidity can reduce some pollen)
+    if humidity > 80:
+        base_pollen_level -= 1
+    elif humidity < 30:
+        base_pollen_level += 1
+        
+    # Adjust for wind (higher wind spreads pollen)
+    if wind_speed > 20:
+        base_pollen_level += 2
+    elif wind_speed > 10:
+        base_pollen_level += 1
+        
+    # Adjust for weather conditions
+    base_pollen_level += _POLLEN_CONDITION_ADJUSTMENT.get(weather_condition, 0)
+        
+    # Ensure pollen level is within range 1-10
+    overall_pollen_level = max(1, min(10, base_pollen_level))
+    
+    # Determine category based on level
+    category, description, alert_type = _POLLEN_CATEGORIES[overall_pollen_level - 1]
+        
+    # Different pollen types based on month, each randomly offset from the overall level
+    pollen_types, offset_low, offset_high = _POLLEN_SEASONS[_SEASON_BY_MONTH[date.month - 1]]
+    offsets = _rng.integers(offset_low, offset_high).tolist()
+    active_pollen_types = list(pollen_types)
+    pollen_levels = {
+        pollen_type: max(1, min(10, overall_pollen_level + offset))
+        for pollen_type, offset in zip(pollen_types, offsets)
+    }
+        
+    # Generate recommendations based on pollen level and types
+    recommendations = []
+    
+    if overall_pollen_level > 6:
+        recommendations.append("Keep windows closed to prevent pollen from entering your home.")
+        recommendations.append("Use air purifiers indoors to reduce airborne pollen.")
+        recommendations.append("Consider wearing a mask when outdoors for extended periods.")
+        
+        if "tree" in active_pollen_types and pollen_levels["tree"] > 6:
+            recommendations.append("Tree pollen is high. Limit exposure to wooded areas.")
+        
+        if "grass" in active_pollen_types and pollen_levels["grass"] > 6:
+            recommendations.append("Grass pollen is high. Avoid freshly cut lawns.")
             
-        # Ensure pollen level is within range 1-10
-        overall_pollen_level = max(1, min(10, base_pollen_level))
-        
-        # Determine category based on level
-        if overall_pollen_level <= 3:
-            category = "Low"
-            description = "Most people won't be affected."
-            alert_type = "success"
-        elif overall_pollen_level <= 6:
-            category = "Moderate"
-            description = "Some individuals may experience symptoms."
-            alert_type = "info"
-        elif overall_pollen_level <= 8:
-            category = "High"
-            description = "Many people will experience symptoms."
-            alert_type = "warning"
-        else:
-            category = "Very High"
-            description = "Most people with allergies will experience symptoms."
-            alert_type = "danger"
+        if "weed" in active_pollen_types and pollen_levels["weed"] > 6:
+            recommendations.append("Weed pollen is high. Be cautious in areas with unmanaged vegetation.")
             
-        # Different pollen types based on month
-        month = date.month
-        active_pollen_types = []
-        
-        # Spring (March-May): Tree pollen dominant
-        if 3 <= month <= 5:
-            active_pollen_types = ["tree", "grass", "weed"]
-            # Tree pollen highest in spring
-            pollen_levels = {
-                "tree": min(10, overall_pollen_level + random.randint(0, 2)),
-                "grass": max(1, overall_pollen_level - random.randint(1, 3)),
-                "weed": max(1, overall_pollen_level - random.randint(2, 4))
-            }
-        # Summer (June-August): Grass pollen dominant
-        elif 6 <= month <= 8:
-            active_pollen_types = ["grass", "weed", "tree"]
-            # Grass pollen highest in summer
-            pollen_levels = {
-                "grass": min(10, overall_pollen_level + random.randint(0, 2)),
-                "weed": min(10, overall_pollen_level),
-                "tree": max(1, overall_pollen_level - random.randint(2, 4))
-            }
-        # Fall (September-November): Weed pollen dominant
-        elif 9 <= month <= 11:
-            active_pollen_types = ["weed", "mold", "grass"]
-            # Weed pollen highest in fall
-            pollen_levels = {
-                "weed": min(10, overall_pollen_level + random.randint(0, 2)),
-                "mold": min(10, overall_pollen_level),
-                "grass": max(1, overall_pollen_level - random.randint(1, 3))
-            }
-        # Winter (December-February): Generally low pollen, mold can be present
-        else:
-            active_pollen_types = ["mold", "indoor"]
-            # Mold can be present year-round
-            pollen_levels = {
-                "mold": max(1, overall_pollen_level - 1),
-                "indoor": max(1, overall_pollen_level - 2)
-            }
+        if "mold" in active_pollen_types and pollen_levels["mold"] > 6:
+            recommendations.append("Mold spores are high. Be cautious in damp outdoor areas.")
             
-        # Generate recommendations based on pollen level and types
-        recommendations = []
+    elif overall_pollen_level > 3:
+        recommendations.append("Consider taking preventative allergy medication.")
+        recommendations.append("Shower after spending time outdoors to wash off pollen.")
+        
+        if "indoor" in active_pollen_types and pollen_levels["indoor"] > 3:
+            recommendations.append("Indoor allergens may be elevated. Keep your home clean and dust-free.")
+    else:
+        recommendations.append("Pollen levels are low. Good time for outdoor activities for allergy sufferers.")
         
-        if overall_pollen_level > 6:
-            recommendations.append("Keep windows closed to prevent pollen from entering your home.")
-            recommendations.append("Use air purifiers indoors to reduce airborne pollen.")
-            recommendations.append("Consider wearing a mask when outdoors for extended periods.")
+    # Generate 7-day forecast with realistic variations
+    levels = _smoothed_forecast(overall_pollen_level, 0.15, 0.3, 1, 10)
+    forecast = [
+        {"date": day, "level": level}
+        for day, level in zip(_forecast_dates(_as_date(date)), levels)
+    ]
+        
+    return {
+        "overall_level": overall_pollen_level,
+        "level_category": category,
+        "level_description": description,
+        "alert_type": alert_type,
+        "active_pollen_types": active_pollen_types,
+        "pollen_levels": pollen_levels,
+        "recommendations": recommendations,
+        "forecast": forecast
+    }
+
+def _uv_from(weather_data: Dict[str, Any], date: datetime.datetime) -> Dict[str, Any]:
+    """
+    Derive UV index data from the current weather
+    
+    Args:
+        weather_data (dict): Current weather data for the city
+        date (datetime): Date for UV index
+        
+    Returns:
+        dict: UV index data
+    """
+    # Base UV index on weather and seasonal factors
+    # Cloud coverage (%) and coordinates for solar intensity calculation
+    _, _, _, clouds, weather_condition, lat, lon = _extract_weather(weather_data)
+    
+    # Seasonal factor based on month (southern hemisphere seasons are reversed)
+    seasonal_factor = (_UV_SEASONAL_FACTOR_N if lat >= 0 else _UV_SEASONAL_FACTOR_S)[date.month - 1]
             
-            if "tree" in active_pollen_types and pollen_levels["tree"] > 6:
-                recommendations.append("Tree pollen is high. Limit exposure to wooded areas.")
+    # Base UV level (0-11 scale)
+    base_uv = 6 * seasonal_factor  # Mid-range starting point
+    
+    # Adjust for cloud coverage
+    cloud_factor = 1.0 - (clouds / 100.0) * 0.8  # Clouds can block up to 80% of UV
+    
+    # Adjust for weather conditions
+    weather_factor = _UV_CONDITION_FACTOR.get(weather_condition, 1.0)
+        
+    # Calculate final UV index
+    uv_index = round(base_uv * cloud_factor * weather_factor)
+    
+    # Ensure within scale (0-11+)
+    uv_index = max(0, min(12, uv_index))
+    
+    # UV index categories
+    category, description, color, protection_needed, alert_type = _UV_CATEGORIES[uv_index]
+        
+    # Generate recommendations based on UV index
+    recommendations = []
+    
+    if uv_index > 2:
+        recommendations.append("Apply sunscreen with SPF appropriate for your skin type.")
+        
+        if uv_index > 5:
+            recommendations.append("Wear protective clothing, a wide-brimmed hat, and UV-blocking sunglasses.")
+            recommendations.append("Seek shade between 10am and 4pm when UV is strongest.")
             
-            if "grass" in active_pollen_types and pollen_levels["grass"] > 6:
-                recommendations.append("Grass pollen is high. Avoid freshly cut lawns.")
+            if uv_index > 7:
+                recommendations.append("Reapply sunscreen every 2 hours, especially after swimming or sweating.")
+                recommendations.append("Consider UV-protective clothing with UPF rating.")
                 
-            if "weed" in active_pollen_types and pollen_levels["weed"] > 6:
-                recommendations.append("Weed pollen is high. Be cautious in areas with unmanaged vegetation.")
-                
-            if "mold" in active_pollen_types and pollen_levels["mold"] > 6:
-                recommendations.append("Mold spores are high. Be cautious in damp outdoor areas.")
-                
-        elif overall_pollen_level > 3:
-            recommendations.append("Consider taking preventative allergy medication.")
-            recommendations.append("Shower after spending time outdoors to wash off pollen.")
-            
-            if "indoor" in active_pollen_types and pollen_levels["indoor"] > 3:
-                recommendations.append("Indoor allergens may be elevated. Keep your home clean and dust-free.")
-        else:
-            recommendations.append("Pollen levels are low. Good time for outdoor activities for allergy sufferers.")
+                if uv_index > 10:
+                    recommendations.append("Minimize outdoor activities during midday hours.")
+                    recommendations.append("Check for UV alerts in your weather forecasts.")
+    else:
+        recommendations.append("You can safely stay outside with minimal protection.")
+        
+    # Generate 7-day forecast with realistic variations
+    levels = _smoothed_forecast(uv_index, 0.1, 0.2, 0, 12)
+    forecast = [
+        {"date": day, "uv_index": level}
+        for day, level in zip(_forecast_dates(_as_date(date)), levels)
+    ]
+        
+    return {
+        "uv_index": uv_index,
+        "category": category,
+        "description": description,
+        "color": color,
+        "protection_needed": protection_needed,
+        "alert_type": alert_type,
+        "recommendations": recommendations,
+        "forecast": forecast
+    }
+
+def _cold_flu_from(weather_data: Dict[str, Any], date: datetime.datetime) -> Dict[str, Any]:
+    """
+    Derive cold and flu risk data from the current weather
+    
+    Args:
+        weather_data (dict): Current weather data for the city
+        date (datetime): Date for cold/flu risk
+        
+    Returns:
+        dict: Cold and flu risk data
+    """
+    # Factors affecting cold/flu risk
+    temperature, humidity, _, _, _, _, _ = _extract_weather(weather_data)
+    
+    # Base risk on weather, seasonal, and other factors
+    # Temperature: Cold weather tends to increase risk
+    temp_factor = 0
+    if temperature < 0:
+        temp_factor = 3  # Very cold
+    elif temperature < 10:
+        temp_factor = 2  # Cold
+    elif temperature < 20:
+        temp_factor = 1  # Cool
+    else:
+        temp_factor = 0  # Warm or hot
+        
+    # Humidity: Very dry or very humid conditions can increase risk
+    humidity_factor = 0
+    if humidity < 30:
+        humidity_factor = 2  # Very dry
+    elif humidity > 80:
+        humidity_factor = 1  # Very humid
+    else:
+        humidity_factor = 0  # Moderate humidity
+        
+    # Seasonal factor (northern hemisphere flu season)
+    seasonal_factor = _FLU_SEASONAL_FACTOR[date.month - 1]
+        
+    # Calculate overall risk (1-10 scale)
+    base_risk = temp_factor + humidity_factor + seasonal_factor
+    
+    # Add some randomness to represent local outbreaks, etc.
+    random_factor = int(_rng.integers(0, 3))
+    
+    risk_value = base_risk + random_factor
+    
+    # Ensure within scale (1-10)
+    risk_value = max(1, min(10, risk_value))
+    
+    # Risk categories
+    category, description, alert_type = _FLU_CATEGORIES[risk_value - 1]
+        
+    # Generate symptoms to watch for
+    symptoms = []
+    if risk_value > 3:
+        symptoms = [
+            "Fever or feeling feverish/chills",
+            "Cough",
+            "Sore throat",
+            "Runny or stuffy nose",
+            "Muscle or body aches",
+            "Headaches",
+            "Fatigue (tiredness)"
+        ]
+        
+    # Generate recommendations based on risk level
+    recommendations = []
+    
+    if risk_value > 6:
+        recommendations.append("Wash hands frequently with soap and water for at least 20 seconds.")
+        recommendations.append("Avoid close contact with people who are sick.")
+        recommendations.append("Consider wearing a mask in crowded indoor spaces.")
+        recommendations.append("Get your seasonal flu vaccination if you haven't already.")
+        recommendations.append("Boost your immune system with vitamin-rich foods and sufficient sleep.")
+        
+        if risk_value > 8:
+            recommendations.append("Avoid unnecessary travel to high-risk areas.")
+            recommendations.append("Consider limiting time in crowded public places.")
+            recommendations.append("Keep sanitizer with you when out in public.")
+    elif risk_value > 3:
+        recommendations.append("Wash hands regularly, especially before eating.")
+        recommendations.append("Avoid touching your face, eyes, nose, and mouth.")
+        recommendations.append("Consider getting a flu shot if you haven't already.")
+    else:
+        recommendations.append("Practice normal hygiene like regular handwashing.")
+        recommendations.append("Stay home if you feel unwell to prevent spreading illness.")
+        
+    # Generate 7-day forecast with realistic variations
+    levels = _smoothed_forecast(risk_value, 0.1, 0.2, 1, 10)
+    forecast = [
+        {"date": day, "risk": level}
+        for day, level in zip(_forecast_dates(_as_date(date)), levels)
+    ]
+        
+    return {
+        "risk_value": risk_value,
+        "risk_category": category,
+        "risk_description": description,
+        "alert_type": alert_type,
+        "symptoms": symptoms,
+        "recommendations": recommendations,
+        "forecast": forecast
+    }
+
+def _aqi_risk_from(aqi_data: Dict[str, Any], health_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Derive the personalized air quality health risk from air quality data
+    
+    Args:
+        aqi_data (dict): Air quality data for the city
+        health_profile (dict, optional): User health profile. Defaults to None.
+        
+    Returns:
+        dict: Air quality health risk data
+    """
+    # Get AQI value
+    aqi = aqi_data.get('aqi', 50)
+    
+    # Default health profile if none provided
+    if health_profile is None:
+        health_profile = {
+            'health_concerns': [],
+            'activity_level': 'moderate',
+            'age_group': 'adult'
+        }
+        
+    # Get standard AQI category
+    aqi_category = health_utils.get_aqi_category(aqi)
+    
+    # Determine personalized risk based on health profile
+    health_concerns = frozenset(health_profile.get('health_concerns', ()))
+    activity_level = health_profile.get('activity_level', 'moderate')
+    age_group = health_profile.get('age_group', 'adult')
+    
+    # Adjust risk based on health concerns, activity level and age group
+    risk_adjustment = (
+        sum(weight for concern, weight in _CONCERN_RISK_WEIGHTS.items() if concern in health_concerns)
+        + _ACTIVITY_RISK_ADJUSTMENT.get(activity_level, 0)
+        + _AGE_RISK_ADJUSTMENT.get(age_group, 0)
+    )
+        
+    # Determine personalized health risk category
+    personalized_category, personalized_alert_type = aqi_category, 'success'
+    for min_adjustment, category, alert_type in _AQI_ESCALATION.get(aqi_category, ()):
+        if risk_adjustment >= min_adjustment:
+            personalized_category, personalized_alert_type = category, alert_type
+            break
+        
+    # Generate recommendations based on air quality and health profile
+    recommendations = []
+    seen = set()
+    
+    def add(recommendation: str) -> None:
+        # Skip duplicates as they are added
+        if recommendation not in seen:
+            seen.add(recommendation)
+            recommendations.append(recommendation)
+    
+    for low, high, applies, recommendation in _AQI_RECOMMENDATION_RULES:
+        if low < aqi <= high and (applies is None or applies(health_concerns, activity_level, age_group)):
+            add(recommendation)
             
-        # Generate 7-day forecast with realistic variations
-        forecast = []
-        for i in range(1, 8):
-            forecast_date = date + datetime.timedelta(days=i)
-            # Create realistic variations (±30% with trend smoothing)
-            if i <= 3:
-                # Short term: less variation
-                variation = random.uniform(0.85, 1.15)
-            else:
-                # Longer term: more variation
-                variation = random.uniform(0.7, 1.3)
-                
-            # Smooth the variations to create trends rather than random jumps
-            if i > 1:
-                # Blend with previous day for smoothness
-                previous_level = forecast[i-2]["level"]
-                forecasted_level = round(max(1, min(10, overall_pollen_level * variation * 0.7 + previous_level * 0.3)))
-            else:
-                forecasted_level = round(max(1, min(10, overall_pollen_level * variation)))
-                
-            forecast.append({
-                "date": forecast_date.strftime("%Y-%m-%d"),
-                "level": forecasted_level
-            })
+    return {
+        "aqi": aqi,
+        "aqi_category": personalized_category,
+        "alert_type": personalized_alert_type,
+        "recommendations": recommendations,
+        "pollutants": aqi_data.get('pollutants', {}),
+        "main_pollutant": health_utils.get_main_pollutant(aqi_data.get('pollutants', {}))
+    }
+
+# Fallback reports used when a lookup fails; shared between calls, so read-only
+_DEFAULT_POLLEN = MappingProxyType({
+    "overall_level": 3,
+    "level_category": "Moderate",
+    "level_description": "Could not get precise pollen data.",
+    "alert_type": "info",
+    "active_pollen_types": ("tree", "grass"),
+    "pollen_levels": MappingProxyType({"tree": 3, "grass": 3}),
+    "recommendations": ("Keep windows closed during high pollen days.",
+                        "Check local pollen forecasts regularly."),
+    "forecast": ()
+})
+
+_DEFAULT_UV = MappingProxyType({
+    "uv_index": 4,
+    "category": "Moderate",
+    "description": "Moderate risk of harm from unprotected sun exposure.",
+    "color": "#F7E401",
+    "protection_needed": "Wear sunscreen and protective clothing.",
+    "alert_type": "info",
+    "recommendations": ("Apply sunscreen with SPF appropriate for your skin type.",
+                        "Wear protective clothing, a hat, and sunglasses."),
+    "forecast": ()
+})
+
+_DEFAULT_COLD_FLU = MappingProxyType({
+    "risk_value": 4,
+    "risk_category": "Moderate",
+    "risk_description": "Moderate risk of cold and flu in your area.",
+    "alert_type": "info",
+    "symptoms": ("Fever or feeling feverish/chills", "Cough", "Sore throat"),
+    "recommendations": ("Wash hands regularly, especially before eating.",
+                        "Avoid touching your face, eyes, nose, and mouth."),
+    "forecast": ()
+})
+
+_DEFAULT_AQI_RISK = MappingProxyType({
+    "aqi": 50,
+    "aqi_category": "Moderate",
+    "alert_type": "info",
+    "recommendations": (
+        "Unusually sensitive individuals should consider reducing prolonged outdoor exertion.",
+        "Watch for symptoms like coughing or shortness of breath.",
+        "Check local air quality forecasts for updates."
+    ),
+    "pollutants": MappingProxyType({}),
+    "main_pollutant": "PM2.5"
+})
+
+def _city_day_key(city: str, date: Optional[datetime.datetime] = None,
+                  weather_data: Any = None) -> Tuple[str, datetime.date]:
+    """Cache key for reports that depend on the city and calendar day; the weather data is not part of it"""
+    return city, _as_date(date) if date is not None else datetime.date.today()
+
+def _city_profile_key(city: str, health_profile: Optional[Dict[str, Any]] = None,
+                      aqi_data: Any = None) -> Tuple[str, Any]:
+    """Cache key for reports that depend on the city and health profile; the AQI data is not part of it"""
+    if health_profile is None:
+        return city, None
+    return city, (
+        frozenset(health_profile.get('health_concerns') or ()),
+        health_profile.get('activity_level', 'moderate'),
+        health_profile.get('age_group', 'adult')
+    )
+
+def _marked(report: Dict[str, Any], weather_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Mark a report built from simulated weather as simulated, so it isn't cached"""
+    return weather_utils.SimulatedData(report) if weather_utils.is_simulated(weather_data) else report
+
+@ttl_cache(POLLEN_CACHE_TTL, key=_city_day_key, cache_if=_is_live)
+def _cached_pollen_count(city: str, date: Optional[datetime.datetime] = None,
+                         weather_data: Any = _FETCH) -> Optional[Dict[str, Any]]:
+    """Build the pollen report for a city and day, reusing recent results; None if unavailable, simulated reports are not reused"""
+    if weather_data is _FETCH:
+        weather_data = _cached_weather(city)
+    if weather_data is None:
+        return None
+        
+    try:
+        if date is None:
+            date = datetime.datetime.now()
             
-        return {
-            "overall_level": overall_pollen_level,
-            "level_category": category,
-            "level_description": description,
-            "alert_type": alert_type,
-            "active_pollen_types": active_pollen_types,
-            "pollen_levels": pollen_levels,
-            "recommendations": recommendations,
-            "forecast": forecast
-        }
+        return _marked(_pollen_from(weather_data, date), weather_data)
     except Exception as e:
         logger.error(f"Error getting pollen count for {city}: {e}")
-        return {
-            "overall_level": 3,
-            "level_category": "Moderate",
-            "level_description": "Could not get precise pollen data.",
-            "alert_type": "info",
-            "active_pollen_types": ["tree", "grass"],
-            "pollen_levels": {"tree": 3, "grass": 3},
-            "recommendations": ["Keep windows closed during high pollen days.", 
-                                "Check local pollen forecasts regularly."],
-            "forecast": []
-        }
+        return None
+
+@ttl_cache(UV_CACHE_TTL, key=_city_day_key, cache_if=_is_live)
+def _cached_uv_index(city: str, date: Optional[datetime.datetime] = None,
+                     weather_data: Any = _FETCH) -> Optional[Dict[str, Any]]:
+    """Build the UV index report for a city and day, reusing recent results; None if unavailable, simulated reports are not reused"""
+    if weather_data is _FETCH:
+        weather_data = _cached_weather(city)
+    if weather_data is None:
+        return None
+        
+    try:
+        if date is None:
+            date = datetime.datetime.now()
+            
+        return _marked(_uv_from(weather_data, date), weather_data)
+    except Exception as e:
+        logger.error(f"Error getting UV index for {city}: {e}")
+        return None
+
+@ttl_cache(COLD_FLU_CACHE_TTL, key=_city_day_key, cache_if=_is_live)
+def _cached_cold_flu_risk(city: str, date: Optional[datetime.datetime] = None,
+                          weather_data: Any = _FETCH) -> Optional[Dict[str, Any]]:
+    """Build the cold/flu risk report for a city and day, reusing recent results; None if unavailable, simulated reports are not reused"""
+    if weather_data is _FETCH:
+        weather_data = _cached_weather(city)
+    if weather_data is None:
+        return None
+        
+    try:
+        if date is None:
+            date = datetime.datetime.now()
+            
+        return _marked(_cold_flu_from(weather_data, date), weather_data)
+    except Exception as e:
+        logger.error(f"Error getting cold/flu risk for {city}: {e}")
+        return None
+
+@ttl_cache(AQI_RISK_CACHE_TTL, key=_city_profile_key)
+def _cached_air_quality_health_risk(city: str, health_profile: Optional[Dict[str, Any]] = None,
+                                    aqi_data: Any = _FETCH) -> Optional[Dict[str, Any]]:
+    """Build the air quality risk report for a city and profile, reusing recent results; None if unavailable"""
+    if aqi_data is _FETCH:
+        aqi_data = _cached_aqi(city)
+    if aqi_data is None:
+        return None
+        
+    try:
+        return _aqi_risk_from(aqi_data, health_profile)
+    except Exception as e:
+        logger.error(f"Error getting air quality health risk for {city}: {e}")
+        return None
+
+def get_pollen_count(city: str, date: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+    """
+    Get pollen count for a specific city and date
+    
+    Args:
+        city (str): City name
+        date (datetime, optional): Date for pollen count. Defaults to current date.
+        
+    Returns:
+        dict: Pollen count data
+    """
+    pollen = _cached_pollen_count(city, date)
+    return _DEFAULT_POLLEN if pollen is None else pollen
 
 def get_uv_index(city: str, date: Optional[datetime.datetime] = None) -> Dict[str, Any]:
     """
@@ -218,169 +787,8 @@ def get_uv_index(city: str, date: Optional[datetime.datetime] = None) -> Dict[st
     Returns:
         dict: UV index data
     """
-    try:
-        if date is None:
-            date = datetime.datetime.now()
-            
-        # Get weather data
-        weather_data = weather_utils.get_city_weather(city)
-        
-        # Base UV index on weather and seasonal factors
-        clouds = weather_data.get('clouds', {}).get('all', 50)  # Cloud coverage (%)
-        weather_condition = weather_data.get('weather', [{}])[0].get('main', '').lower()
-        
-        # Get coordinates for solar intensity calculation
-        lat = weather_data.get('coord', {}).get('lat', 0)
-        lon = weather_data.get('coord', {}).get('lon', 0)
-        
-        # Seasonal factor based on month
-        month = date.month
-        seasonal_factor = 1.0
-        
-        # Northern hemisphere seasons
-        if lat >= 0:
-            if 5 <= month <= 8:  # Summer
-                seasonal_factor = 1.5
-            elif month in [4, 9]:  # Late spring, early fall
-                seasonal_factor = 1.2
-            elif month in [3, 10]:  # Early spring, late fall
-                seasonal_factor = 0.8
-            else:  # Winter
-                seasonal_factor = 0.5
-        # Southern hemisphere seasons (reversed)
-        else:
-            if 11 <= month <= 12 or 1 <= month <= 2:  # Summer
-                seasonal_factor = 1.5
-            elif month in [3, 10]:  # Late spring, early fall
-                seasonal_factor = 1.2
-            elif month in [4, 9]:  # Early spring, late fall
-                seasonal_factor = 0.8
-            else:  # Winter
-                seasonal_factor = 0.5
-                
-        # Base UV level (0-11 scale)
-        base_uv = 6 * seasonal_factor  # Mid-range starting point
-        
-        # Adjust for cloud coverage
-        cloud_factor = 1.0 - (clouds / 100.0) * 0.8  # Clouds can block up to 80% of UV
-        
-        # Adjust for weather conditions
-        weather_factor = 1.0
-        if 'rain' in weather_condition or 'drizzle' in weather_condition:
-            weather_factor = 0.7  # Rain reduces UV
-        elif 'snow' in weather_condition:
-            weather_factor = 0.6  # Snow reduces UV
-        elif 'thunderstorm' in weather_condition:
-            weather_factor = 0.5  # Heavy clouds and rain in thunderstorms
-        elif 'clear' in weather_condition:
-            weather_factor = 1.2  # Clear skies increase UV
-            
-        # Calculate final UV index
-        uv_index = round(base_uv * cloud_factor * weather_factor)
-        
-        # Ensure within scale (0-11+)
-        uv_index = max(0, min(12, uv_index))
-        
-        # UV index categories
-        if uv_index <= 2:
-            category = "Low"
-            description = "Low danger from the sun's UV rays."
-            color = "#299501"  # Green
-            protection_needed = "No protection needed."
-            alert_type = "success"
-        elif uv_index <= 5:
-            category = "Moderate"
-            description = "Moderate risk of harm from unprotected sun exposure."
-            color = "#F7E401"  # Yellow
-            protection_needed = "Wear sunscreen and protective clothing."
-            alert_type = "info"
-        elif uv_index <= 7:
-            category = "High"
-            description = "High risk of harm from unprotected sun exposure."
-            color = "#F85900"  # Orange
-            protection_needed = "Wear SPF 30+ sunscreen, a hat, and sunglasses."
-            alert_type = "warning"
-        elif uv_index <= 10:
-            category = "Very High"
-            description = "Very high risk of harm from unprotected sun exposure."
-            color = "#D8001D"  # Red
-            protection_needed = "Seek shade during midday hours, wear protective clothing."
-            alert_type = "danger"
-        else:
-            category = "Extreme"
-            description = "Extreme risk of harm from unprotected sun exposure."
-            color = "#6B49C8"  # Purple
-            protection_needed = "Avoid being outside during midday hours."
-            alert_type = "danger"
-            
-        # Generate recommendations based on UV index
-        recommendations = []
-        
-        if uv_index > 2:
-            recommendations.append("Apply sunscreen with SPF appropriate for your skin type.")
-            
-            if uv_index > 5:
-                recommendations.append("Wear protective clothing, a wide-brimmed hat, and UV-blocking sunglasses.")
-                recommendations.append("Seek shade between 10am and 4pm when UV is strongest.")
-                
-                if uv_index > 7:
-                    recommendations.append("Reapply sunscreen every 2 hours, especially after swimming or sweating.")
-                    recommendations.append("Consider UV-protective clothing with UPF rating.")
-                    
-                    if uv_index > 10:
-                        recommendations.append("Minimize outdoor activities during midday hours.")
-                        recommendations.append("Check for UV alerts in your weather forecasts.")
-        else:
-            recommendations.append("You can safely stay outside with minimal protection.")
-            
-        # Generate 7-day forecast with realistic variations
-        forecast = []
-        for i in range(1, 8):
-            forecast_date = date + datetime.timedelta(days=i)
-            # Create realistic variations (±20% with seasonal trend)
-            if i <= 3:
-                # Short term: less variation
-                variation = random.uniform(0.9, 1.1)
-            else:
-                # Longer term: more variation
-                variation = random.uniform(0.8, 1.2)
-                
-            # Smooth the variations to create trends
-            if i > 1:
-                # Blend with previous day for smoothness
-                previous_uv = forecast[i-2]["uv_index"]
-                forecasted_uv = round(max(0, min(12, uv_index * variation * 0.7 + previous_uv * 0.3)))
-            else:
-                forecasted_uv = round(max(0, min(12, uv_index * variation)))
-                
-            forecast.append({
-                "date": forecast_date.strftime("%Y-%m-%d"),
-                "uv_index": forecasted_uv
-            })
-            
-        return {
-            "uv_index": uv_index,
-            "category": category,
-            "description": description,
-            "color": color,
-            "protection_needed": protection_needed,
-            "alert_type": alert_type,
-            "recommendations": recommendations,
-            "forecast": forecast
-        }
-    except Exception as e:
-        logger.error(f"Error getting UV index for {city}: {e}")
-        return {
-            "uv_index": 4,
-            "category": "Moderate",
-            "description": "Moderate risk of harm from unprotected sun exposure.",
-            "color": "#F7E401",
-            "protection_needed": "Wear sunscreen and protective clothing.",
-            "alert_type": "info",
-            "recommendations": ["Apply sunscreen with SPF appropriate for your skin type.",
-                               "Wear protective clothing, a hat, and sunglasses."],
-            "forecast": []
-        }
+    uv_index = _cached_uv_index(city, date)
+    return _DEFAULT_UV if uv_index is None else uv_index
 
 def get_cold_flu_risk(city: str, date: Optional[datetime.datetime] = None) -> Dict[str, Any]:
     """
@@ -393,162 +801,8 @@ def get_cold_flu_risk(city: str, date: Optional[datetime.datetime] = None) -> Di
     Returns:
         dict: Cold and flu risk data
     """
-    try:
-        if date is None:
-            date = datetime.datetime.now()
-            
-        # Get weather data
-        weather_data = weather_utils.get_city_weather(city)
-        
-        # Factors affecting cold/flu risk
-        temperature = weather_data.get('main', {}).get('temp', 20)
-        humidity = weather_data.get('main', {}).get('humidity', 50)
-        
-        # Base risk on weather, seasonal, and other factors
-        # Temperature: Cold weather tends to increase risk
-        temp_factor = 0
-        if temperature < 0:
-            temp_factor = 3  # Very cold
-        elif temperature < 10:
-            temp_factor = 2  # Cold
-        elif temperature < 20:
-            temp_factor = 1  # Cool
-        else:
-            temp_factor = 0  # Warm or hot
-            
-        # Humidity: Very dry or very humid conditions can increase risk
-        humidity_factor = 0
-        if humidity < 30:
-            humidity_factor = 2  # Very dry
-        elif humidity > 80:
-            humidity_factor = 1  # Very humid
-        else:
-            humidity_factor = 0  # Moderate humidity
-            
-        # Seasonal factor
-        month = date.month
-        seasonal_factor = 0
-        
-        # Northern hemisphere flu season
-        if 10 <= month <= 12 or 1 <= month <= 3:
-            seasonal_factor = 3  # Peak flu season
-        elif month in [4, 9]:
-            seasonal_factor = 2  # Shoulder season
-        elif month in [5, 8]:
-            seasonal_factor = 1  # Low season
-        else:
-            seasonal_factor = 0  # Summer, minimal flu
-            
-        # Calculate overall risk (1-10 scale)
-        base_risk = temp_factor + humidity_factor + seasonal_factor
-        
-        # Add some randomness to represent local outbreaks, etc.
-        random_factor = random.randint(0, 2)
-        
-        risk_value = base_risk + random_factor
-        
-        # Ensure within scale (1-10)
-        risk_value = max(1, min(10, risk_value))
-        
-        # Risk categories
-        if risk_value <= 3:
-            category = "Low"
-            description = "Low risk of cold and flu in your area."
-            alert_type = "success"
-        elif risk_value <= 6:
-            category = "Moderate"
-            description = "Moderate risk of cold and flu in your area."
-            alert_type = "info"
-        elif risk_value <= 8:
-            category = "High"
-            description = "High risk of cold and flu in your area."
-            alert_type = "warning"
-        else:
-            category = "Very High"
-            description = "Very high risk of cold and flu in your area."
-            alert_type = "danger"
-            
-        # Generate symptoms to watch for
-        symptoms = []
-        if risk_value > 3:
-            symptoms = [
-                "Fever or feeling feverish/chills",
-                "Cough",
-                "Sore throat",
-                "Runny or stuffy nose",
-                "Muscle or body aches",
-                "Headaches",
-                "Fatigue (tiredness)"
-            ]
-            
-        # Generate recommendations based on risk level
-        recommendations = []
-        
-        if risk_value > 6:
-            recommendations.append("Wash hands frequently with soap and water for at least 20 seconds.")
-            recommendations.append("Avoid close contact with people who are sick.")
-            recommendations.append("Consider wearing a mask in crowded indoor spaces.")
-            recommendations.append("Get your seasonal flu vaccination if you haven't already.")
-            recommendations.append("Boost your immune system with vitamin-rich foods and sufficient sleep.")
-            
-            if risk_value > 8:
-                recommendations.append("Avoid unnecessary travel to high-risk areas.")
-                recommendations.append("Consider limiting time in crowded public places.")
-                recommendations.append("Keep sanitizer with you when out in public.")
-        elif risk_value > 3:
-            recommendations.append("Wash hands regularly, especially before eating.")
-            recommendations.append("Avoid touching your face, eyes, nose, and mouth.")
-            recommendations.append("Consider getting a flu shot if you haven't already.")
-        else:
-            recommendations.append("Practice normal hygiene like regular handwashing.")
-            recommendations.append("Stay home if you feel unwell to prevent spreading illness.")
-            
-        # Generate 7-day forecast with realistic variations
-        forecast = []
-        for i in range(1, 8):
-            forecast_date = date + datetime.timedelta(days=i)
-            # Create realistic variations (±20% with trend smoothing)
-            if i <= 3:
-                # Short term: less variation
-                variation = random.uniform(0.9, 1.1)
-            else:
-                # Longer term: more variation
-                variation = random.uniform(0.8, 1.2)
-                
-            # Smooth the variations to create trends
-            if i > 1:
-                # Blend with previous day for smoothness
-                previous_risk = forecast[i-2]["risk"]
-                forecasted_risk = round(max(1, min(10, risk_value * variation * 0.7 + previous_risk * 0.3)))
-            else:
-                forecasted_risk = round(max(1, min(10, risk_value * variation)))
-                
-            forecast.append({
-                "date": forecast_date.strftime("%Y-%m-%d"),
-                "risk": forecasted_risk
-            })
-            
-        return {
-            "risk_value": risk_value,
-            "risk_category": category,
-            "risk_description": description,
-            "alert_type": alert_type,
-            "symptoms": symptoms,
-            "recommendations": recommendations,
-            "forecast": forecast
-        }
-    except Exception as e:
-        logger.error(f"Error getting cold/flu risk for {city}: {e}")
-        return {
-            "risk_value": 4,
-            "risk_category": "Moderate",
-            "risk_description": "Moderate risk of cold and flu in your area.",
-            "alert_type": "info",
-            "symptoms": ["Fever or feeling feverish/chills", "Cough", "Sore throat"],
-            "recommendations": ["Wash hands regularly, especially before eating.",
-                               "Avoid touching your face, eyes, nose, and mouth."],
-            "forecast": []
-        }
+    cold_flu = _cached_cold_flu_risk(city, date)
+    return _DEFAULT_COLD_FLU if cold_flu is None else cold_flu
 
 def get_air_quality_health_risk(city: str, health_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -561,165 +815,275 @@ def get_air_quality_health_risk(city: str, health_profile: Optional[Dict[str, An
     Returns:
         dict: Air quality health risk data
     """
-    try:
-        # Get air quality data
-        aqi_data = api_utils.get_city_air_quality(city)
-        
-        # Get AQI value
-        aqi = aqi_data.get('aqi', 50)
-        
-        # Default health profile if none provided
-        if health_profile is None:
-            health_profile = {
-                'health_concerns': [],
-                'activity_level': 'moderate',
-                'age_group': 'adult'
-            }
-            
-        # Get standard AQI category
-        aqi_category = health_utils.get_aqi_category(aqi)
-        
-        # Determine personalized risk based on health profile
-        health_concerns = health_profile.get('health_concerns', [])
-        activity_level = health_profile.get('activity_level', 'moderate')
-        age_group = health_profile.get('age_group', 'adult')
-        
-        # Adjust risk based on health concerns
-        risk_adjustment = 0
-        
-        if 'asthma' in health_concerns:
-            risk_adjustment += 1
-        if 'copd' in health_concerns:
-            risk_adjustment += 2
-        if 'heart_disease' in health_concerns:
-            risk_adjustment += 1
-        if 'allergies' in health_concerns:
-            risk_adjustment += 1
-            
-        # Adjust risk based on activity level
-        if activity_level == 'high':
-            risk_adjustment += 1
-        elif activity_level == 'low':
-            risk_adjustment -= 1
-            
-        # Adjust risk based on age group
-        if age_group == 'child' or age_group == 'senior':
-            risk_adjustment += 1
-            
-        # Determine personalized health risk category
-        personalized_category = aqi_category
-        personalized_alert_type = 'success'
-        
-        if aqi_category == 'Good':
-            if risk_adjustment >= 3:
-                personalized_category = 'Moderate'
-                personalized_alert_type = 'info'
-            else:
-                personalized_category = 'Good'
-                personalized_alert_type = 'success'
-        elif aqi_category == 'Moderate':
-            if risk_adjustment >= 2:
-                personalized_category = 'Unhealthy for Sensitive Groups'
-                personalized_alert_type = 'warning'
-            else:
-                personalized_category = 'Moderate'
-                personalized_alert_type = 'info'
-        elif aqi_category == 'Unhealthy for Sensitive Groups':
-            if risk_adjustment >= 1:
-                personalized_category = 'Unhealthy'
-                personalized_alert_type = 'danger'
-            else:
-                personalized_category = 'Unhealthy for Sensitive Groups'
-                personalized_alert_type = 'warning'
-        elif aqi_category == 'Unhealthy':
-            personalized_category = 'Unhealthy'
-            personalized_alert_type = 'danger'
-        elif aqi_category == 'Very Unhealthy' or aqi_category == 'Hazardous':
-            personalized_category = 'Hazardous'
-            personalized_alert_type = 'danger'
-            
-        # Generate recommendations based on air quality and health profile
-        recommendations = []
-        
-        # Basic recommendations based on AQI
-        if aqi > 150:  # Unhealthy or worse
-            recommendations.append("Avoid outdoor activities and exercise.")
-            recommendations.append("Keep windows and doors closed.")
-            recommendations.append("Use air purifiers indoors if available.")
-            
-            if aqi > 200:  # Very Unhealthy or worse
-                recommendations.append("Wear N95 masks if you must go outside.")
-                recommendations.append("Reconsider travel plans in the area.")
-        elif aqi > 100:  # Unhealthy for Sensitive Groups
-            recommendations.append("Reduce prolonged or heavy outdoor exertion.")
-            recommendations.append("Take more breaks during outdoor activities.")
-            recommendations.append("Watch for symptoms like coughing or shortness of breath.")
-        elif aqi > 50:  # Moderate
-            recommendations.append("Unusually sensitive individuals should consider reducing prolonged outdoor exertion.")
-        else:  # Good
-            recommendations.append("Air quality is good. It's a great day for outdoor activities.")
-            
-        # Personalized recommendations based on health profile
-        if 'asthma' in health_concerns:
-            if aqi > 50:
-                recommendations.append("Asthma sufferers: Keep rescue inhaler nearby.")
-            if aqi > 100:
-                recommendations.append("Asthma sufferers: Consider staying indoors with air filtration.")
-                
-        if 'copd' in health_concerns:
-            if aqi > 50:
-                recommendations.append("COPD sufferers: Monitor breathing closely and limit outdoor exposure.")
-            if aqi > 100:
-                recommendations.append("COPD sufferers: Stay indoors and ensure medications are available.")
-                
-        if 'heart_disease' in health_concerns:
-            if aqi > 100:
-                recommendations.append("Heart disease patients: Avoid strenuous activities outdoors.")
-                
-        if 'allergies' in health_concerns:
-            if aqi > 50:
-                recommendations.append("Allergy sufferers: Consider taking antihistamines before going outside.")
-                
-        # Activity-specific recommendations
-        if activity_level == 'high':
-            if aqi > 50:
-                recommendations.append("Consider moving intensive exercise indoors or reducing intensity.")
-            if aqi > 100:
-                recommendations.append("Reschedule outdoor workouts or competitions to a day with better air quality.")
-                
-        # Age-specific recommendations
-        if age_group == 'child':
-            if aqi > 100:
-                recommendations.append("Children should limit outdoor play time.")
-        elif age_group == 'senior':
-            if aqi > 100:
-                recommendations.append("Seniors should stay indoors and keep windows closed.")
+    air_quality = _cached_air_quality_health_risk(city, health_profile)
+    return _DEFAULT_AQI_RISK if air_quality is None else air_quality
+
+def _health_reports(city: str, date: datetime.datetime, health_profile: Optional[Dict[str, Any]],
+                    weather_data: Optional[Dict[str, Any]], aqi_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the four health reports from already fetched upstream data
+    
+    Reports that can't be built fall back to their defaults. Passing None for the
+    data returns only reports that are already cached, without calling upstream.
+    
+    Args:
+        city (str): City name
+        date (datetime): Date for the reports
+        health_profile (dict, optional): User health profile
+        weather_data (dict, optional): Current weather, None if unavailable
+        aqi_data (dict, optional): Air quality data, None if unavailable
+        
+    Returns:
+        dict: Air quality, pollen, UV index and cold/flu data
+    """
+    air_quality = _cached_air_quality_health_risk(city, health_profile, aqi_data)
+    pollen = _cached_pollen_count(city, date, weather_data)
+    uv_index = _cached_uv_index(city, date, weather_data)
+    cold_flu = _cached_cold_flu_risk(city, date, weather_data)
+    return {
+        "air_quality": _DEFAULT_AQI_RISK if air_quality is None else air_quality,
+        "pollen": _DEFAULT_POLLEN if pollen is None else pollen,
+        "uv_index": _DEFAULT_UV if uv_index is None else uv_index,
+        "cold_flu": _DEFAULT_COLD_FLU if cold_flu is None else cold_flu
+    }
+
+def get_all_health_alerts(city: str, date: Optional[datetime.datetime] = None,
+                          health_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Get pollen, UV, cold/flu and air quality reports for a city in one call
+    
+    Current weather and air quality are fetched once, concurrently, and shared by
+    all four reports.
+    
+    Args:
+        city (str): City name
+        date (datetime, optional): Date for the reports. Defaults to current date.
+        health_profile (dict, optional): User health profile. Defaults to None.
+        
+    Returns:
+        dict: Air quality, pollen, UV index and cold/flu data
+    """
+    if date is None:
+        date = datetime.datetime.now()
+        
+    # The weather and air quality APIs are independent, so fetch both concurrently
+    # and hand the results (or failures) to the builders instead of fetching again
+    weather_future = _executor.submit(_cached_weather, city)
+    aqi_future = _executor.submit(_cached_aqi, city)
+    
+    return _health_reports(city, date, health_profile, weather_future.result(), aqi_future.result())
+
+# Primary alert message templates per report type as (severe alert, info alert);
+# filled in with the report (r), the city and the report's first recommendation
+_PRIMARY_ALERT_TEMPLATES = {
+    "air_quality": (
+        "Air Quality Alert: {r[aqi_category]} air quality ({r[aqi]} AQI). {first_tip}".format,
+        "Air Quality: {r[aqi_category]} air quality today in {city}.".format
+    ),
+    "uv": (
+        "UV Alert: {r[category]} UV index ({r[uv_index]}). {r[protection_needed]}".format,
+        "UV Index: {r[category]} UV levels today in {city}.".format
+    ),
+    "pollen": (
+        "Pollen Alert: {r[level_category]} pollen levels today. {first_tip}".format,
+        "Pollen Levels: {r[level_category]} pollen levels today in {city}.".format
+    ),
+    "cold_flu": (
+        "Cold & Flu Alert: {r[risk_category]} risk in your area. {first_tip}".format,
+        "Cold & Flu: {r[risk_category]} risk today in {city}.".format
+    )
+}
+_GOOD_CONDITIONS_MESSAGE = (
+    "Good news! Environmental conditions in {city} are favorable today. Enjoy your outdoor activities.".format
+)
+
+# Report order used to break ties between equally severe alerts, and between info alerts
+_SEVERE_ALERT_PRIORITY = ("air_quality", "uv", "pollen", "cold_flu")
+_INFO_ALERT_PRIORITY = ("air_quality", "pollen", "uv", "cold_flu")
+_SEVERITY_RANK = {"danger": 0, "warning": 1}
+
+def _pick_primary_alert(city: str, reports: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Pick the alert to headline from the individual health reports
+    
+    The most severe danger or warning alert wins, ties going to the report listed
+    first in _SEVERE_ALERT_PRIORITY; otherwise the first info alert is used.
+    
+    Args:
+        city (str): City name
+        reports (dict): Reports keyed by alert type (air_quality, uv, pollen, cold_flu)
+        
+    Returns:
+        dict: Primary alert with type, alert_type and message
+    """
+    severe = None
+    severe_rank = None
+    for alert in _SEVERE_ALERT_PRIORITY:
+        rank = _SEVERITY_RANK.get(reports[alert]["alert_type"])
+        if rank is not None and (severe_rank is None or rank < severe_rank):
+            severe, severe_rank = alert, rank
+            if rank == 0:
+                # Nothing outranks the first danger alert
+                break
                 
-        # Remove any duplicate recommendations
-        recommendations = list(dict.fromkeys(recommendations))
-            
+    if severe is not None:
+        report = reports[severe]
         return {
-            "aqi": aqi,
-            "aqi_category": personalized_category,
-            "alert_type": personalized_alert_type,
-            "recommendations": recommendations,
-            "pollutants": aqi_data.get('pollutants', {}),
-            "main_pollutant": health_utils.get_main_pollutant(aqi_data.get('pollutants', {}))
+            "type": severe,
+            "alert_type": report["alert_type"],
+            "message": _PRIMARY_ALERT_TEMPLATES[severe][0](
+                r=report, city=city, first_tip=report["recommendations"][0] if report["recommendations"] else ""
+            )
         }
-    except Exception as e:
-        logger.error(f"Error getting air quality health risk for {city}: {e}")
-        return {
-            "aqi": 50,
-            "aqi_category": "Moderate",
+        
+    for alert in _INFO_ALERT_PRIORITY:
+        report = reports[alert]
+        if report["alert_type"] == "info":
+            return {
+                "type": alert,
+                "alert_type": "info",
+                "message": _PRIMARY_ALERT_TEMPLATES[alert][1](r=report, city=city)
+            }
+            
+    # Default good conditions message
+    return {
+        "type": "general",
+        "alert_type": "success",
+        "message": _GOOD_CONDITIONS_MESSAGE(city=city)
+    }
+
+def _unseen(items: Iterable[str], seen: Set[str]) -> Iterator[str]:
+    """Yield the items not already in seen, adding each one as it is yielded"""
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+# Fallback report for each report type, used when its data is unavailable
+_DEFAULT_REPORTS = {
+    "air_quality": _DEFAULT_AQI_RISK,
+    "pollen": _DEFAULT_POLLEN,
+    "uv_index": _DEFAULT_UV,
+    "cold_flu": _DEFAULT_COLD_FLU
+}
+
+def _degraded_health_alerts(city: str, air_quality: Dict[str, Any], pollen: Dict[str, Any],
+                            uv_index: Dict[str, Any], cold_flu: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Comprehensive health alerts returned when the combined summary can't be built
+    
+    Args:
+        city (str): City name
+        air_quality (dict): Air quality health risk data
+        pollen (dict): Pollen count data
+        uv_index (dict): UV index data
+        cold_flu (dict): Cold and flu risk data
+        
+    Returns:
+        dict: Comprehensive health alerts with a general info alert
+    """
+    return {
+        "primary_alert": {
+            "type": "general",
             "alert_type": "info",
-            "recommendations": [
-                "Unusually sensitive individuals should consider reducing prolonged outdoor exertion.",
-                "Watch for symptoms like coughing or shortness of breath.",
-                "Check local air quality forecasts for updates."
-            ],
-            "pollutants": {},
-            "main_pollutant": "PM2.5"
-        }
+            "message": f"Health alerts service is experiencing some issues. Please check individual health indicators for {city}."
+        },
+        "air_quality": air_quality,
+        "pollen": pollen,
+        "uv_index": uv_index,
+        "cold_flu": cold_flu,
+        "recommendations": ["Check local forecasts for the most up-to-date health information."]
+    }
+
+def _build_comprehensive_health_alerts(city: str, health_profile: Optional[Dict[str, Any]],
+                                      reports: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combine the four health reports into comprehensive health alerts
+    
+    Args:
+        city (str): City name
+        health_profile (dict, optional): User health profile
+        reports (dict): Air quality, pollen, UV index and cold/flu data
+        
+    Returns:
+        dict: Comprehensive health alerts
+    """
+    air_quality = reports["air_quality"]
+    pollen = reports["pollen"]
+    uv_index = reports["uv_index"]
+    cold_flu = reports["cold_flu"]
+    
+    # Determine primary alert based on severity
+    primary_alert = _pick_primary_alert(city, {
+        "air_quality": air_quality,
+        "uv": uv_index,
+        "pollen": pollen,
+        "cold_flu": cold_flu
+    })
+        
+    # Create personalized recommendations combining all alert types
+    recommendations = []
+    
+    # Get health concerns for personalization
+    health_concerns = frozenset(health_profile.get('health_concerns', ())) if health_profile else frozenset()
+    aqi = air_quality['aqi']
+    aqi_category = air_quality['aqi_category']
+    pollen_level = pollen['overall_level']
+    pollen_category = pollen['level_category']
+    flu_risk = cold_flu['risk_value']
+    
+    # Add personalized recommendations based on health concerns
+    if 'asthma' in health_concerns:
+        if aqi > 100 or pollen_level > 6:
+            recommendations.append(f"With your asthma, be extra cautious today with {aqi_category} air quality and {pollen_category} pollen levels.")
+        
+    if 'allergies' in health_concerns:
+        if pollen_level > 4:
+            recommendations.append(f"Given your allergies, take preventative medication today as pollen levels are {pollen_category}.")
+        
+    if 'heart_disease' in health_concerns:
+        if aqi > 100 or flu_risk > 6:
+            recommendations.append("With your heart condition, limit outdoor activities today due to environmental conditions.")
+        
+    if 'copd' in health_concerns:
+        if aqi > 50:
+            recommendations.append("With COPD, you should be particularly careful about current air quality conditions.")
+        
+    # Add the most important recommendations from each category, skipping repeats
+    recommendations.extend(_unseen(chain(
+        islice(air_quality['recommendations'] or (), 2),
+        islice(pollen['recommendations'] or (), 1),
+        islice(uv_index['recommendations'] or (), 1),
+        islice(cold_flu['recommendations'] or (), 1)
+    ), set(recommendations)))
+    
+    return {
+        "primary_alert": primary_alert,
+        "air_quality": air_quality,
+        "pollen": pollen,
+        "uv_index": uv_index,
+        "cold_flu": cold_flu,
+        "recommendations": recommendations
+    }
+
+@ttl_cache(COMPREHENSIVE_CACHE_TTL, key=_city_profile_key, cache_if=_is_live)
+def _cached_comprehensive_health_alerts(city: str, health_profile: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Build the comprehensive health alerts for a city and profile, reusing recent results
+    
+    Returns None, so nothing is cached, when any report is a fallback. Alerts built
+    from simulated reports are marked as simulated and not cached either.
+    """
+    # Get individual health alerts, all forecasting from the same moment and
+    # built from one concurrent weather and air quality fetch
+    reports = get_all_health_alerts(city, datetime.datetime.now(), health_profile)
+    if any(reports[name] is default for name, default in _DEFAULT_REPORTS.items()):
+        return None
+        
+    alerts = _build_comprehensive_health_alerts(city, health_profile, reports)
+    if any(weather_utils.is_simulated(report) for report in reports.values()):
+        return weather_utils.SimulatedData(alerts)
+    return alerts
 
 def get_comprehensive_health_alerts(city: str, health_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -733,163 +1097,15 @@ def get_comprehensive_health_alerts(city: str, health_profile: Optional[Dict[str
         dict: Comprehensive health alerts
     """
     try:
-        # Get individual health alerts
-        air_quality = get_air_quality_health_risk(city, health_profile)
-        pollen = get_pollen_count(city)
-        uv_index = get_uv_index(city)
-        cold_flu = get_cold_flu_risk(city)
-        
-        # Determine primary alert based on severity
-        primary_alert = None
-        
-        # Air quality alert
-        if air_quality["alert_type"] == "danger":
-            primary_alert = {
-                "type": "air_quality",
-                "alert_type": "danger",
-                "message": f"Air Quality Alert: {air_quality['aqi_category']} air quality ({air_quality['aqi']} AQI). {air_quality['recommendations'][0] if air_quality['recommendations'] else ''}"
-            }
-        elif air_quality["alert_type"] == "warning" and not primary_alert:
-            primary_alert = {
-                "type": "air_quality",
-                "alert_type": "warning",
-                "message": f"Air Quality Alert: {air_quality['aqi_category']} air quality ({air_quality['aqi']} AQI). {air_quality['recommendations'][0] if air_quality['recommendations'] else ''}"
-            }
-            
-        # UV alert
-        if uv_index["alert_type"] == "danger" and (not primary_alert or primary_alert["alert_type"] != "danger"):
-            primary_alert = {
-                "type": "uv",
-                "alert_type": "danger",
-                "message": f"UV Alert: {uv_index['category']} UV index ({uv_index['uv_index']}). {uv_index['protection_needed']}"
-            }
-        elif uv_index["alert_type"] == "warning" and not primary_alert:
-            primary_alert = {
-                "type": "uv",
-                "alert_type": "warning",
-                "message": f"UV Alert: {uv_index['category']} UV index ({uv_index['uv_index']}). {uv_index['protection_needed']}"
-            }
-            
-        # Pollen alert
-        if pollen["alert_type"] == "danger" and (not primary_alert or primary_alert["alert_type"] != "danger"):
-            primary_alert = {
-                "type": "pollen",
-                "alert_type": "danger",
-                "message": f"Pollen Alert: {pollen['level_category']} pollen levels today. {pollen['recommendations'][0] if pollen['recommendations'] else ''}"
-            }
-        elif pollen["alert_type"] == "warning" and not primary_alert:
-            primary_alert = {
-                "type": "pollen",
-                "alert_type": "warning",
-                "message": f"Pollen Alert: {pollen['level_category']} pollen levels today. {pollen['recommendations'][0] if pollen['recommendations'] else ''}"
-            }
-            
-        # Cold/flu alert
-        if cold_flu["alert_type"] == "danger" and (not primary_alert or primary_alert["alert_type"] != "danger"):
-            primary_alert = {
-                "type": "cold_flu",
-                "alert_type": "danger",
-                "message": f"Cold & Flu Alert: {cold_flu['risk_category']} risk in your area. {cold_flu['recommendations'][0] if cold_flu['recommendations'] else ''}"
-            }
-        elif cold_flu["alert_type"] == "warning" and not primary_alert:
-            primary_alert = {
-                "type": "cold_flu",
-                "alert_type": "warning",
-                "message": f"Cold & Flu Alert: {cold_flu['risk_category']} risk in your area. {cold_flu['recommendations'][0] if cold_flu['recommendations'] else ''}"
-            }
-            
-        # If no severe alerts, create an informational alert
-        if not primary_alert:
-            # Find the most important info alert
-            if air_quality["alert_type"] == "info":
-                primary_alert = {
-                    "type": "air_quality",
-                    "alert_type": "info",
-                    "message": f"Air Quality: {air_quality['aqi_category']} air quality today in {city}."
-                }
-            elif pollen["alert_type"] == "info":
-                primary_alert = {
-                    "type": "pollen",
-                    "alert_type": "info",
-                    "message": f"Pollen Levels: {pollen['level_category']} pollen levels today in {city}."
-                }
-            elif uv_index["alert_type"] == "info":
-                primary_alert = {
-                    "type": "uv",
-                    "alert_type": "info",
-                    "message": f"UV Index: {uv_index['category']} UV levels today in {city}."
-                }
-            elif cold_flu["alert_type"] == "info":
-                primary_alert = {
-                    "type": "cold_flu",
-                    "alert_type": "info",
-                    "message": f"Cold & Flu: {cold_flu['risk_category']} risk today in {city}."
-                }
-            else:
-                # Default good conditions message
-                primary_alert = {
-                    "type": "general",
-                    "alert_type": "success",
-                    "message": f"Good news! Environmental conditions in {city} are favorable today. Enjoy your outdoor activities."
-                }
-                
-        # Create personalized recommendations combining all alert types
-        recommendations = []
-        
-        # Get health concerns for personalization
-        health_concerns = health_profile.get('health_concerns', []) if health_profile else []
-        
-        # Add personalized recommendations based on health concerns
-        if 'asthma' in health_concerns:
-            if air_quality['aqi'] > 100 or pollen['overall_level'] > 6:
-                recommendations.append(f"With your asthma, be extra cautious today with {air_quality['aqi_category']} air quality and {pollen['level_category']} pollen levels.")
-                
-        if 'allergies' in health_concerns:
-            if pollen['overall_level'] > 4:
-                recommendations.append(f"Given your allergies, take preventative medication today as pollen levels are {pollen['level_category']}.")
-                
-        if 'heart_disease' in health_concerns:
-            if air_quality['aqi'] > 100 or cold_flu['risk_value'] > 6:
-                recommendations.append("With your heart condition, limit outdoor activities today due to environmental conditions.")
-                
-        if 'copd' in health_concerns:
-            if air_quality['aqi'] > 50:
-                recommendations.append("With COPD, you should be particularly careful about current air quality conditions.")
-                
-        # Add the most important recommendations from each category
-        for rec_list, count in [
-            (air_quality['recommendations'], 2),
-            (pollen['recommendations'], 1),
-            (uv_index['recommendations'], 1),
-            (cold_flu['recommendations'], 1)
-        ]:
-            if rec_list:
-                for rec in rec_list[:count]:
-                    if rec not in recommendations:
-                        recommendations.append(rec)
-                        
-        # Remove any duplicate recommendations
-        recommendations = list(dict.fromkeys(recommendations))
+        alerts = _cached_comprehensive_health_alerts(city, health_profile)
+        if alerts is not None:
+            return alerts
             
-        return {
-            "primary_alert": primary_alert,
-            "air_quality": air_quality,
-            "pollen": pollen,
-            "uv_index": uv_index,
-            "cold_flu": cold_flu,
-            "recommendations": recommendations
-        }
+        # Some report fell back to its default: build the alerts without caching them,
+        # from the reports the attempt above left in the caches, without calling upstream again
+        reports = _health_reports(city, datetime.datetime.now(), health_profile, None, None)
+        return _build_comprehensive_health_alerts(city, health_profile, reports)
     except Exception as e:
         logger.error(f"Error getting comprehensive health alerts for {city}: {e}")
-        return {
-            "primary_alert": {
-                "type": "general",
-                "alert_type": "info",
-                "message": f"Health alerts service is experiencing some issues. Please check individual health indicators for {city}."
-            },
-            "air_quality": get_air_quality_health_risk(city, health_profile),
-            "pollen": get_pollen_count(city),
-            "uv_index": get_uv_index(city),
-            "cold_flu": get_cold_flu_risk(city),
-            "recommendations": ["Check local forecasts for the most up-to-date health information."]
-        }
\ No newline at end of file
+        reports = _health_reports(city, datetime.datetime.now(), health_profile, None, None)
+        return _degraded_health_alerts(city, **reports)
\ No newline at end of file
@@ -8,14 +8,33 @@ import logging
 import json
 import random
 import datetime
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import date, datetime, timedelta
+
+import numpy as np
 
 from backend import weather_utils
 from backend import agriculture_utils
+from backend.cache_utils import ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# How long generated notifications are reused for a city, in seconds
+NOTIFICATIONS_CACHE_TTL = 300
+
+# Template picker of our own, so other modules reseeding the global random
+# module (the simulated weather does) don't fix which wording is chosen
+_rng = random.Random()
+
+# Shared pool for running the forecast and current weather lookups side by side
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="smart-notifications")
+
 # Activity types and their ideal weather conditions
 ACTIVITIES = {
     "outdoor_painting": {
@@ -228,6 +247,353 @@ SEASONAL_EVENTS = {
     ])
 }
 
+# Lowercased condition names grouped for weather change and pattern detection
+_GOOD_CONDITIONS = frozenset({"clear", "clouds", "few clouds"})
+_BAD_CONDITIONS = frozenset({"rain", "thunderstorm", "snow", "drizzle"})
+_RAIN_CONDITIONS = frozenset({"rain", "thunderstorm", "drizzle"})
+_CLEAR_CONDITIONS = frozenset({"clear", "few clouds"})
+
+# Day codes for persistent pattern detection, by lowercased condition
+_OTHER_DAY, _RAIN_DAY, _CLEAR_DAY = 0, 1, 2
+_DAY_CODES = {**dict.fromkeys(_RAIN_CONDITIONS, _RAIN_DAY), **dict.fromkeys(_CLEAR_CONDITIONS, _CLEAR_DAY)}
+
+# Consecutive days before a condition is reported as a persistent pattern:
+# 4+ days of rain is unusual in many climates, 5+ days of clear weather can be noteworthy
+_PERSISTENT_DAY_CODES = np.array([_RAIN_DAY, _CLEAR_DAY], dtype=np.int8)
+_PERSISTENT_MIN_DAYS = np.array([4, 5], dtype=np.int64)
+_SHORTEST_PERSISTENT_SPELL = int(_PERSISTENT_MIN_DAYS.min())
+
+@dataclass(slots=True)
+class DaySummary:
+    """Forecast for one day, summarized from the periods that fall on it"""
+    date: str
+    date_obj: date
+    day_of_week: str
+    min_temp: float
+    max_temp: float
+    avg_temp: float
+    min_humidity: float
+    max_humidity: float
+    avg_humidity: float
+    max_wind_speed: float
+    avg_wind_speed: float
+    precipitation_sum: float
+    precipitation_probability: float
+    will_rain: bool
+    avg_cloud_cover: float
+    condition: str
+    condition_lc: str  # condition lowercased, for matching against condition names
+    condition_ids: List[int]
+
+# Daily forecast fields the activity and warning rules are checked against,
+# in the column order of the rule threshold arrays below
+_RULE_FIELDS = (
+    "will_rain",
+    "min_temp",
+    "max_temp",
+    "min_humidity",
+    "max_humidity",
+    "max_wind_speed",
+    "avg_cloud_cover",
+    "precipitation_sum"
+)
+_RULE_FIELD_INDEX = {field: i for i, field in enumerate(_RULE_FIELDS)}
+_rule_fields_of = attrgetter(*_RULE_FIELDS)
+
+def _compile_rules(rule_bounds: List[Dict[str, Tuple[float, float]]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Turn per-rule field bounds into lower and upper threshold arrays
+    
+    Args:
+        rule_bounds (list): For each rule, the (low, high) bounds by field name
+        
+    Returns:
+        tuple: Lower and upper thresholds, one row per rule and one column per field
+    """
+    low = np.full((len(rule_bounds), len(_RULE_FIELDS)), -np.inf)
+    high = np.full((len(rule_bounds), len(_RULE_FIELDS)), np.inf)
+    for row, bounds in enumerate(rule_bounds):
+        for field, (field_low, field_high) in bounds.items():
+            low[row, _RULE_FIELD_INDEX[field]] = field_low
+            high[row, _RULE_FIELD_INDEX[field]] = field_high
+    return low, high
+
+def _activity_bounds(ideal_conditions: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+    """Field bounds a day must fall within to suit an activity"""
+    bounds = {}
+    if "rain" in ideal_conditions:
+        bounds["will_rain"] = (1, 1) if ideal_conditions["rain"] else (0, 0)
+    if "temp_range" in ideal_conditions:
+        min_temp, max_temp = ideal_conditions["temp_range"]
+        bounds["min_temp"] = (min_temp, np.inf)
+        bounds["max_temp"] = (-np.inf, max_temp)
+    if "humidity_range" in ideal_conditions:
+        min_humidity, max_humidity = ideal_conditions["humidity_range"]
+        bounds["min_humidity"] = (min_humidity, np.inf)
+        bounds["max_humidity"] = (-np.inf, max_humidity)
+    if "wind_speed_max" in ideal_conditions:
+        bounds["max_wind_speed"] = (-np.inf, ideal_conditions["wind_speed_max"])
+    if "cloud_cover_max" in ideal_conditions:
+        bounds["avg_cloud_cover"] = (-np.inf, ideal_conditions["cloud_cover_max"])
+    return bounds
+
+def _warning_bounds(conditions: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
+    """Field bounds a day must fall within to count towards a warning"""
+    bounds = {}
+    if "temp_min" in conditions:
+        bounds["max_temp"] = (conditions["temp_min"], np.inf)
+    if "temp_max" in conditions:
+        bounds["min_temp"] = (-np.inf, conditions["temp_max"])
+    if "rain_min" in conditions or "rain_max" in conditions:
+        bounds["precipitation_sum"] = (conditions.get("rain_min", -np.inf), conditions.get("rain_max", np.inf))
+    if "wind_min" in conditions:
+        bounds["max_wind_speed"] = (conditions["wind_min"], np.inf)
+    # AQI and UV would require additional data sources, handled separately
+    return bounds
+
+# Activity and warning rules compiled into threshold arrays, in dict order
+_ACTIVITY_LOW, _ACTIVITY_HIGH = _compile_rules([_activity_bounds(info["ideal_conditions"]) for info in ACTIVITIES.values()])
+_WARNING_LOW, _WARNING_HIGH = _compile_rules([_warning_bounds(info["conditions"]) for info in WEATHER_WARNINGS.values()])
+
+# Consecutive days each rule needs before it is noteworthy. Most activities need
+# at least 2-3 good days, except stargazing which counts nights not days
+_ACTIVITY_MIN_DAYS = np.array([2 if activity_type == "stargazing" else 3 for activity_type in ACTIVITIES], dtype=np.int64)
+_WARNING_MIN_DAYS = np.array([info["conditions"].get("consecutive_days", 1) for info in WEATHER_WARNINGS.values()], dtype=np.int64)
+
+# Template placeholder for the run length of each activity; night-only
+# activities count nights rather than days
+_ACTIVITY_RUN_PLACEHOLDERS = ["nights" if info.get("night_only") else "days" for info in ACTIVITIES.values()]
+
+# Template placeholder and the threshold it shows, by warning type
+_WARNING_TEMPLATE_THRESHOLDS = {
+    "heat_wave": ("temp", "temp_min"),
+    "cold_snap": ("temp", "temp_max"),
+    "dry_spell": ("rain", "rain_max"),
+    "heavy_rain": ("rain", "rain_min"),
+    "high_wind": ("wind", "wind_min"),
+    "air_quality": ("aqi", "aqi_min"),
+    "high_uv": ("uv", "uv_index_min")
+}
+_WARNING_TEMPLATE_VALUES = [
+    {_WARNING_TEMPLATE_THRESHOLDS[warning_type][0]: info["conditions"][_WARNING_TEMPLATE_THRESHOLDS[warning_type][1]]}
+    if warning_type in _WARNING_TEMPLATE_THRESHOLDS else {}
+    for warning_type, info in WEATHER_WARNINGS.items()
+]
+
+# Notification templates pre-bound to str.format, in dict order
+_ACTIVITY_MESSAGE_FORMATS = [tuple(template.format for template in info["notifications"]) for info in ACTIVITIES.values()]
+_WARNING_MESSAGE_FORMATS = [tuple(template.format for template in info["notifications"]) for info in WEATHER_WARNINGS.values()]
+_SEASONAL_MESSAGE_FORMATS = {
+    month_day: tuple(template.format for template in templates)
+    for month_day, (_, templates) in SEASONAL_EVENTS.items()
+}
+
+# Rule names in dict order, indexed by the rule numbers the rule engine reports
+_ACTIVITY_TYPES = list(ACTIVITIES)
+_WARNING_TYPES = list(WEATHER_WARNINGS)
+
+def _day_matrix(daily_forecasts: List[DaySummary]) -> np.ndarray:
+    """Rule fields of each day, one row per day in _RULE_FIELDS column order"""
+    return np.array([_rule_fields_of(day) for day in daily_forecasts], dtype=float).reshape(-1, len(_RULE_FIELDS))
+
+def _matching_days(days: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """
+    Check every day against every rule at once
+    
+    Args:
+        days (np.ndarray): Rule fields of each day, from _day_matrix
+        low (np.ndarray): Lower thresholds, one row per rule
+        high (np.ndarray): Upper thresholds, one row per rule
+        
+    Returns:
+        np.ndarray: Boolean matrix with one row per rule and one column per day
+    """
+    return ((days[None, :, :] >= low[:, None, :]) & (days[None, :, :] <= high[:, None, :])).all(axis=2)
+
+def _first_runs(matches: np.ndarray, min_days: np.ndarray) -> np.ndarray:
+    """
+    Find where each rule's first run of consecutive matching days begins
+    
+    Args:
+        matches (np.ndarray): Boolean matrix with one row per rule and one column per day
+        min_days (np.ndarray): Minimum run length for each rule
+        
+    Returns:
+        np.ndarray: Index of the first day of each rule's run, or -1 where there is none
+    """
+    num_rules, num_days = matches.shape
+    if num_days == 0:
+        return np.full(num_rules, -1)
+        
+    matched_so_far = np.zeros((num_rules, num_days + 1), dtype=np.int64)
+    np.cumsum(matches, axis=1, out=matched_so_far[:, 1:])
+    
+    # A window of min_days starting at each day is a run if every day in it matched
+    window_starts = np.arange(num_days)
+    window_ends = window_starts[None, :] + min_days[:, None]
+    rows = np.arange(num_rules)[:, None]
+    in_range = window_ends <= num_days
+    window_matches = matched_so_far[rows, np.minimum(window_ends, num_days)] - matched_so_far[:, :num_days]
+    is_run = in_range & (window_matches == min_days[:, None])
+    
+    return np.where(is_run.any(axis=1), is_run.argmax(axis=1), -1)
+
+class RuleEngine:
+    """
+    Matches threshold rules against daily forecasts using whole-array operations
+    
+    Each rule bounds the _RULE_FIELDS of a day from below and above and needs a
+    number of consecutive matching days. Rules are grouped by kind and numbered
+    within their kind in the order given, so every kind of rule is checked in one
+    pass and no per-day loop runs in Python.
+    """
+    
+    def __init__(self, rules: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]):
+        """
+        Args:
+            rules (dict): Lower thresholds, upper thresholds and minimum run length of each kind of rule
+        """
+        self.kinds = tuple(rules)
+        self.low = np.vstack([low for low, _, _ in rules.values()])
+        self.high = np.vstack([high for _, high, _ in rules.values()])
+        self.min_days = np.concatenate([min_days for _, _, min_days in rules.values()])
+        self.rule_kinds = np.concatenate([np.full(len(min_days), k) for k, (_, _, min_days) in enumerate(rules.values())])
+        self.rule_numbers = np.concatenate([np.arange(len(min_days)) for _, _, min_days in rules.values()])
+        
+    def match(self, days: np.ndarray, kinds: Optional[Tuple[str, ...]] = None) -> Dict[str, List[Tuple[int, int, int]]]:
+        """
+        Find each rule's first run of consecutive matching days
+        
+        Args:
+            days (np.ndarray): Rule fields of each day, from _day_matrix
+            kinds (tuple, optional): Kinds of rules to check. Defaults to all of them.
+            
+        Returns:
+            dict: For each kind, (rule number, start day, run length) of the rules that have a run
+        """
+        kinds = self.kinds if kinds is None else kinds
+        runs = {kind: [] for kind in kinds}
+        num_days = len(days)
+        if num_days == 0:
+            return runs
+            
+        # Only scan rules the forecast could satisfy: each bound must be met by some
+        # day, and there must be enough days for the run
+        feasible = (
+            np.isin(self.rule_kinds, [self.kinds.index(kind) for kind in kinds])
+            & (self.min_days <= num_days)
+            & (self.low <= days.max(axis=0)).all(axis=1)
+            & (self.high >= days.min(axis=0)).all(axis=1)
+        )
+        rules = np.flatnonzero(feasible)
+        if len(rules) == 0:
+            return runs
+            
+        matches = _matching_days(days, self.low[rules], self.high[rules])
+        run_starts = _first_runs(matches, self.min_days[rules])
+        for rule, start in zip(rules.tolist(), run_starts.tolist()):
+            if start >= 0:
+                runs[self.kinds[self.rule_kinds[rule]]].append((int(self.rule_numbers[rule]), start, int(self.min_days[rule])))
+        return runs
+
+# Activity and warning rules, checked together in one pass
+_rule_engine = RuleEngine({
+    "activity": (_ACTIVITY_LOW, _ACTIVITY_HIGH, _ACTIVITY_MIN_DAYS),
+    "warning": (_WARNING_LOW, _WARNING_HIGH, _WARNING_MIN_DAYS)
+})
+
+def _is_live(notifications: Dict[str, Any]) -> bool:
+    """Whether notifications were built from API weather data, so they may be cached"""
+    return not weather_utils.is_simulated(notifications)
+
+@ttl_cache(NOTIFICATIONS_CACHE_TTL, cache_if=_is_live)
+def _cached_smart_notifications(city: str, days_ahead: int) -> Dict[str, Any]:
+    """
+    Build the smart notifications for a city and look-ahead, reusing recent results
+    
+    Notifications built from simulated weather are not reused.
+    """
+    # Get weather forecast and current conditions concurrently
+    forecast_future = _executor.submit(weather_utils.get_weather_forecast, city)
+    current_future = _executor.submit(weather_utils.get_city_weather, city)
+    forecast_data = forecast_future.result()
+    current_weather = current_future.result()
+    
+    # Initialize notification containers
+    activity_notifications = []
+    warning_notifications = []
+    seasonal_notifications = []
+    weather_pattern_notifications = []
+    agricultural_notifications = []
+    
+    # Process forecast data into daily summaries
+    daily_forecasts = process_forecast_data(forecast_data)
+    
+    # Check activity and warning conditions together in a single pass over the days
+    rule_runs = scan_forecast_rules(daily_forecasts, days_ahead)
+    
+    # Generate activity recommendations based on suitable weather patterns
+    activity_notifications = generate_activity_notifications(daily_forecasts, days_ahead, rule_runs["activity"])
+    
+    # Generate warning notifications based on extreme or noteworthy conditions
+    warning_notifications = generate_warning_notifications(daily_forecasts, days_ahead, rule_runs["warning"])
+    
+    # Generate seasonal and calendar-aware notifications
+    seasonal_notifications = generate_seasonal_notifications(daily_forecasts, city)
+    
+    # Generate notifications based on weather patterns and changes
+    weather_pattern_notifications = generate_weather_pattern_notifications(daily_forecasts, current_weather)
+    
+    # Generate agricultural notifications (garden/plant specific)
+    agricultural_notifications = generate_agricultural_notifications(city, daily_forecasts)
+    
+    # Combine notifications, tagging each with its type and priority
+    all_notifications = []
+    for notification_type, priority, notifications in (
+        ("warning", 1, warning_notifications),
+        ("activity", 2, activity_notifications),
+        ("seasonal", 3, seasonal_notifications),
+        ("agricultural", 3, agricultural_notifications),
+        ("pattern", 4, weather_pattern_notifications)
+    ):
+        for notification in notifications:
+            notification["type"] = notification_type
+            notification["priority"] = priority
+        all_notifications.extend(notifications)
+    
+    # Keep the highest priority ones (lower number = higher priority), limited
+    # to a reasonable number of notifications (adjust as needed)
+    top_notifications = heapq.nsmallest(10, all_notifications, key=itemgetter("priority"))
+    
+    result = {
+        "city": city,
+        "generated_at": datetime.now().isoformat(),
+        "forecast_days": days_ahead,
+        "notifications": top_notifications,
+        "notification_count": len(top_notifications)
+    }
+    if weather_utils.is_simulated(forecast_data) or weather_utils.is_simulated(current_weather):
+        result = weather_utils.SimulatedData(result)
+    return result
+
+def scan_forecast_rules(daily_forecasts: List[DaySummary], days_ahead: int,
+                        kinds: Optional[Tuple[str, ...]] = None) -> Dict[str, List[Tuple[int, int, int]]]:
+    """
+    Find the first qualifying run of days for activity and warning rules
+    
+    Args:
+        daily_forecasts (list): Daily forecast summaries
+        days_ahead (int): Number of days to look ahead
+        kinds (tuple, optional): Kinds of rules to check ("activity", "warning"). Defaults to both.
+        
+    Returns:
+        dict: For each kind, (rule number, start day, run length) of the rules that have a run
+    """
+    # Ensure we don't look beyond available forecast data
+    days_to_check = min(days_ahead, len(daily_forecasts))
+    
+    return _rule_engine.match(_day_matrix(daily_forecasts[:days_to_check]), kinds)
+
 def get_smart_notifications(city: str, days_ahead: int = 7) -> Dict[str, Any]:
     """
     Generate smart, context-aware notifications based on weather forecast and patterns
@@ -243,56 +609,8 @@ def get_smart_notifications(city: str, days_ahead: int = 7) -> Dict[str, Any]:
         # Limit days ahead to a reasonable range
         days_ahead = min(max(days_ahead, 3), 14)
         
-        # Get weather forecast
-        forecast_data = weather_utils.get_weather_forecast(city)
-        current_weather = weather_utils.get_city_weather(city)
-        
-        # Initialize notification containers
-        activity_notifications = []
-        warning_notifications = []
-        seasonal_notifications = []
-        weather_pattern_notifications = []
-        agricultural_notifications = []
-        
-        # Process forecast data into daily summaries
-        daily_forecasts = process_forecast_data(forecast_data)
-        
-        # Generate activity recommendations based on suitable weather patterns
-        activity_notifications = generate_activity_notifications(daily_forecasts, days_ahead)
-        
-        # Generate warning notifications based on extreme or noteworthy conditions
-        warning_notifications = generate_warning_notifications(daily_forecasts, days_ahead)
-        
-        # Generate seasonal and calendar-aware notifications
-        seasonal_notifications = generate_seasonal_notifications(daily_forecasts, city)
-        
-        # Generate notifications based on weather patterns and changes
-        weather_pattern_notifications = generate_weather_pattern_notifications(daily_forecasts, current_weather)
-        
-        # Generate agricultural notifications (garden/plant specific)
-        agricultural_notifications = generate_agricultural_notifications(city, daily_forecasts)
-        
-        # Combine, prioritize and limit notifications
-        all_notifications = []
-        all_notifications.extend([{"type": "warning", "priority": 1, **notification} for notification in warning_notifications])
-        all_notifications.extend([{"type": "activity", "priority": 2, **notification} for notification in activity_notifications])
-        all_notifications.extend([{"type": "seasonal", "priority": 3, **notification} for notification in seasonal_notifications])
-        all_notifications.extend([{"type": "agricultural", "priority": 3, **notification} for notification in agricultural_notifications])
-        all_notifications.extend([{"type": "pattern", "priority": 4, **notification} for notification in weather_pattern_notifications])
-        
-        # Sort by priority (lower number = higher priority)
-        all_notifications.sort(key=lambda x: x["priority"])
-        
-        # Limit to a reasonable number of notifications (adjust as needed)
-        top_notifications = all_notifications[:10]
-        
-        return {
-            "city": city,
-            "generated_at": datetime.now().isoformat(),
-            "forecast_days": days_ahead,
-            "notifications": top_notifications,
-            "notification_count": len(top_notifications)
-        }
+        # Cached results are shared, so hand out a copy of the top-level dict
+        return dict(_cached_smart_notifications(city, days_ahead))
         
     except Exception as e:
         logger.error(f"Error generating smart notifications for {city}: {e}")
@@ -311,7 +629,24 @@ def get_smart_notifications(city: str, days_ahead: int = 7) -> Dict[str, Any]:
             "generated_at": datetime.now().isoformat()
         }
 
-def process_forecast_data(forecast_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+@lru_cache(maxsize=4096)
+def _local_day_ordinal(timestamp: int) -> int:
+    """
+    Local calendar day of a forecast timestamp, as a proleptic Gregorian ordinal
+    
+    Forecast periods sit on a shared 3-hour grid, so the same timestamps come up
+    for every city and request. Caching per timestamp keeps daylight saving
+    changes correct, which a fixed UTC offset taken at import would not.
+    
+    Args:
+        timestamp (int): Unix timestamp
+        
+    Returns:
+        int: Day ordinal in local time
+    """
+    return datetime.fromtimestamp(timestamp).toordinal()
+
+def process_forecast_data(forecast_data: Dict[str, Any]) -> List[DaySummary]:
     """
     Process raw forecast data into daily summaries
     
@@ -328,276 +663,193 @@ def process_forecast_data(forecast_data: Dict[str, Any]) -> List[Dict[str, Any]]
         # Return empty list or generate placeholder data
         return daily_forecasts
     
-    # Group forecast periods by day
-    forecast_by_day = {}
-    for period in forecast_data['list']:
+    periods = forecast_data['list']
+    if not periods:
+        return daily_forecasts
+    
+    # Pull every period's readings into flat arrays in one pass, using NaN for
+    # readings a period doesn't report so they drop out of the daily figures
+    count = len(periods)
+    day_ordinals = np.empty(count, dtype=np.int64)
+    temps = np.full(count, np.nan)
+    humidities = np.full(count, np.nan)
+    wind_speeds = np.full(count, np.nan)
+    cloud_covers = np.full(count, np.nan)
+    precip_probs = np.full(count, np.nan)
+    precip = np.zeros(count)
+    weather = []
+    
+    for i, period in enumerate(periods):
         # Get date from timestamp
-        period_time = datetime.fromtimestamp(period['dt'])
-        period_date = period_time.date()
+        day_ordinals[i] = _local_day_ordinal(period['dt'])
         
-        if period_date not in forecast_by_day:
-            forecast_by_day[period_date] = []
-            
-        forecast_by_day[period_date].append(period)
+        if 'main' in period:
+            temps[i] = period['main'].get('temp', 20)
+            humidities[i] = period['main'].get('humidity', 50)
+        if 'wind' in period:
+            wind_speeds[i] = period['wind'].get('speed', 0)
+        if 'clouds' in period:
+            cloud_covers[i] = period['clouds'].get('all', 50)
+        if 'pop' in period:
+            precip_probs[i] = period['pop']
+        if 'rain' in period and '3h' in period['rain']:
+            precip[i] = period['rain']['3h']
+        weather.append(period['weather'][0] if 'weather' in period and len(period['weather']) > 0 else None)
+    
+    # Group forecast periods by day, keeping each day's periods in their original order
+    order = np.argsort(day_ordinals, kind='stable')
+    day_ordinals = day_ordinals[order]
+    starts = np.flatnonzero(np.r_[True, day_ordinals[1:] != day_ordinals[:-1]])
+    ends = np.r_[starts[1:], count]
+    
+    def daily_stats(values: np.ndarray, default: float) -> Tuple[list, list, list]:
+        """Per-day min, max and mean of a reading, ignoring periods without it"""
+        values = values[order]
+        present = ~np.isnan(values)
+        counts = np.add.reduceat(present, starts)
+        sums = np.add.reduceat(np.where(present, values, 0.0), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        has_data = counts > 0
+        return (
+            np.where(has_data, np.fmin.reduceat(values, starts), default).tolist(),
+            np.where(has_data, np.fmax.reduceat(values, starts), default).tolist(),
+            np.where(has_data, means, default).tolist()
+        )
+    
+    min_temps, max_temps, avg_temps = daily_stats(temps, 20)
+    min_humidities, max_humidities, avg_humidities = daily_stats(humidities, 50)
+    _, max_wind_speeds, avg_wind_speeds = daily_stats(wind_speeds, 0)
+    _, _, avg_cloud_covers = daily_stats(cloud_covers, 50)
+    _, _, avg_precip_probs = daily_stats(precip_probs, 0)
+    precip_sums = np.add.reduceat(precip[order], starts)
+    will_rain = ((np.array(avg_precip_probs) > 0.4) | (precip_sums > 0.5)).tolist()
+    precip_sums = precip_sums.tolist()
     
     # Process each day's forecast into a summary
-    for day, periods in sorted(forecast_by_day.items()):
-        # Extract relevant data
-        temps = [period.get('main', {}).get('temp', 20) for period in periods if 'main' in period]
-        humidities = [period.get('main', {}).get('humidity', 50) for period in periods if 'main' in period]
-        wind_speeds = [period.get('wind', {}).get('speed', 0) for period in periods if 'wind' in period]
-        cloud_covers = [period.get('clouds', {}).get('all', 50) for period in periods if 'clouds' in period]
-        
-        # Calculate precipitation sum and probability
-        precip_sum = 0
-        for period in periods:
-            if 'rain' in period and '3h' in period['rain']:
-                precip_sum += period['rain']['3h']
-                
-        precip_probs = [period.get('pop', 0) for period in periods if 'pop' in period]
-        avg_precip_prob = sum(precip_probs) / len(precip_probs) if precip_probs else 0
+    for d, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        day = date.fromordinal(int(day_ordinals[start]))
         
         # Get weather conditions
-        weather_ids = [period.get('weather', [{}])[0].get('id', 800) for period in periods if 'weather' in period and len(period['weather']) > 0]
-        weather_conditions = [period.get('weather', [{}])[0].get('main', '') for period in periods if 'weather' in period and len(period['weather']) > 0]
-        dominant_condition = max(set(weather_conditions), key=weather_conditions.count) if weather_conditions else "Clear"
+        day_weather = [weather[k] for k in order[start:end].tolist() if weather[k] is not None]
+        weather_ids = [w.get('id', 800) for w in day_weather]
+        weather_conditions = [w.get('main', '') for w in day_weather]
+        dominant_condition = Counter(weather_conditions).most_common(1)[0][0] if weather_conditions else "Clear"
         
         # Create day summary
-        day_summary = {
-            "date": day.strftime("%Y-%m-%d"),
-            "day_of_week": day.strftime("%A"),
-            "min_temp": min(temps) if temps else 20,
-            "max_temp": max(temps) if temps else 20,
-            "avg_temp": sum(temps) / len(temps) if temps else 20,
-            "min_humidity": min(humidities) if humidities else 50,
-            "max_humidity": max(humidities) if humidities else 50,
-            "avg_humidity": sum(humidities) / len(humidities) if humidities else 50,
-            "max_wind_speed": max(wind_speeds) if wind_speeds else 0,
-            "avg_wind_speed": sum(wind_speeds) / len(wind_speeds) if wind_speeds else 0,
-            "precipitation_sum": precip_sum,
-            "precipitation_probability": avg_precip_prob,
-            "will_rain": avg_precip_prob > 0.4 or precip_sum > 0.5,
-            "avg_cloud_cover": sum(cloud_covers) / len(cloud_covers) if cloud_covers else 50,
-            "condition": dominant_condition,
-            "condition_ids": weather_ids,
-            "raw_periods": periods  # Keep raw data for specialized processing
-        }
+        day_summary = DaySummary(
+            date=day.strftime("%Y-%m-%d"),
+            date_obj=day,
+            day_of_week=day.strftime("%A"),
+            min_temp=min_temps[d],
+            max_temp=max_temps[d],
+            avg_temp=avg_temps[d],
+            min_humidity=min_humidities[d],
+            max_humidity=max_humidities[d],
+            avg_humidity=avg_humidities[d],
+            max_wind_speed=max_wind_speeds[d],
+            avg_wind_speed=avg_wind_speeds[d],
+            precipitation_sum=precip_sums[d],
+            precipitation_probability=avg_precip_probs[d],
+            will_rain=will_rain[d],
+            avg_cloud_cover=avg_cloud_covers[d],
+            condition=dominant_condition,
+            condition_lc=dominant_condition.lower(),
+            condition_ids=weather_ids
+        )
         
         daily_forecasts.append(day_summary)
     
     return daily_forecasts
 
-def generate_activity_notifications(daily_forecasts: List[Dict[str, Any]], days_ahead: int) -> List[Dict[str, Any]]:
+def generate_activity_notifications(daily_forecasts: List[DaySummary], days_ahead: int,
+                                    runs: Optional[List[Tuple[int, int, int]]] = None) -> List[Dict[str, Any]]:
     """
     Generate notifications recommending activities based on suitable weather patterns
     
     Args:
         daily_forecasts (list): Daily forecast summaries
         days_ahead (int): Number of days to look ahead
+        runs (list, optional): Activity runs from scan_forecast_rules. Defaults to scanning here.
         
     Returns:
         list: Activity recommendation notifications
     """
     notifications = []
     
-    # Ensure we don't look beyond available forecast data
-    days_to_check = min(days_ahead, len(daily_forecasts))
-    
     # Look for activity-suitable weather patterns
-    for activity_type, activity_info in ACTIVITIES.items():
-        ideal_conditions = activity_info["ideal_conditions"]
+    if runs is None:
+        runs = scan_forecast_rules(daily_forecasts, days_ahead, ("activity",))["activity"]
         
-        # Find consecutive days matching the activity conditions
-        consecutive_days = 0
-        start_day_idx = 0
+    # Generate a notification for each activity with enough consecutive good days
+    for activity_idx, start_day_idx, consecutive_days in runs:
+        activity_type = _ACTIVITY_TYPES[activity_idx]
         
-        for i in range(days_to_check):
-            day = daily_forecasts[i]
-            
-            conditions_met = True
-            
-            # Check rain condition if specified
-            if "rain" in ideal_conditions:
-                if ideal_conditions["rain"] == False and day["will_rain"]:
-                    conditions_met = False
-                elif ideal_conditions["rain"] == True and not day["will_rain"]:
-                    conditions_met = False
-            
-            # Check temperature range if specified
-            if "temp_range" in ideal_conditions:
-                min_temp, max_temp = ideal_conditions["temp_range"]
-                if day["min_temp"] < min_temp or day["max_temp"] > max_temp:
-                    conditions_met = False
-            
-            # Check humidity range if specified
-            if "humidity_range" in ideal_conditions:
-                min_humidity, max_humidity = ideal_conditions["humidity_range"]
-                if day["min_humidity"] < min_humidity or day["max_humidity"] > max_humidity:
-                    conditions_met = False
-            
-            # Check wind speed if specified
-            if "wind_speed_max" in ideal_conditions and day["max_wind_speed"] > ideal_conditions["wind_speed_max"]:
-                conditions_met = False
-            
-            # Check cloud cover if specified
-            if "cloud_cover_max" in ideal_conditions and day["avg_cloud_cover"] > ideal_conditions["cloud_cover_max"]:
-                conditions_met = False
-            
-            # Handle consecutive days counting
-            if conditions_met:
-                if consecutive_days == 0:
-                    start_day_idx = i
-                consecutive_days += 1
-            else:
-                # Reset counter if a day doesn't meet conditions
-                consecutive_days = 0
-            
-            # Generate notification if we have enough consecutive good days
-            # Most activities need at least 2-3 good days to be noteworthy
-            min_days_needed = 3
-            
-            # Special case for stargazing which counts nights not days
-            if activity_type == "stargazing":
-                min_days_needed = 2
-                
-            if consecutive_days >= min_days_needed:
-                # Select a random notification template
-                notification_templates = activity_info["notifications"]
-                template = random.choice(notification_templates)
-                
-                # Format the notification
-                start_date = datetime.strptime(daily_forecasts[start_day_idx]["date"], "%Y-%m-%d").date()
-                end_date = start_date + timedelta(days=consecutive_days - 1)
-                
-                # Special handling for night-only activities
-                if "night_only" in activity_info and activity_info["night_only"]:
-                    message = template.format(nights=consecutive_days)
-                else:
-                    message = template.format(days=consecutive_days)
-                
-                notifications.append({
-                    "message": message,
-                    "activity_type": activity_type,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                    "consecutive_days": consecutive_days,
-                    "icon": get_activity_icon(activity_type)
-                })
-                
-                # Once we find an activity pattern, break and move to next activity type
-                break
+        # Select a random notification template
+        format_message = _rng.choice(_ACTIVITY_MESSAGE_FORMATS[activity_idx])
+        
+        # Format the notification
+        start_date = daily_forecasts[start_day_idx].date_obj
+        end_date = start_date + timedelta(days=consecutive_days - 1)
+        
+        message = format_message(**{_ACTIVITY_RUN_PLACEHOLDERS[activity_idx]: consecutive_days})
+        
+        notifications.append({
+            "message": message,
+            "activity_type": activity_type,
+            "start_date": start_date.strftime("%Y-%m-%d"),
+            "end_date": end_date.strftime("%Y-%m-%d"),
+            "consecutive_days": consecutive_days,
+            "icon": get_activity_icon(activity_type)
+        })
     
     return notifications
 
-def generate_warning_notifications(daily_forecasts: List[Dict[str, Any]], days_ahead: int) -> List[Dict[str, Any]]:
+def generate_warning_notifications(daily_forecasts: List[DaySummary], days_ahead: int,
+                                   runs: Optional[List[Tuple[int, int, int]]] = None) -> List[Dict[str, Any]]:
     """
     Generate warning notifications based on extreme or noteworthy conditions
     
     Args:
         daily_forecasts (list): Daily forecast summaries
         days_ahead (int): Number of days to look ahead
+        runs (list, optional): Warning runs from scan_forecast_rules. Defaults to scanning here.
         
     Returns:
         list: Warning notifications
     """
     notifications = []
     
-    # Ensure we don't look beyond available forecast data
-    days_to_check = min(days_ahead, len(daily_forecasts))
-    
     # Look for weather warning patterns
-    for warning_type, warning_info in WEATHER_WARNINGS.items():
-        conditions = warning_info["conditions"]
-        consecutive_days_needed = conditions.get("consecutive_days", 1)
+    if runs is None:
+        runs = scan_forecast_rules(daily_forecasts, days_ahead, ("warning",))["warning"]
         
-        # Find consecutive days matching the warning conditions
-        consecutive_days = 0
-        start_day_idx = 0
+    # Generate a notification for each warning with enough consecutive days of its conditions
+    for warning_idx, start_day_idx, consecutive_days in runs:
+        warning_type = _WARNING_TYPES[warning_idx]
         
-        for i in range(days_to_check):
-            day = daily_forecasts[i]
-            
-            conditions_met = True
-            
-            # Check temperature minimum if specified
-            if "temp_min" in conditions and day["max_temp"] < conditions["temp_min"]:
-                conditions_met = False
-            
-            # Check temperature maximum if specified
-            if "temp_max" in conditions and day["min_temp"] > conditions["temp_max"]:
-                conditions_met = False
-            
-            # Check rainfall minimum if specified
-            if "rain_min" in conditions and day["precipitation_sum"] < conditions["rain_min"]:
-                conditions_met = False
-            
-            # Check rainfall maximum if specified
-            if "rain_max" in conditions and day["precipitation_sum"] > conditions["rain_max"]:
-                conditions_met = False
-            
-            # Check wind speed if specified
-            if "wind_min" in conditions and day["max_wind_speed"] < conditions["wind_min"]:
-                conditions_met = False
-            
-            # AQI and UV would require additional data sources, handled separately
-            
-            # Handle consecutive days counting
-            if conditions_met:
-                if consecutive_days == 0:
-                    start_day_idx = i
-                consecutive_days += 1
-            else:
-                # Reset counter if a day doesn't meet conditions
-                consecutive_days = 0
-            
-            # Generate notification if we have enough consecutive days with warning conditions
-            if consecutive_days >= consecutive_days_needed:
-                # Select a random notification template
-                notification_templates = warning_info["notifications"]
-                template = random.choice(notification_templates)
-                
-                # Format the notification
-                start_date = datetime.strptime(daily_forecasts[start_day_idx]["date"], "%Y-%m-%d").date()
-                end_date = start_date + timedelta(days=consecutive_days - 1)
-                
-                # Set variables for template formatting
-                format_vars = {
-                    "days": consecutive_days
-                }
-                
-                # Add specific condition values based on warning type
-                if warning_type == "heat_wave":
-                    format_vars["temp"] = conditions["temp_min"]
-                elif warning_type == "cold_snap":
-                    format_vars["temp"] = conditions["temp_max"]
-                elif warning_type == "dry_spell":
-                    format_vars["rain"] = conditions["rain_max"]
-                elif warning_type == "heavy_rain":
-                    format_vars["rain"] = conditions["rain_min"]
-                elif warning_type == "high_wind":
-                    format_vars["wind"] = conditions["wind_min"]
-                elif warning_type == "air_quality":
-                    format_vars["aqi"] = conditions["aqi_min"]
-                elif warning_type == "high_uv":
-                    format_vars["uv"] = conditions["uv_index_min"]
-                
-                message = template.format(**format_vars)
-                
-                notifications.append({
-                    "message": message,
-                    "warning_type": warning_type,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                    "consecutive_days": consecutive_days,
-                    "icon": get_warning_icon(warning_type)
-                })
-                
-                # Once we find a warning pattern, break and move to next warning type
-                break
+        # Select a random notification template
+        format_message = _rng.choice(_WARNING_MESSAGE_FORMATS[warning_idx])
+        
+        # Format the notification
+        start_date = daily_forecasts[start_day_idx].date_obj
+        end_date = start_date + timedelta(days=consecutive_days - 1)
+        
+        # Fill in the run length and the threshold the warning is about
+        message = format_message(days=consecutive_days, **_WARNING_TEMPLATE_VALUES[warning_idx])
+        
+        notifications.append({
+            "message": message,
+            "warning_type": warning_type,
+            "start_date": start_date.strftime("%Y-%m-%d"),
+            "end_date": end_date.strftime("%Y-%m-%d"),
+            "consecutive_days": consecutive_days,
+            "icon": get_warning_icon(warning_type)
+        })
     
     return notifications
 
-def generate_seasonal_notifications(daily_forecasts: List[Dict[str, Any]], city: str) -> List[Dict[str, Any]]:
+def generate_seasonal_notifications(daily_forecasts: List[DaySummary], city: str) -> List[Dict[str, Any]]:
     """
     Generate seasonal and calendar-aware notifications
     
@@ -612,6 +864,7 @@ def generate_seasonal_notifications(daily_forecasts: List[Dict[str, Any]], city:
     
     # Get current date and look ahead up to 7 days
     today = datetime.now().date()
+    forecasts_by_date = {day.date_obj: day for day in daily_forecasts}
     
     # Check for upcoming seasonal events
     for day_offset in range(1, 8):  # Look ahead 1-7 days
@@ -620,18 +873,15 @@ def generate_seasonal_notifications(daily_forecasts: List[Dict[str, Any]], city:
         
         # Check if date matches any seasonal event
         if month_day in SEASONAL_EVENTS:
-            event_name, notification_templates = SEASONAL_EVENTS[month_day]
-            template = random.choice(notification_templates)
+            event_name = SEASONAL_EVENTS[month_day][0]
+            format_message = _rng.choice(_SEASONAL_MESSAGE_FORMATS[month_day])
             
             # Get weather condition for the event day (if we have forecast data)
-            condition = "varied"
-            for day in daily_forecasts:
-                if day["date"] == check_date.strftime("%Y-%m-%d"):
-                    condition = day["condition"].lower()
-                    break
+            event_day = forecasts_by_date.get(check_date)
+            condition = event_day.condition_lc if event_day is not None else "varied"
             
             # Format the notification
-            message = template.format(condition=condition)
+            message = format_message(condition=condition)
             
             notifications.append({
                 "message": message,
@@ -644,8 +894,8 @@ def generate_seasonal_notifications(daily_forecasts: List[Dict[str, Any]], city:
     # Check for local weather patterns that align with seasonal transitions
     if len(daily_forecasts) >= 5:
         # Look for temperature trends indicating seasonal shifts
-        first_temps = [daily_forecasts[0]["min_temp"], daily_forecasts[0]["max_temp"]]
-        last_temps = [daily_forecasts[4]["min_temp"], daily_forecasts[4]["max_temp"]]
+        first_temps = [daily_forecasts[0].min_temp, daily_forecasts[0].max_temp]
+        last_temps = [daily_forecasts[4].min_temp, daily_forecasts[4].max_temp]
         
         temp_change = (sum(last_temps) / 2) - (sum(first_temps) / 2)
         
@@ -668,7 +918,7 @@ def generate_seasonal_notifications(daily_forecasts: List[Dict[str, Any]], city:
     
     return notifications
 
-def generate_weather_pattern_notifications(daily_forecasts: List[Dict[str, Any]], current_weather: Dict[str, Any]) -> List[Dict[str, Any]]:
+def generate_weather_pattern_notifications(daily_forecasts: List[DaySummary], current_weather: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Generate notifications based on weather patterns and changes
     
@@ -687,12 +937,11 @@ def generate_weather_pattern_notifications(daily_forecasts: List[Dict[str, Any]]
     
     # Detect significant weather changes
     if len(daily_forecasts) >= 3:
-        today_conditions = daily_forecasts[0]["condition"].lower()
-        tomorrow_conditions = daily_forecasts[1]["condition"].lower()
+        today_conditions = daily_forecasts[0].condition_lc
+        tomorrow_conditions = daily_forecasts[1].condition_lc
         
         # Weather changing from good to bad
-        if (today_conditions in ["clear", "clouds", "few clouds"] and 
-            tomorrow_conditions in ["rain", "thunderstorm", "snow", "drizzle"]):
+        if today_conditions in _GOOD_CONDITIONS and tomorrow_conditions in _BAD_CONDITIONS:
             notifications.append({
                 "message": f"Weather change alert: {today_conditions.capitalize()} today turning to {tomorrow_conditions} tomorrow.",
                 "change_type": "deteriorating",
@@ -700,8 +949,7 @@ def generate_weather_pattern_notifications(daily_forecasts: List[Dict[str, Any]]
             })
         
         # Weather changing from bad to good
-        elif (today_conditions in ["rain", "thunderstorm", "snow", "drizzle"] and 
-              tomorrow_conditions in ["clear", "clouds", "few clouds"]):
+        elif today_conditions in _BAD_CONDITIONS and tomorrow_conditions in _GOOD_CONDITIONS:
             notifications.append({
                 "message": f"Weather improvement ahead: {today_conditions.capitalize()} today clearing to {tomorrow_conditions} tomorrow.",
                 "change_type": "improving",
@@ -720,7 +968,7 @@ def generate_weather_pattern_notifications(daily_forecasts: List[Dict[str, Any]]
     
     return notifications
 
-def generate_agricultural_notifications(city: str, daily_forecasts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def generate_agricultural_notifications(city: str, daily_forecasts: List[DaySummary]) -> List[Dict[str, Any]]:
     """
     Generate agricultural notifications for gardening and farming
     
@@ -779,7 +1027,7 @@ def generate_agricultural_notifications(city: str, daily_forecasts: List[Dict[st
                     })
         
         # Check for frost risk based on temperatures
-        if daily_forecasts and daily_forecasts[0]["min_temp"] < 3:
+        if daily_forecasts and daily_forecasts[0].min_temp < 3:
             notifications.append({
                 "message": "Frost alert: Protect sensitive plants tonight as temperatures approach freezing.",
                 "notification_type": "frost",
@@ -787,7 +1035,7 @@ def generate_agricultural_notifications(city: str, daily_forecasts: List[Dict[st
             })
         
         # Check for extreme heat risk for plants
-        if daily_forecasts and daily_forecasts[0]["max_temp"] > 32:
+        if daily_forecasts and daily_forecasts[0].max_temp > 32:
             notifications.append({
                 "message": "Heat stress alert: Provide afternoon shade and extra water for garden plants today.",
                 "notification_type": "heat",
@@ -799,7 +1047,7 @@ def generate_agricultural_notifications(city: str, daily_forecasts: List[Dict[st
     
     return notifications
 
-def detect_unusual_patterns(daily_forecasts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def detect_unusual_patterns(daily_forecasts: List[DaySummary]) -> List[Dict[str, Any]]:
     """
     Detect unusual or rare weather patterns
     
@@ -811,73 +1059,73 @@ def detect_unusual_patterns(daily_forecasts: List[Dict[str, Any]]) -> List[Dict[
     """
     notifications = []
     
-    # Check for rare or unusual patterns
-    consecutive_rain_days = 0
-    consecutive_clear_days = 0
-    
-    for day in daily_forecasts:
-        condition = day["condition"].lower()
-        
-        # Count consecutive rain days
-        if condition in ["rain", "thunderstorm", "drizzle"]:
-            consecutive_rain_days += 1
-            consecutive_clear_days = 0
-        # Count consecutive clear days
-        elif condition in ["clear", "few clouds"]:
-            consecutive_clear_days += 1
-            consecutive_rain_days = 0
-        else:
-            # Reset both counters for other conditions
-            consecutive_rain_days = 0
-            consecutive_clear_days = 0
+    # Need at least two days to see any pattern or change
+    if len(daily_forecasts) < 2:
+        return notifications
         
-        # Check thresholds for unusual patterns
-        if consecutive_rain_days == 4:  # 4+ days of rain is unusual in many climates
-            notifications.append({
-                "message": f"Unusual pattern: {consecutive_rain_days} consecutive days of rain in the forecast.",
-                "pattern_type": "persistent_rain",
-                "days": consecutive_rain_days,
-                "icon": "cloud-rain-persistent"
-            })
-            break  # Only report once
-            
-        if consecutive_clear_days == 5:  # 5+ days of clear weather can be noteworthy
-            notifications.append({
-                "message": f"Extended clear spell: {consecutive_clear_days} consecutive days of clear skies ahead.",
-                "pattern_type": "persistent_clear",
-                "days": consecutive_clear_days,
-                "icon": "sun-persistent"
-            })
-            break  # Only report once
+    # Read each day once for both the condition and the temperature checks
+    day_codes = []
+    max_temps = []
+    for day in daily_forecasts:
+        day_codes.append(_DAY_CODES.get(day.condition_lc, _OTHER_DAY))
+        max_temps.append(day.max_temp)
+    
+    # Check for rare or unusual patterns: the first run of rain or clear days long
+    # enough to be noteworthy, whichever completes first. Shorter forecasts can't
+    # hold a spell, so skip straight to the temperature checks.
+    if len(day_codes) >= _SHORTEST_PERSISTENT_SPELL:
+        day_codes = np.array(day_codes, dtype=np.int8)
+        runs = _first_runs(day_codes[None, :] == _PERSISTENT_DAY_CODES[:, None], _PERSISTENT_MIN_DAYS)
+        run_ends = np.where(runs >= 0, runs + _PERSISTENT_MIN_DAYS, len(day_codes) + 1)
+        pattern = int(run_ends.argmin())
+        if runs[pattern] >= 0:
+            consecutive_days = int(_PERSISTENT_MIN_DAYS[pattern])
+            if _PERSISTENT_DAY_CODES[pattern] == _RAIN_DAY:
+                notifications.append({
+                    "message": f"Unusual pattern: {consecutive_days} consecutive days of rain in the forecast.",
+                    "pattern_type": "persistent_rain",
+                    "days": consecutive_days,
+                    "icon": "cloud-rain-persistent"
+                })
+            else:
+                notifications.append({
+                    "message": f"Extended clear spell: {consecutive_days} consecutive days of clear skies ahead.",
+                    "pattern_type": "persistent_clear",
+                    "days": consecutive_days,
+                    "icon": "sun-persistent"
+                })
     
     # Check for temperature inversions or other unusual temperature patterns
-    for i in range(len(daily_forecasts) - 1):
+    max_temps = np.array(max_temps, dtype=float)
+    
+    # Significant temperature drops and rises (>8°C change in max temperature) from each day to the next
+    drops = max_temps[1:] < max_temps[:-1] - 8
+    rises = max_temps[1:] > max_temps[:-1] + 8
+    changes = np.flatnonzero(drops | rises)
+    if len(changes):
+        # Only report the first occurrence
+        i = int(changes[0])
         today = daily_forecasts[i]
         tomorrow = daily_forecasts[i+1]
         
-        # Significant temperature drop (>8°C drop in max temperature)
-        if tomorrow["max_temp"] < today["max_temp"] - 8:
+        if drops[i]:
             notifications.append({
-                "message": f"Temperature drop alert: {int(today['max_temp'] - tomorrow['max_temp'])}°C cooler tomorrow compared to today.",
+                "message": f"Temperature drop alert: {int(today.max_temp - tomorrow.max_temp)}°C cooler tomorrow compared to today.",
                 "pattern_type": "temp_drop",
-                "drop_amount": today["max_temp"] - tomorrow["max_temp"],
+                "drop_amount": today.max_temp - tomorrow.max_temp,
                 "icon": "temperature-drop"
             })
-            break  # Only report the first occurrence
-        
-        # Significant temperature rise (>8°C rise in max temperature)
-        if tomorrow["max_temp"] > today["max_temp"] + 8:
+        else:
             notifications.append({
-                "message": f"Temperature surge alert: {int(tomorrow['max_temp'] - today['max_temp'])}°C warmer tomorrow compared to today.",
+                "message": f"Temperature surge alert: {int(tomorrow.max_temp - today.max_temp)}°C warmer tomorrow compared to today.",
                 "pattern_type": "temp_surge",
-                "rise_amount": tomorrow["max_temp"] - today["max_temp"],
+                "rise_amount": tomorrow.max_temp - today.max_temp,
                 "icon": "temperature-rise"
             })
-            break  # Only report the first occurrence
     
     return notifications
 
-def get_weekend_forecast(daily_forecasts: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+def get_weekend_forecast(daily_forecasts: List[DaySummary]) -> Optional[Dict[str, Any]]:
     """
     Generate a weekend weather outlook notification
     
@@ -911,8 +1159,8 @@ def get_weekend_forecast(daily_forecasts: List[Dict[str, Any]]) -> Optional[Dict
         return None
     
     # Determine overall weekend weather
-    will_rain_weekend = any(day["will_rain"] for day in weekend_days)
-    avg_temp = sum(day["avg_temp"] for day in weekend_days) / len(weekend_days)
+    will_rain_weekend = any(day.will_rain for day in weekend_days)
+    avg_temp = sum(day.avg_temp for day in weekend_days) / len(weekend_days)
     
     # Categorize the weekend
     if will_rain_weekend:
@@ -941,46 +1189,45 @@ def get_weekend_forecast(daily_forecasts: List[Dict[str, Any]]) -> Optional[Dict
         "icon": icon
     }
 
+# Notification icons by activity type, warning type and seasonal event name
+_ACTIVITY_ICONS = {
+    "outdoor_painting": "paint-brush",
+    "gardening": "leaf",
+    "hiking": "hiking",
+    "beach_day": "umbrella-beach",
+    "laundry_drying": "tshirt",
+    "cycling": "bicycle",
+    "stargazing": "stars",
+    "marathon_training": "running"
+}
+_WARNING_ICONS = {
+    "heat_wave": "temperature-high",
+    "cold_snap": "temperature-low",
+    "dry_spell": "drought",
+    "heavy_rain": "cloud-showers-heavy",
+    "high_wind": "wind",
+    "air_quality": "smog",
+    "high_uv": "sun"
+}
+_SEASONAL_ICONS = {
+    "Spring Equinox": "seedling",
+    "Summer Solstice": "sun",
+    "Fall Equinox": "leaf",
+    "Winter Solstice": "snowflake",
+    "Earth Day": "globe-americas"
+}
+
 def get_activity_icon(activity_type: str) -> str:
     """Get appropriate icon for activity notification"""
-    icons = {
-        "outdoor_painting": "paint-brush",
-        "gardening": "leaf",
-        "hiking": "hiking",
-        "beach_day": "umbrella-beach",
-        "laundry_drying": "tshirt",
-        "cycling": "bicycle",
-        "stargazing": "stars",
-        "marathon_training": "running"
-    }
-    return icons.get(activity_type, "calendar-check")
+    return _ACTIVITY_ICONS.get(activity_type, "calendar-check")
 
 def get_warning_icon(warning_type: str) -> str:
     """Get appropriate icon for warning notification"""
-    icons = {
-        "heat_wave": "temperature-high",
-        "cold_snap": "temperature-low",
-        "dry_spell": "drought",
-        "heavy_rain": "cloud-showers-heavy",
-        "high_wind": "wind",
-        "air_quality": "smog",
-        "high_uv": "sun"
-    }
-    return icons.get(warning_type, "exclamation-triangle")
+    return _WARNING_ICONS.get(warning_type, "exclamation-triangle")
 
 def get_seasonal_icon(event_name: str) -> str:
     """Get appropriate icon for seasonal notification"""
-    if event_name is None:
-        return "calendar-day"
-        
-    icons = {
-        "Spring Equinox": "seedling",
-        "Summer Solstice": "sun",
-        "Fall Equinox": "leaf",
-        "Winter Solstice": "snowflake",
-        "Earth Day": "globe-americas"
-    }
-    return icons.get(event_name, "calendar-day")
+    return _SEASONAL_ICONS.get(event_name, "calendar-day")
 
 def get_user_preferences(user_id: str = None) -> Dict[str, Any]:
     """
@@ -48,7 +48,7 @@ def get_current_weather(city):
         
         if not api_key:
             logger.warning("OpenWeather API key not configured. Using simulated data.")
-            return generate_simulated_weather(city)
+            return _simulated(generate_simulated_weather(city))
         
         # Make request to OpenWeatherMap API
         url = f"{WEATHER_API_BASE_URL}/weather?q={city}&units=metric&appid={api_key}"
@@ -61,11 +61,11 @@ def get_current_weather(city):
         else:
             logger.error(f"Error fetching weather data: {response.status_code}, {response.text}")
             # Fall back to simulated data
-            return generate_simulated_weather(city)
+            return _simulated(generate_simulated_weather(city))
             
     except Exception as e:
         logger.error(f"Exception fetching weather data: {e}")
-        return generate_simulated_weather(city)
+        return _simulated(generate_simulated_weather(city))
 
 def get_weather_forecast(city):
     """
@@ -84,7 +84,7 @@ def get_weather_forecast(city):
         
         if not api_key:
             logger.warning("OpenWeather API key not configured. Using simulated data.")
-            return generate_simulated_forecast(city)
+            return _simulated(generate_simulated_forecast(city))
         
         # Make request to OpenWeatherMap API
         url = f"{WEATHER_API_BASE_URL}/forecast?q={city}&units=metric&appid={api_key}"
@@ -97,11 +97,11 @@ def get_weather_forecast(city):
         else:
             logger.error(f"Error fetching forecast data: {response.status_code}, {response.text}")
             # Fall back to simulated data
-            return generate_simulated_forecast(city)
+            return _simulated(generate_simulated_forecast(city))
             
     except Exception as e:
         logger.error(f"Exception fetching forecast data: {e}")
-        return generate_simulated_forecast(city)
+        return _simulated(generate_simulated_forecast(city))
 
 def get_weather_history(city):
     """
@@ -160,7 +160,7 @@ def get_weather_history(city):
     except Exception as e:
         logger.error(f"Exception getting historical weather data: {e}")
         # Return basic simulated data if there's an error
-        return {
+        return _simulated({
             "city": city,
             "temperature": {
                 "labels": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
@@ -170,7 +170,27 @@ def get_weather_history(city):
                 "labels": ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
                 "values": [65, 55, 60, 45, 70, 65, 45, 60, 75, 80, 75, 70]
             }
-        }
+        })
+
+class SimulatedData(dict):
+    """
+    Weather data simulated because the API was unavailable
+    
+    Behaves and serializes like a plain dict, so the marker never reaches API
+    responses; callers use it to avoid caching fallback data.
+    """
+
+def is_simulated(data):
+    """
+    Check whether weather data was simulated because the API was unavailable
+    
+    Args:
+        data (dict): Weather, forecast or historical data
+        
+    Returns:
+        bool: True if the data is a simulated fallback
+    """
+    return isinstance(data, SimulatedData)
 
 def get_global_weather_data():
     """
@@ -311,6 +331,10 @@ def get_weather_aqi_correlation():
 
 # Helper functions for generating simulated data
 
+def _simulated(data):
+    """Mark simulated data returned in place of an API response"""
+    return SimulatedData(data)
+
 def generate_simulated_weather(city):
     """Generate simulated weather data for a city"""
     # Weather conditions based on season
@@ -4,9 +4,12 @@ import json
 import time
 import random  # Needed for forecast randomization
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 from flask import Flask, jsonify, request, send_from_directory, flash, redirect, url_for, session
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import numpy as np
 import pandas as pd
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
@@ -25,8 +28,27 @@ from backend.db_config import db, init_db
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider for API responses that keeps insertion order and serializes NumPy values
+    and read-only mappings
+    """
+    # Key sorting costs a full sort of every nested dict and the frontend doesn't rely on it
+    sort_keys = False
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, np.generic):
+            return o.item()
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
 # Create the Flask app
 app = Flask(__name__, static_folder='frontend/static', template_folder='frontend')
+app.json = FastJSONProvider(app)
 
 # Enable CORS for all routes
 CORS(app, resources={r"/*": {"origins": "*"}})
@@ -649,6 +671,7 @@ def api_info():
             "/api/health-alerts/cold-flu/<city>",
             "/api/health-alerts/air-quality/<city>",
             "/api/health-alerts/comprehensive/<city>",
+            "/api/health-alerts/all/<city>",
             "/api/travel-forecast/commute-impact?city=<city>&start_time=<time>&end_time=<time>&route_type=<type>",
             "/api/travel-forecast/route-options?city=<city>&from=<location>&to=<location>&departure_time=<time>",
             "/api/travel-forecast/weekly?city=<city>&days=<number>",
@@ -656,7 +679,9 @@ def api_info():
             "/api/agriculture/plant-care?city=<city>&plant_type=<plant_type>",
             "/api/agriculture/growing-season?city=<city>",
             "/api/agriculture/soil-moisture?city=<city>&soil_type=<soil_type>",
-            "/api/agriculture/pest-risk?city=<city>"
+            "/api/agriculture/pest-risk?city=<city>",
+            "/api/agriculture/pest-risk/batch?cities=<city>,<city>",
+            "/api/agriculture/all?city=<city>&soil_type=<soil_type>&plant_type=<plant_type>"
         ]
     })
 
@@ -2350,6 +2375,77 @@ def agriculture_pest_risk():
             'message': str(e)
         }), 500
 
+@app.route('/api/agriculture/pest-risk/batch')
+def agriculture_pest_risk_batch():
+    """
+    API endpoint to get pest and disease risk forecasts for several cities
+    """
+    try:
+        # Get parameters
+        cities = [city.strip() for city in request.args.get('cities', '').split(',') if city.strip()]
+        
+        # Validate parameters
+        if not cities:
+            return jsonify({
+                'status': 'error',
+                'message': 'Cities parameter is required'
+            }), 400
+            
+        # Get pest risk forecasts
+        from backend import agriculture_utils
+        pest_risk_data = agriculture_utils.get_pest_risk_forecast_batch(list(dict.fromkeys(cities)))
+        
+        return jsonify({
+            'status': 'success',
+            'data': pest_risk_data,
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Error in agriculture/pest-risk/batch API: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/agriculture/all')
+def agriculture_all():
+    """
+    API endpoint to get all agriculture panels for a specific city in a single request
+    """
+    try:
+        # Get parameters
+        city = request.args.get('city', '')
+        soil_type = request.args.get('soil_type', 'loamy')
+        plant_type = request.args.get('plant_type', 'tomato')
+        
+        # Validate parameters
+        if not city:
+            return jsonify({
+                'status': 'error',
+                'message': 'City parameter is required'
+            }), 400
+            
+        # Validate soil type
+        valid_soil_types = ['sandy', 'loamy', 'clay', 'silty']
+        if soil_type not in valid_soil_types:
+            soil_type = 'loamy'  # Default to loamy if invalid
+            
+        # Get all agriculture data
+        from backend import agriculture_utils
+        agriculture_data = agriculture_utils.get_all_agriculture_info(city, soil_type, plant_type)
+        
+        return jsonify({
+            'status': 'success',
+            'data': agriculture_data,
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Error in agriculture/all API: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 # Travel forecast API endpoints
 @app.route('/api/travel-forecast/commute-impact')
 def travel_forecast_commute_impact():
@@ -2656,5 +2752,43 @@ def health_alerts_comprehensive(city):
             'message': str(e)
         }), 500
 
+@app.route('/api/health-alerts/all/<city>')
+def health_alerts_all(city):
+    """
+    API endpoint to get pollen, UV, cold/flu and air quality reports in one call
+    """
+    try:
+        if not city:
+            return jsonify({
+                'status': 'error',
+                'message': 'City parameter is required'
+            }), 400
+            
+        # Get health profile from query parameters if provided
+        health_concerns = request.args.get('health_concerns', '').split(',') if request.args.get('health_concerns') else []
+        activity_level = request.args.get('activity_level', 'moderate')
+        age_group = request.args.get('age_group', 'adult')
+        
+        health_profile = {
+            'health_concerns': health_concerns,
+            'activity_level': activity_level,
+            'age_group': age_group
+        }
+        
+        # Get all health reports from a single weather and air quality fetch
+        alerts_data = health_alerts_utils.get_all_health_alerts(city, health_profile=health_profile)
+        
+        return jsonify({
+            'status': 'success',
+            'data': alerts_data,
+            'timestamp': datetime.now().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Error in health-alerts/all API: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=6000, debug=True)
\ No newline at end of file